@@ -0,0 +1,57 @@
+"""
+Test Data Generator - value batches for a compiled plan (sharding, uniqueness, UUID affixes)
+"""
+
+from itertools import chain, islice
+
+from generators import SHARD_ROWS, GeneratorPlan, apply_uuid_affixes_batch, generate_shard
+from parallel import iter_shards
+from unique import iter_candidates, take_unique
+
+def iter_batches(plan: GeneratorPlan, count: int, prefix: str = None, suffix: str = None,
+                 seed: int = None, stream: int = 0, unique: bool = False, workers: int = None):
+    """Generate count values from a plan as shards of up to SHARD_ROWS values, in order
+
+    With unique, candidate shards are drawn until count distinct values have
+    been kept, so batches may be shorter than SHARD_ROWS.
+    """
+    shards = iter_candidates(plan, seed, stream) if unique else iter_shards(plan, count, seed, stream, workers)
+    # Apply prefix/suffix by overwriting the ends of each UUID, keeping its layout
+    if plan.type_id == "uuid" and (prefix or suffix):
+        shards = (apply_uuid_affixes_batch(batch, prefix, suffix) for batch in shards)
+    yield from take_unique(shards, count) if unique else shards
+
+def window(plan: GeneratorPlan, count: int, offset: int, limit: int, prefix: str = None, suffix: str = None,
+           seed: int = None, stream: int = 0, unique: bool = False) -> list:
+    """Values offset to offset + limit of the count values iter_batches would give
+
+    Seeded shards are independent, so only the shards overlapping the window
+    are generated. Unique values depend on every value before them, so those
+    are generated from the start.
+    """
+    stop = min(offset + limit, count)
+    if offset >= stop:
+        return []
+    if unique:
+        values = chain.from_iterable(iter_batches(plan, stop, prefix, suffix, seed, stream, unique))
+        return list(islice(values, offset, stop))
+    
+    values = []
+    for shard in range(offset // SHARD_ROWS, (stop - 1) // SHARD_ROWS + 1):
+        batch = generate_shard(plan, shard, count, seed, stream)
+        if plan.type_id == "uuid" and (prefix or suffix):
+            batch = apply_uuid_affixes_batch(batch, prefix, suffix)
+        start = shard * SHARD_ROWS
+        values += batch[max(offset - start, 0):stop - start]
+    return values
+
+def rebatch(batches, size: int):
+    """Regroup batches of uneven length into lists of exactly size (last may be shorter)"""
+    pending = []
+    for batch in batches:
+        pending.extend(batch)
+        while len(pending) >= size:
+            yield pending[:size]
+            del pending[:size]
+    if pending:
+        yield pending
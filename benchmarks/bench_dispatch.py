@@ -0,0 +1,138 @@
+"""
+Micro-benchmark: per-row dispatch overhead of the original if/elif dispatch vs a compiled plan
+
+The baseline is a copy of generate_by_type as it was before plans: the if/elif
+chain over type ids, re-reading options for every value. It calls the current
+generator functions, so the difference to plan.one is the dispatch alone.
+generate_by_type now compiles a plan per call, and is shown for reference.
+
+Run from the repository root:
+    python benchmarks/bench_dispatch.py --count 200000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import generators as g
+from generators import compile_generator, generate_by_type
+
+CASES = [
+    ("uuid", {}),
+    ("hex_color", {"uppercase": False}),
+    ("ip", {"version": "ipv4"}),
+    ("job", {"seniority": "senior"}),
+    ("password", {"length": 16, "special": True}),
+]
+
+def baseline_by_type(type_id: str, options: dict) -> str:
+    """generate_by_type before compiled plans, calling today's generators"""
+    options = {k: v for k, v in options.items() if v is not None}
+    
+    if type_id == "uuid":
+        return g.generate_uuid(version=options.get("version", "v4"))
+    elif type_id == "password":
+        return g.generate_password(
+            uppercase=options.get("uppercase", True),
+            lowercase=options.get("lowercase", True),
+            numbers=options.get("numbers", True),
+            special=options.get("special", False),
+            length=options.get("length", 16)
+        )
+    elif type_id == "username":
+        return g.generate_username(prefix=options.get("prefix"), style=options.get("style", "name_year"))
+    elif type_id == "imei":
+        return g.generate_imei(brand=options.get("brand", "Generic"), valid_checksum=options.get("valid_checksum", True))
+    elif type_id == "mac_address":
+        return g.generate_mac_address(uppercase=options.get("uppercase", True), separator=options.get("separator", ":"))
+    elif type_id == "name":
+        return g.generate_name(starts_with=options.get("starts_with"), ends_with=options.get("ends_with"))
+    elif type_id == "email":
+        return g.generate_email(domain=options.get("domain"), extension=options.get("extension"))
+    elif type_id == "phone":
+        return g.generate_phone(country=options.get("country", "US"), include_code=options.get("include_code", True))
+    elif type_id == "address":
+        return g.generate_address(country=options.get("country", "US"))
+    elif type_id == "country":
+        return g.generate_country(starts_with=options.get("starts_with"))
+    elif type_id == "city":
+        return g.generate_city(country=options.get("country"))
+    elif type_id == "zipcode":
+        return g.generate_zipcode(
+            country=options.get("country"),
+            zip_from=options.get("from", 10000),
+            zip_to=options.get("to", 99999)
+        )
+    elif type_id == "credit_card":
+        return g.generate_credit_card(
+            card_type=options.get("card_type", "Random"),
+            valid=options.get("valid", "valid") == "valid"
+        )
+    elif type_id == "ssn":
+        return g.generate_ssn(country=options.get("country", "US"))
+    elif type_id == "barcode":
+        return g.generate_barcode(numeric_only=options.get("numeric_only", True), length=options.get("length", 13))
+    elif type_id == "isbn":
+        return g.generate_isbn(format=options.get("format", "isbn13"))
+    elif type_id == "ip":
+        return g.generate_ip(version=options.get("version", "ipv4"))
+    elif type_id == "url":
+        return g.generate_url(
+            domain=options.get("domain"),
+            extension=options.get("extension", "com"),
+            protocol=options.get("protocol", "https")
+        )
+    elif type_id == "datetime":
+        return g.generate_datetime(
+            include_date=options.get("include_date", True),
+            include_time=options.get("include_time", True),
+            include_timezone=options.get("include_timezone", False)
+        )
+    elif type_id == "sentence":
+        return g.generate_sentence(grammatically_valid=options.get("grammatically_valid", True))
+    elif type_id == "paragraph":
+        return g.generate_paragraph(min_sentences=options.get("min_sentences", 3), max_sentences=options.get("max_sentences", 6))
+    elif type_id == "hex_color":
+        return g.generate_hex_color(uppercase=options.get("uppercase", True))
+    elif type_id == "rgb_color":
+        return g.generate_rgb_color(min_value=options.get("min_value", 0), max_value=options.get("max_value", 255))
+    elif type_id == "company":
+        return g.generate_company(starts_with=options.get("starts_with"))
+    elif type_id == "job":
+        return g.generate_job(seniority=options.get("seniority", "any"))
+    elif type_id == "street":
+        return g.generate_street()
+    elif type_id == "text":
+        return g.generate_text(length=options.get("length", 5))
+    return ""
+
+def per_row_ns(func, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+    return (time.perf_counter() - start) / count * 1e9
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=200000)
+    args = parser.parse_args()
+    
+    print(f"{'type':<12} {'if/elif ns/row':>15} {'plan.one ns/row':>16} {'plan.batch ns/row':>18} "
+          f"{'dispatch overhead':>18} {'by_type ns/row':>15}")
+    for type_id, options in CASES:
+        plan = compile_generator(type_id, options)
+        before = per_row_ns(lambda: baseline_by_type(type_id, options), args.count)
+        after = per_row_ns(plan.one, args.count)
+        by_type = per_row_ns(lambda: generate_by_type(type_id, options), args.count)
+        
+        start = time.perf_counter()
+        plan.batch(args.count)
+        batch = (time.perf_counter() - start) / args.count * 1e9
+        
+        print(f"{type_id:<12} {before:>15.0f} {after:>16.0f} {batch:>18.0f} {before - after:>17.0f}ns {by_type:>15.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark: JSON response encoding, generic json.dumps vs per-batch json_items
+
+Run from the repository root:
+    python benchmarks/bench_json.py --type name --count 1000000
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import encoders
+from batches import iter_batches
+from generators import compile_generator
+
+def generic(batches: list) -> bytes:
+    # What JSONResponse does with the collected list
+    data = [value for batch in batches for value in batch]
+    return json.dumps({"success": True, "data": data}, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def incremental(batches: list) -> bytes:
+    return encoders.json_body({"success": True}, [encoders.json_items(batch) for batch in batches])
+
+def best_of(func, batches: list, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(batches)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--type", default="name")
+    parser.add_argument("--count", type=int, default=1000000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    batches = list(iter_batches(compile_generator(args.type, {}), args.count, seed=1))
+    assert json.loads(generic(batches)) == json.loads(incremental(batches))
+    orjson = encoders.orjson
+
+    print(f"{args.count} x {args.type}, best of {args.repeat}")
+    print(f"{'encoder':>22} {'seconds':>9} {'MB/sec':>9}")
+    size = len(generic(batches)) / 1e6
+    runs = [("json.dumps", generic, orjson), ("json_items (fallback)", incremental, None)]
+    if orjson is not None:
+        runs.append(("json_items (orjson)", incremental, orjson))
+    for name, func, module in runs:
+        encoders.orjson = module
+        elapsed = best_of(func, batches, args.repeat)
+        print(f"{name:>22} {elapsed:>9.3f} {size / elapsed:>9.0f}")
+    encoders.orjson = orjson
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmark: sharded generation throughput across 1/2/4/8 worker processes
+
+Run from the repository root:
+    python benchmarks/bench_parallel.py --type imei --count 2000000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parallel
+from generators import SHARD_ROWS, compile_generator
+
+def run(plan, count: int, workers: int) -> float:
+    start = time.perf_counter()
+    rows = sum(len(shard) for shard in parallel.iter_shards(plan, count, seed=1, workers=workers))
+    assert rows == count
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--type", default="imei")
+    parser.add_argument("--count", type=int, default=2000000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+    
+    plan = compile_generator(args.type, {})
+    parallel.PARALLEL_THRESHOLD = 0
+    print(f"{args.count} x {args.type} on {os.cpu_count()} CPUs")
+    print(f"{'workers':>7} {'seconds':>9} {'rows/sec':>12} {'speedup':>8}")
+    baseline = None
+    for workers in args.workers:
+        parallel.shutdown_pool()
+        if workers > 1:
+            # Start every worker outside the timed run: two shards per worker, so
+            # each process is spawned and has imported the generators
+            list(parallel.iter_shards(plan, 2 * workers * SHARD_ROWS, seed=1, workers=workers))
+        elapsed = run(plan, args.count, workers)
+        baseline = baseline or elapsed
+        print(f"{workers:>7} {elapsed:>9.2f} {args.count / elapsed:>12,.0f} {baseline / elapsed:>7.2f}x")
+    parallel.shutdown_pool()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark: password throughput, previous non-CSPRNG paths vs the CSPRNG batch path
+
+Run from the repository root:
+    python benchmarks/bench_passwords.py --count 200000 --length 16 64
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from generators import SHARD_ROWS, _chacha20, _strings, generate_password_batch, password_charset
+
+def per_char_choice(count: int, length: int) -> list:
+    # The previous single-value path: random.choice per character, not a CSPRNG
+    chars = password_charset(special=True)
+    return ["".join([random.choice(chars) for _ in range(length)]) for _ in range(count)]
+
+def pcg64_batch(count: int, length: int) -> list:
+    # The previous batch path: NumPy's PCG64, fast but not a CSPRNG
+    rng = np.random.default_rng()
+    table = np.frombuffer(password_charset(special=True).encode(), dtype=np.uint8)
+    values = []
+    for start in range(0, count, SHARD_ROWS):
+        n = min(SHARD_ROWS, count - start)
+        values += _strings(table[rng.integers(0, table.size, size=(n, length))])
+    return values
+
+def batch(count: int, length: int, require_each: bool = False) -> list:
+    # Shard-sized batches, as the server generates them
+    values = []
+    for start in range(0, count, SHARD_ROWS):
+        n = min(SHARD_ROWS, count - start)
+        values += generate_password_batch(n, special=True, length=length, require_each=require_each)
+    return values
+
+def rate(func, count: int, length: int) -> float:
+    start = time.perf_counter()
+    values = func(count, length)
+    elapsed = time.perf_counter() - start
+    assert len(values) == count and all(len(value) == length for value in values)
+    return count / elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=200000)
+    parser.add_argument("--length", type=int, nargs="+", default=[16, 64])
+    args = parser.parse_args()
+
+    runs = [
+        ("random.choice per char", per_char_choice),
+        ("PCG64 batch", pcg64_batch),
+        ("CSPRNG batch", batch),
+        ("CSPRNG batch, each class", lambda count, length: batch(count, length, True)),
+    ]
+    source = "os.urandom" if _chacha20() is None else "ChaCha20 keyed from os.urandom"
+    print(f"{args.count} passwords per run, CSPRNG: {source}")
+    print(f"{'path':>30} {'length':>6} {'passwords/sec':>14}")
+    for length in args.length:
+        for name, func in runs:
+            print(f"{name:>30} {length:>6} {rate(func, args.count, length):>14,.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""
+Benchmark suite: every generator, the /api/generate HTTP path and peak RSS
+
+Three levels are measured:
+  generators  ops/sec of plan.one and plan.batch for every type in DATA_TYPES
+              with its defaults and each select/radio/checkbox variation
+  http        latency and rows/sec of POST /api/generate through an in-process
+              ASGI client at counts from 1 to 1M
+  rss         peak resident memory above the pre-request level, per HTTP case
+
+Results are written as JSON. With --baseline, each metric is compared against
+a previous results file and the run exits non-zero if any metric regressed by
+more than --tolerance.
+
+Run from the repository root:
+    python benchmarks/bench_suite.py --output results.json
+    python benchmarks/bench_suite.py --baseline baseline.json --tolerance 0.25
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+import numpy as np
+
+import parallel
+from generators import DATA_TYPES, compile_generator, type_options
+from main import app
+
+# Values used for free-text options, which have no defaults to enumerate
+TEXT_SAMPLES = {
+    "starts_with": "A",
+    "ends_with": "n",
+    "prefix": "user_",
+    "domain": "example",
+}
+
+# Select options with many values (e.g. country) are sampled, not exhausted
+MAX_VALUES_PER_OPTION = 3
+
+HTTP_TYPES = ["uuid", "name", "email", "address", "password", "credit_card"]
+HTTP_COUNTS = [1, 100, 10000, 100000, 1000000]
+
+# Metrics where a lower value is better; everything else is higher-is-better
+LOWER_IS_BETTER = ("p50_ms", "p99_ms", "peak_rss_mb")
+
+# p99 over a handful of requests is too noisy to gate on; it is reported only
+UNGATED = ("p99_ms",)
+
+# RSS growth below this many MB is allocator noise, not a regression
+RSS_NOISE_MB = 16
+
+def option_cases(data_type: dict) -> list:
+    """Defaults plus one variation per option value, as (label, options) pairs"""
+    options = type_options(data_type["type"])
+    defaults = {option["key"]: option["default"] for option in options if "default" in option}
+    cases = [("default", {})]
+    for option in options:
+        key = option["key"]
+        if option["type"] == "checkbox":
+            values = [not option.get("default", False)]
+        elif option["type"] in ("select", "radio"):
+            values = [value for value, _ in option["values"] if value != defaults.get(key)]
+            values = values[:MAX_VALUES_PER_OPTION]
+        elif option["type"] == "text" and key in TEXT_SAMPLES:
+            values = [TEXT_SAMPLES[key]]
+        else:
+            values = []
+        cases.extend((f"{key}={value}", {key: value}) for value in values)
+    return cases
+
+def ops_per_sec(func, min_time: float) -> float:
+    """Call func repeatedly for at least min_time seconds"""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        func()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return calls / elapsed
+
+def bench_generators(min_time: float, batch_rows: int) -> dict:
+    results = {}
+    for data_type in DATA_TYPES:
+        for label, options in option_cases(data_type):
+            plan = compile_generator(data_type["type"], options)
+            single = ops_per_sec(plan.one, min_time)
+            batch = ops_per_sec(lambda: plan.batch(batch_rows), min_time) * batch_rows
+            key = f"generators/{data_type['type']}/{label}"
+            results[key] = {"single_ops": round(single, 1), "batch_ops": round(batch, 1)}
+            print(f"{key:<55} {single:>14,.0f}/s {batch:>14,.0f}/s")
+    return results
+
+class PeakRSS:
+    """Sample resident memory on a background thread while a block runs"""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+
+    @staticmethod
+    def current() -> int:
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except OSError:
+            # Not Linux: fall back to the lifetime peak (bytes on macOS)
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    def _sample(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self.current())
+            time.sleep(self.interval)
+
+    def __enter__(self):
+        self.start = self.current()
+        self.peak = self.start
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self.current())
+
+    @property
+    def delta_mb(self) -> float:
+        return (self.peak - self.start) / 2**20
+
+async def bench_http(types: list, counts: list, min_requests: int, min_time: float) -> dict:
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=None) as client:
+        for type_id in types:
+            for count in counts:
+                body = {"type": type_id, "count": count}
+                latencies = []
+                peak_rss = 0.0
+                start = time.perf_counter()
+                while len(latencies) < min_requests or time.perf_counter() - start < min_time:
+                    with PeakRSS() as rss:
+                        request_start = time.perf_counter()
+                        response = await client.post("/api/generate", json=body)
+                        latencies.append((time.perf_counter() - request_start) * 1000)
+                    response.raise_for_status()
+                    del response
+                    peak_rss = max(peak_rss, rss.delta_mb)
+                    if count >= 100000 and len(latencies) >= min_requests:
+                        break
+
+                p50 = statistics.median(latencies)
+                p99 = statistics.quantiles(latencies, n=100)[98] if len(latencies) > 1 else latencies[0]
+                key = f"http/{type_id}/{count}"
+                results[key] = {
+                    "p50_ms": round(p50, 3),
+                    "p99_ms": round(p99, 3),
+                    "rows_per_sec": round(count / (p50 / 1000), 1),
+                    "peak_rss_mb": round(peak_rss, 1),
+                }
+                print(f"{key:<30} p50={p50:>10.2f}ms p99={p99:>10.2f}ms "
+                      f"{results[key]['rows_per_sec']:>14,.0f} rows/s rss+{peak_rss:>7.1f}MB")
+    return results
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Metrics that are worse than the baseline by more than tolerance"""
+    regressions = []
+    for key, metrics in results.items():
+        for name, value in metrics.items():
+            before = baseline.get(key, {}).get(name)
+            if not before or name in UNGATED:
+                continue
+            if name in LOWER_IS_BETTER:
+                change = (value - before) / before
+            else:
+                change = (before - value) / before
+            if name == "peak_rss_mb" and value - before < RSS_NOISE_MB:
+                continue
+            if change > tolerance:
+                regressions.append((key, name, before, value, change))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", default="bench_results.json", help="Where to write results JSON")
+    parser.add_argument("--baseline", help="Results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown before failing, e.g. 0.25 = 25%%")
+    parser.add_argument("--levels", nargs="+", choices=["generators", "http"], default=["generators", "http"])
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds to spend on each case")
+    parser.add_argument("--batch-rows", type=int, default=10000)
+    parser.add_argument("--http-types", nargs="+", default=HTTP_TYPES)
+    parser.add_argument("--http-counts", type=int, nargs="+", default=HTTP_COUNTS)
+    parser.add_argument("--http-requests", type=int, default=3, help="Minimum requests per HTTP case")
+    args = parser.parse_args()
+
+    results = {}
+    if "generators" in args.levels:
+        results.update(bench_generators(args.min_time, args.batch_rows))
+    if "http" in args.levels:
+        results.update(asyncio.run(bench_http(args.http_types, args.http_counts, args.http_requests, args.min_time)))
+        parallel.shutdown_pool()
+
+    report = {
+        "meta": {
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {len(results)} cases to {args.output}")
+
+    if not args.baseline:
+        return
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    regressions = compare(results, baseline, args.tolerance)
+    if not regressions:
+        print(f"No regressions beyond {args.tolerance:.0%} against {args.baseline}")
+        return
+
+    print("\n" + "!" * 72)
+    print(f"PERFORMANCE REGRESSION: {len(regressions)} metric(s) worse than {args.baseline} by more than {args.tolerance:.0%}")
+    print("!" * 72)
+    for key, name, before, value, change in regressions:
+        print(f"  {key} {name}: {before:,} -> {value:,} ({change:+.0%} worse)")
+    sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark: loading UUID v4, v7 and ULID primary keys into an indexed SQLite table
+
+Run from the repository root:
+    python benchmarks/bench_uuid_keys.py --count 2000000
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batches import iter_batches
+from generators import compile_generator
+
+def load(path: str, batches: list) -> float:
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE ids (id TEXT PRIMARY KEY) WITHOUT ROWID")
+    start = time.perf_counter()
+    with conn:
+        for batch in batches:
+            conn.executemany("INSERT INTO ids VALUES (?)", ((value,) for value in batch))
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=2000000)
+    parser.add_argument("--versions", nargs="+", default=["v4", "v7", "ulid"])
+    args = parser.parse_args()
+
+    print(f"{args.count} keys")
+    print(f"{'version':>7} {'generate s':>11} {'insert s':>9} {'rows/sec':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for version in args.versions:
+            plan = compile_generator("uuid", {"version": version})
+            start = time.perf_counter()
+            batches = list(iter_batches(plan, args.count, workers=1))
+            generated = time.perf_counter() - start
+            elapsed = load(os.path.join(tmp, f"{version}.db"), batches)
+            print(f"{version:>7} {generated:>11.2f} {elapsed:>9.2f} {args.count / elapsed:>12,.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Startup check: import-time budget (python -X importtime) and time to first response
+
+Fails (exit 1) when:
+- importing main takes longer than --import-budget ms
+- the repository's own modules take longer than --own-budget ms of that
+- cli.py pulls in the web stack (FastAPI, Starlette, Pydantic or uvicorn)
+- a freshly started server takes longer than --ttfr-target seconds to answer
+  its first POST /api/generate
+
+Import times are the best of --runs fresh interpreters. Time to first
+response is the median of --runs server starts, measured from process spawn.
+
+Run from the repository root:
+    python benchmarks/check_startup.py
+    python benchmarks/check_startup.py --import-budget 800 --own-budget 40 --ttfr-target 1.0
+"""
+
+import argparse
+import glob
+import http.client
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+OWN_MODULES = {os.path.splitext(os.path.basename(path))[0] for path in glob.glob(os.path.join(ROOT, "*.py"))}
+
+WEB_PACKAGES = ("fastapi", "starlette", "pydantic", "uvicorn")
+
+FIRST_REQUEST = {"type": "name", "count": 10}
+
+def import_times(module: str) -> dict:
+    """{module: (self us, cumulative us)} from one fresh interpreter importing module"""
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+def best_import(module: str, runs: int) -> dict:
+    """The run with the lowest cumulative time for module, so one slow run does not fail the check"""
+    return min((import_times(module) for _ in range(runs)), key=lambda times: times[module][1])
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def post_first_request(port: int, timeout: float) -> int:
+    # http.client rather than httpx: a new httpx client per poll costs ~50 ms of SSL setup
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=timeout)
+    try:
+        conn.request("POST", "/api/generate", json.dumps(FIRST_REQUEST), {"Content-Type": "application/json"})
+        response = conn.getresponse()
+        response.read()
+        return response.status
+    finally:
+        conn.close()
+
+def time_to_first_response(timeout: float) -> float:
+    """Seconds from spawning uvicorn to the first successful POST /api/generate"""
+    port = free_port()
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-W", "ignore", "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT,
+    )
+    try:
+        while True:
+            try:
+                if post_first_request(port, timeout) == 200:
+                    return time.perf_counter() - start
+            except OSError:
+                pass
+            if server.poll() is not None:
+                raise RuntimeError(f"server exited with code {server.returncode}")
+            if time.perf_counter() - start > timeout:
+                raise RuntimeError(f"no response within {timeout}s")
+            time.sleep(0.005)
+    finally:
+        server.terminate()
+        server.wait()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--import-budget", type=float, default=1000, help="Max ms to import main")
+    parser.add_argument("--own-budget", type=float, default=60, help="Max ms of that spent in this repository's modules")
+    parser.add_argument("--ttfr-target", type=float, default=1.5, help="Max seconds from process start to first response")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="Slowest modules to list")
+    args = parser.parse_args()
+    failures = []
+
+    times = best_import("main", args.runs)
+    total_ms = times["main"][1] / 1000
+    own_ms = sum(self_us for name, (self_us, _) in times.items() if name in OWN_MODULES) / 1000
+    print(f"import main: {total_ms:.0f} ms (budget {args.import_budget:.0f}), own modules {own_ms:.1f} ms (budget {args.own_budget:.0f})")
+    for name, (self_us, cumulative_us) in sorted(times.items(), key=lambda item: -item[1][0])[:args.top]:
+        print(f"    {self_us / 1000:8.1f} ms self {cumulative_us / 1000:8.1f} ms cumulative  {name}")
+    if total_ms > args.import_budget:
+        failures.append(f"import main took {total_ms:.0f} ms, budget {args.import_budget:.0f} ms")
+    if own_ms > args.own_budget:
+        failures.append(f"own modules took {own_ms:.1f} ms, budget {args.own_budget:.0f} ms")
+
+    cli_times = best_import("cli", args.runs)
+    web = sorted(name for name in cli_times if name.split(".")[0] in WEB_PACKAGES)
+    print(f"import cli: {cli_times['cli'][1] / 1000:.0f} ms, web modules: {len(web)}")
+    if web:
+        failures.append(f"cli imports the web stack: {', '.join(web[:5])}")
+
+    ttfr = [time_to_first_response(timeout=max(args.ttfr_target * 5, 10)) for _ in range(args.runs)]
+    print(f"time to first response: median {statistics.median(ttfr):.3f} s, max {max(ttfr):.3f} s (target {args.ttfr_target} s)")
+    if statistics.median(ttfr) > args.ttfr_target:
+        failures.append(f"time to first response {statistics.median(ttfr):.3f} s, target {args.ttfr_target} s")
+
+    if failures:
+        print("STARTUP REGRESSION:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("Startup within budget")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Load test: p99 latency of GET /api/types while a large generation is in flight
+
+Runs the app in-process through httpx's ASGI transport, so any time the event
+loop spends blocked on generation shows up directly in the probe latencies.
+
+Run from the repository root:
+    python benchmarks/load_p99.py --type password --count 200000
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+from main import app
+
+async def probe(client: httpx.AsyncClient, until: asyncio.Event, interval: float) -> list:
+    """Hit /api/types every interval seconds until the event is set"""
+    latencies = []
+    while not until.is_set():
+        start = time.perf_counter()
+        response = await client.get("/api/types")
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(interval)
+    return latencies
+
+def summary(label: str, latencies: list):
+    p99 = statistics.quantiles(latencies, n=100)[98] if len(latencies) > 1 else latencies[0]
+    print(f"{label:<10} probes={len(latencies):>5}  p50={statistics.median(latencies):7.2f}ms  p99={p99:7.2f}ms  max={max(latencies):7.2f}ms")
+
+async def run(args):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=None) as client:
+        idle_done = asyncio.Event()
+        idle = asyncio.create_task(probe(client, idle_done, args.interval))
+        await asyncio.sleep(1)
+        idle_done.set()
+        summary("idle", await idle)
+        
+        loaded_done = asyncio.Event()
+        loaded = asyncio.create_task(probe(client, loaded_done, args.interval))
+        start = time.perf_counter()
+        jobs = [client.post("/api/generate", json={"type": args.type, "count": args.count}) for _ in range(args.jobs)]
+        for response in await asyncio.gather(*jobs):
+            response.raise_for_status()
+        elapsed = time.perf_counter() - start
+        loaded_done.set()
+        summary("loaded", await loaded)
+        print(f"{args.jobs} x {args.count} {args.type} generated in {elapsed:.2f}s")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--type", default="password")
+    parser.add_argument("--count", type=int, default=200000)
+    parser.add_argument("--jobs", type=int, default=1)
+    parser.add_argument("--interval", type=float, default=0.01)
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
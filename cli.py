@@ -0,0 +1,249 @@
+"""
+Test Data Generator - command-line bulk generation straight to a file or stdout
+
+Uses the same generators and option schema as the API, without starting a
+server or importing FastAPI. Shards are generated and encoded on every core
+and written in order:
+
+    python cli.py uuid --count 1000000 --output ids.csv
+    python cli.py password length=32 special=true --count 5000000 --format ndjson
+    python cli.py --schema users.json --count 100000000 --output users.csv.gz
+    python cli.py --list
+
+A schema file has the fields of a /api/records request:
+    {"fields": {"id": {"type": "uuid", "version": "v7"}, "name": {"type": "name"}}}
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+from collections import deque
+
+import parallel
+from batches import iter_batches, rebatch
+from encoders import csv_line, encode_columns, encode_values
+from generators import (DATA_TYPES, DATA_TYPES_BY_ID, SHARD_ROWS, apply_uuid_affixes_batch, compile_generator,
+                        generate_shard, reserve_ticks, shard_size, type_options)
+from unique import check_value_space
+
+FORMATS = ("csv", "ndjson", "jsonl")
+
+# Per-field keys that are not generator options
+FIELD_KEYS = ("type", "prefix", "suffix", "unique")
+
+# Output file buffer; each write is already a whole encoded shard
+WRITE_BUFFER_BYTES = 1 << 20
+
+GZIP_LEVEL = 6
+
+# Seconds between progress line updates
+PROGRESS_INTERVAL = 0.5
+
+TRUE_VALUES = ("1", "true", "yes", "on")
+FALSE_VALUES = ("0", "false", "no", "off")
+
+def parse_option(type_id: str, pair: str) -> tuple:
+    """key=value from the command line, as the JSON type the option schema expects"""
+    key, sep, value = pair.partition("=")
+    if not sep:
+        raise ValueError(f"Expected key=value, got '{pair}'")
+    meta = next((o for o in type_options(type_id) if o["key"] == key), None)
+    if meta is None and key not in FIELD_KEYS:
+        raise ValueError(f"Unknown option for {type_id}: {key}")
+    if (meta and meta["type"] == "checkbox") or key == "unique":
+        if value.lower() not in TRUE_VALUES + FALSE_VALUES:
+            raise ValueError(f"Option '{key}' must be true or false")
+        return key, value.lower() in TRUE_VALUES
+    return key, value
+
+def compile_field(name: str, spec: dict, count: int) -> tuple:
+    """(plan, prefix, suffix, unique) for one field spec of type plus options"""
+    type_id = spec.get("type")
+    if type_id not in DATA_TYPES_BY_ID:
+        raise ValueError(f"Unknown type for field '{name}': {type_id}")
+    options = {k: v for k, v in spec.items() if k not in FIELD_KEYS and v is not None}
+    # For username, prefix is a generator option rather than an affix
+    if type_id == "username" and spec.get("prefix"):
+        options["prefix"] = spec["prefix"]
+    try:
+        plan = compile_generator(type_id, options)
+        if spec.get("unique"):
+            check_value_space(plan, count)
+    except ValueError as e:
+        raise ValueError(f"Field '{name}': {e}")
+    return plan, spec.get("prefix"), spec.get("suffix"), bool(spec.get("unique"))
+
+def encode_shard(fields: list, names: list, shard: int, count: int, seed: int, fmt: str,
+                 records: bool, gzip_level: int = None) -> tuple:
+    """Generate and encode one shard of every field; returns (rows, bytes)
+
+    Field i draws from seed substream i, so seeded output matches /api/records.
+    """
+    columns = []
+    for stream, (plan, prefix, suffix, _) in enumerate(fields):
+        batch = generate_shard(plan, shard, count, seed, stream)
+        if plan.type_id == "uuid" and (prefix or suffix):
+            batch = apply_uuid_affixes_batch(batch, prefix, suffix)
+        columns.append(batch)
+    return len(columns[0]), encode_chunk(columns, names, fmt, records, gzip_level)
+
+def encode_chunk(columns: list, names: list, fmt: str, records: bool, gzip_level: int = None) -> bytes:
+    text = encode_columns(columns, names, fmt) if records else encode_values(columns[0], fmt)
+    data = text.encode("utf-8")
+    # Each chunk is its own gzip member; concatenated members are one valid .gz file
+    return gzip.compress(data, gzip_level) if gzip_level is not None else data
+
+def iter_encoded(fields: list, names: list, count: int, seed: int, fmt: str, records: bool,
+                 workers: int, gzip_level: int = None):
+    """Yield (rows, bytes) per shard in order, encoded on the worker pool when there is one"""
+    if any(unique for _, _, _, unique in fields):
+        # Distinct values are drawn one candidate shard after another, so this stays in process
+        columns = [
+            rebatch(iter_batches(plan, count, prefix, suffix, seed, stream, unique, workers), SHARD_ROWS)
+            for stream, (plan, prefix, suffix, unique) in enumerate(fields)
+        ]
+        for chunk in zip(*columns):
+            yield len(chunk[0]), encode_chunk(list(chunk), names, fmt, records, gzip_level)
+        return
+
+    shards = range(-(-count // SHARD_ROWS))
+    args = (count, seed, fmt, records, gzip_level)
+    if workers <= 1 or len(shards) <= 1:
+        for shard in shards:
+            yield encode_shard(fields, names, shard, *args)
+        return
+
+    pool = parallel.get_pool(workers)
+    window = workers * 2
+    pending = deque()
+    try:
+        for shard in shards:
+            # Time-ordered ids take their ticks from this process so they stay in order
+            shard_fields = [(reserve_ticks(plan, shard_size(shard, count)), *rest) for plan, *rest in fields]
+            pending.append(pool.submit(encode_shard, shard_fields, names, shard, *args))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+class Progress:
+    """Live rows/sec line on stderr, redrawn at most every PROGRESS_INTERVAL seconds"""
+
+    def __init__(self, total: int, live: bool):
+        self.total = total
+        self.live = live
+        self.rows = 0
+        self.nbytes = 0
+        self.start = time.perf_counter()
+        self.shown = self.start
+
+    def line(self) -> str:
+        elapsed = max(time.perf_counter() - self.start, 1e-9)
+        percent = 100 * self.rows / max(self.total, 1)
+        return (f"{self.rows:,}/{self.total:,} rows ({percent:.0f}%)  {self.rows / elapsed:,.0f} rows/s  "
+                f"{self.nbytes / 1e6:,.1f} MB  {elapsed:.1f}s")
+
+    def update(self, rows: int, nbytes: int):
+        self.rows += rows
+        self.nbytes += nbytes
+        now = time.perf_counter()
+        if self.live and now - self.shown >= PROGRESS_INTERVAL:
+            self.shown = now
+            sys.stderr.write("\r" + self.line())
+            sys.stderr.flush()
+
+    def finish(self):
+        sys.stderr.write(("\r" if self.live else "") + self.line() + "\n")
+
+def run(fields: list, names: list, count: int, seed: int, fmt: str, records: bool, output: str,
+        workers: int, quiet: bool = False):
+    gzip_level = GZIP_LEVEL if output and output.endswith(".gz") else None
+    out = open(output, "wb", buffering=WRITE_BUFFER_BYTES) if output else sys.stdout.buffer
+    progress = Progress(count, live=not quiet and sys.stderr.isatty())
+    try:
+        if fmt == "csv":
+            header = csv_line(names).encode("utf-8")
+            out.write(gzip.compress(header, gzip_level) if gzip_level is not None else header)
+        for rows, data in iter_encoded(fields, names, count, seed, fmt, records, workers, gzip_level):
+            out.write(data)
+            progress.update(rows, len(data))
+        out.flush()
+    finally:
+        if output:
+            out.close()
+        parallel.shutdown_pool()
+    if not quiet:
+        progress.finish()
+
+def list_types():
+    for data_type in DATA_TYPES:
+        print(f"{data_type['type']:<14} {data_type['name']}")
+        for option in type_options(data_type["type"]):
+            values = option.get("values")
+            choices = f" {{{','.join(str(v) for v, _ in values)}}}" if isinstance(values, list) else ""
+            default = f" (default {option['default']})" if "default" in option else ""
+            print(f"    {option['key']}={option['type']}{choices}{default}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate test data to a file or stdout using all cores")
+    parser.add_argument("type", nargs="?", help="Data type, e.g. uuid, name, email (see --list)")
+    parser.add_argument("options", nargs="*", metavar="key=value", help="Type options, e.g. length=32 special=true")
+    parser.add_argument("--schema", help="JSON file of {\"fields\": {name: {\"type\": ..., options...}}} for multi-field rows")
+    parser.add_argument("-n", "--count", type=int, help="Rows to generate (default 10, or the schema's count)")
+    parser.add_argument("-f", "--format", choices=FORMATS, help="Output format (default: from the output extension, else csv)")
+    parser.add_argument("-o", "--output", help="Output file; .gz is gzip-compressed on the workers (default stdout)")
+    parser.add_argument("--seed", type=int, help="Seed for reproducible output")
+    parser.add_argument("--workers", type=int, default=parallel.POOL_WORKERS, help="Worker processes (default: CPU count)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="No progress or summary on stderr")
+    parser.add_argument("--list", action="store_true", help="List types and their options")
+    args = parser.parse_args()
+
+    if args.list:
+        list_types()
+        return
+
+    try:
+        if args.schema:
+            if args.type:
+                parser.error("give either a type or --schema, not both")
+            with open(args.schema, encoding="utf-8") as f:
+                schema = json.load(f)
+            specs = schema.get("fields") or {}
+            if not specs:
+                parser.error("the schema has no fields")
+            count = args.count if args.count is not None else schema.get("count", 10)
+            seed = args.seed if args.seed is not None else schema.get("seed")
+            records = True
+        else:
+            if args.type not in DATA_TYPES_BY_ID:
+                parser.error(f"unknown type: {args.type} (see --list)" if args.type else "a type or --schema is required")
+            specs = {args.type: dict([parse_option(args.type, pair) for pair in args.options], type=args.type)}
+            count = args.count if args.count is not None else 10
+            seed = args.seed
+            records = False
+        fields = [compile_field(name, spec, count) for name, spec in specs.items()]
+    except ValueError as e:
+        parser.error(str(e))
+
+    fmt = args.format
+    if fmt is None:
+        output = args.output or ""
+        extension = (output[:-3] if output.endswith(".gz") else output).rpartition(".")[2]
+        fmt = extension if extension in FORMATS else "csv"
+    try:
+        run(fields, list(specs), count, seed, fmt, records, args.output, max(args.workers, 1), args.quiet)
+    except BrokenPipeError:
+        # Reader went away (e.g. piped into head); stop without a traceback
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+    except KeyboardInterrupt:
+        sys.exit(130)
+
+if __name__ == "__main__":
+    main()
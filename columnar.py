@@ -0,0 +1,146 @@
+"""
+Test Data Generator - columnar output (Arrow IPC streams and Parquet) from column chunks
+
+Column chunks from batch generation become Arrow arrays directly, with no
+per-row dicts. Low-cardinality types are dictionary-encoded. pyarrow is an
+optional dependency, imported on first use.
+"""
+
+import os
+
+COLUMNAR_MEDIA_TYPES = {
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+FILE_EXTENSIONS = {"arrow": "arrows", "parquet": "parquet"}
+
+# Types with few distinct values; their columns are dictionary-encoded
+DICTIONARY_TYPES = {"country", "city", "job", "company"}
+
+# Rows per Parquet row group; larger groups compress and dictionary-encode better
+PARQUET_ROW_GROUP_ROWS = int(os.environ.get("TDG_PARQUET_ROW_GROUP_ROWS", 100000))
+
+PARQUET_COMPRESSION = os.environ.get("TDG_PARQUET_COMPRESSION", "zstd")
+
+def load_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ValueError("Arrow and Parquet output need pyarrow installed (pip install pyarrow)")
+    return pyarrow
+
+class ChunkBuffer:
+    """Write-only file object whose contents are taken out as they are written"""
+
+    def __init__(self):
+        self.parts = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self.parts.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self.parts)
+        self.parts = []
+        return data
+
+class ColumnarWriter:
+    """Encode column chunks as one Arrow IPC stream or Parquet file
+
+    write() and close() return the bytes produced so far, so output can be
+    streamed or appended to a file chunk by chunk. The schema is taken from
+    the first chunk: int64 for integer columns, string otherwise.
+    """
+
+    def __init__(self, fmt: str, names: list, dictionary: set = ()):
+        self.pa = load_pyarrow()
+        self.fmt = fmt
+        self.names = names
+        self.dictionary = set(dictionary)
+        self.buffer = ChunkBuffer()
+        self.writer = None
+        self.pending = []
+        self.pending_rows = 0
+
+    def schema(self, columns: list):
+        pa = self.pa
+        fields = []
+        for name, column in zip(self.names, columns):
+            type_ = pa.int64() if column and isinstance(column[0], int) else pa.string()
+            if name in self.dictionary and self.fmt == "arrow":
+                type_ = pa.dictionary(pa.int32(), type_)
+            fields.append(pa.field(name, type_))
+        return pa.schema(fields)
+
+    def open(self, columns: list):
+        schema = self.schema(columns)
+        if self.fmt == "arrow":
+            self.writer = self.pa.ipc.new_stream(self.buffer, schema)
+        else:
+            self.writer = self.pa.parquet.ParquetWriter(
+                self.buffer, schema,
+                use_dictionary=[name for name in self.names if name in self.dictionary],
+                compression=PARQUET_COMPRESSION,
+            )
+        self.arrow_schema = schema
+
+    def batch(self, columns: list):
+        arrays = []
+        for field, column in zip(self.arrow_schema, columns):
+            if self.pa.types.is_dictionary(field.type):
+                arrays.append(self.pa.array(column, type=field.type.value_type).dictionary_encode())
+            else:
+                arrays.append(self.pa.array(column, type=field.type))
+        return self.pa.record_batch(arrays, schema=self.arrow_schema)
+
+    def write(self, columns: list) -> bytes:
+        if self.writer is None:
+            self.open(columns)
+        if self.fmt == "arrow":
+            self.writer.write_batch(self.batch(columns))
+        else:
+            # Parquet writes a row group per call, so chunks are grouped first
+            self.pending.append(self.batch(columns))
+            self.pending_rows += len(columns[0]) if columns else 0
+            if self.pending_rows >= PARQUET_ROW_GROUP_ROWS:
+                self.flush_row_group()
+        return self.buffer.drain()
+
+    def flush_row_group(self):
+        if self.pending:
+            self.writer.write_table(self.pa.Table.from_batches(self.pending), row_group_size=self.pending_rows)
+        self.pending = []
+        self.pending_rows = 0
+
+    def close(self) -> bytes:
+        if self.writer is None:
+            # No rows at all: an empty file with string columns
+            self.open([[] for _ in self.names])
+        if self.fmt == "parquet":
+            self.flush_row_group()
+        self.writer.close()
+        return self.buffer.drain()
+
+def stream_columnar(chunks, names: list, fmt: str, dictionary: set = ()):
+    """Encode column chunks as an Arrow IPC stream or Parquet file, yielding bytes as produced"""
+    writer = ColumnarWriter(fmt, names, dictionary)
+    for chunk in chunks:
+        data = writer.write(chunk)
+        if data:
+            yield data
+    yield writer.close()
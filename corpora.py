@@ -0,0 +1,139 @@
+"""
+Test Data Generator - memory-mapped string corpora that replace the built-in lists
+
+A corpus file holds one list of strings in an offset-indexed layout:
+
+    magic    8 bytes   b"TDGSTR1\\n"
+    count    uint64    number of strings (little-endian)
+    offsets  uint64 x (count + 1), byte offset of each string in the blob
+    blob     UTF-8 strings back to back
+
+Files are mapped read-only, so every server and pool process shares one copy
+through the page cache, and a lookup touches only the pages it reads.
+
+An optional <name>.weights file beside it holds one little-endian float64
+weight per string, used when a type is generated with distribution=weighted.
+
+Build a corpus from a text file with one value per line, optionally followed
+by a tab and a weight:
+    python corpora.py build first_names names.txt
+    python corpora.py build cities de_cities.txt --locale DE
+"""
+
+import mmap
+import os
+import re
+import struct
+from functools import lru_cache
+
+import numpy as np
+
+# Where corpus files are looked up: <dir>/<name>.tdgs or <dir>/<locale>/<name>.tdgs
+CORPUS_DIR = os.environ.get("TDG_CORPUS_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpora"))
+
+MAGIC = b"TDGSTR1\n"
+HEADER = struct.Struct("<8sQ")
+EXTENSION = ".tdgs"
+WEIGHTS_EXTENSION = ".weights"
+
+# Locales are country codes such as "DE" or "en_US"; anything else is not looked up
+LOCALE_PATTERN = re.compile(r"^[A-Za-z]{2,3}(_[A-Za-z]{2,3})?$")
+
+class StringCorpus:
+    """Read-only sequence of strings backed by a memory-mapped corpus file"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a corpus file")
+        self._offsets = np.frombuffer(self._map, dtype="<u8", count=self._count + 1, offset=HEADER.size)
+        self._blob = HEADER.size + 8 * (self._count + 1)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("corpus index out of range")
+        start = self._blob + int(self._offsets[index])
+        end = self._blob + int(self._offsets[index + 1])
+        return self._map[start:end].decode("utf-8")
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self[i]
+
+def corpus_path(name: str, locale: str = None) -> str:
+    return os.path.join(CORPUS_DIR, *([locale] if locale else []), name + EXTENSION)
+
+def weights_path(path: str) -> str:
+    return os.path.splitext(path)[0] + WEIGHTS_EXTENSION
+
+@lru_cache(maxsize=256)
+def load_corpus(name: str, locale: str = None):
+    """The corpus for name (and locale), mapped on first use; None if there is no file"""
+    if locale and not LOCALE_PATTERN.match(locale):
+        return None
+    path = corpus_path(name, locale)
+    if not os.path.exists(path):
+        return None
+    return StringCorpus(path)
+
+@lru_cache(maxsize=256)
+def load_weights(name: str, locale: str = None):
+    """Memory-mapped weights for a corpus, or None if it has none"""
+    corpus = load_corpus(name, locale)
+    path = weights_path(corpus_path(name, locale))
+    if corpus is None or not os.path.exists(path):
+        return None
+    weights = np.memmap(path, dtype="<f8", mode="r")
+    if len(weights) != len(corpus):
+        raise ValueError(f"{path} has {len(weights)} weights for {len(corpus)} values")
+    return weights
+
+def write_corpus(path: str, values: list, weights: list = None):
+    """Write strings as a corpus file"""
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype="<u8")
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(encoded)))
+        f.write(offsets.tobytes())
+        for value in encoded:
+            f.write(value)
+    os.replace(tmp, path)
+    
+    if weights is not None:
+        np.asarray(weights, dtype="<f8").tofile(weights_path(path))
+
+def main():
+    # Only the build command needs argparse; the server imports this module on startup
+    import argparse
+    parser = argparse.ArgumentParser(description="Build a corpus file from a text file with one value per line")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build = subparsers.add_parser("build")
+    build.add_argument("name", help="Corpus name, e.g. first_names, last_names, cities")
+    build.add_argument("source", help="Text file with one value per line")
+    build.add_argument("--locale", help="Country code for per-country corpora, e.g. DE")
+    args = parser.parse_args()
+
+    with open(args.source, encoding="utf-8") as f:
+        rows = [line.rstrip("\n").split("\t") for line in f if line.strip()]
+    values = [row[0].strip() for row in rows]
+    weights = [float(row[1]) if len(row) > 1 else 1.0 for row in rows] if any(len(row) > 1 for row in rows) else None
+    path = corpus_path(args.name, args.locale)
+    write_corpus(path, values, weights)
+    print(f"Wrote {len(values)} values{' with weights' if weights else ''} to {path}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Test Data Generator - output encoders (NDJSON/JSONL/CSV lines and JSON response bodies)
+"""
+
+import csv
+import io
+import json
+
+try:
+    import orjson
+except ImportError:
+    # Optional: without it, JSON bodies use the json module plus a fast path for strings
+    orjson = None
+
+# Rows buffered into each chunk of a streamed response
+STREAM_CHUNK_ROWS = 1000
+
+# Bytes that must be escaped inside a JSON string: control characters, quote and backslash.
+# Multi-byte UTF-8 sequences never contain them, so a byte scan finds exactly these.
+JSON_ESCAPED_BYTES = bytes(range(32)) + b'"\\'
+
+STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "jsonl": "application/jsonl",
+    "csv": "text/csv",
+}
+
+def csv_line(row: list) -> str:
+    buf = io.StringIO()
+    csv.writer(buf, lineterminator="\n").writerow(row)
+    return buf.getvalue()
+
+def encode_values(values: list, fmt: str) -> str:
+    """Encode a batch of values as NDJSON/JSONL lines or single-column CSV rows"""
+    if fmt == "csv":
+        buf = io.StringIO()
+        csv.writer(buf, lineterminator="\n").writerows([v] for v in values)
+        return buf.getvalue()
+    return "".join([json.dumps(v, ensure_ascii=False) + "\n" for v in values])
+
+def encode_columns(columns: list, names: list, fmt: str) -> str:
+    """Encode a chunk of equally sized columns as CSV rows or NDJSON/JSONL objects"""
+    if fmt == "csv":
+        buf = io.StringIO()
+        csv.writer(buf, lineterminator="\n").writerows(zip(*columns))
+        return buf.getvalue()
+    return "".join([json.dumps(dict(zip(names, row)), ensure_ascii=False) + "\n" for row in zip(*columns)])
+
+def stream_rows(values, fmt: str, header: str = "value"):
+    """Encode values as NDJSON/JSONL lines or CSV rows, STREAM_CHUNK_ROWS per chunk"""
+    if fmt == "csv":
+        yield csv_line([header]).encode("utf-8")
+    
+    chunk = []
+    for value in values:
+        chunk.append(value)
+        if len(chunk) == STREAM_CHUNK_ROWS:
+            yield encode_values(chunk, fmt).encode("utf-8")
+            chunk = []
+    if chunk:
+        yield encode_values(chunk, fmt).encode("utf-8")
+
+def stream_records(chunks, names: list, fmt: str):
+    """Encode column chunks as CSV rows or NDJSON/JSONL objects, one chunk at a time"""
+    if fmt == "csv":
+        yield csv_line(names).encode("utf-8")
+    for chunk in chunks:
+        yield encode_columns(chunk, names, fmt).encode("utf-8")
+
+def json_dumps(value) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def json_items(values: list) -> bytes:
+    """Values as the comma-separated items of a JSON array, without the brackets
+
+    Strings that need no escaping (nearly all generated values) are joined
+    directly instead of being encoded one by one.
+    """
+    if orjson is not None:
+        return orjson.dumps(values)[1:-1]
+    try:
+        encoded = ('"' + '","'.join(values) + '"').encode("utf-8")
+    except TypeError:
+        encoded = None
+    # The only quotes should be the two added around each value
+    if values and encoded is not None and len(encoded) - len(encoded.translate(None, JSON_ESCAPED_BYTES)) == 2 * len(values):
+        return encoded
+    return json_dumps(values)[1:-1]
+
+def json_body(fields: dict, items: list) -> bytes:
+    """A JSON object of fields plus "data": an array built from json_items parts"""
+    head = json_dumps(fields)[:-1] + (b',"data":[' if fields else b'"data":[')
+    return head + b",".join([part for part in items if part]) + b"]}"
@@ -0,0 +1,1806 @@
+"""
+Test Data Generator - reference data and generator functions
+"""
+
+import os
+import random
+import secrets
+import threading
+import time
+import uuid
+from bisect import bisect_left
+from collections import namedtuple
+from functools import lru_cache, partial
+
+import numpy as np
+
+from corpora import load_corpus, load_weights
+from sampling import AliasTable, zipf_weights
+
+# Countries for phone/address
+COUNTRIES = {
+    "US": {"name": "United States", "code": "+1"},
+    "GB": {"name": "United Kingdom", "code": "+44"},
+    "IN": {"name": "India", "code": "+91"},
+    "DE": {"name": "Germany", "code": "+49"},
+    "FR": {"name": "France", "code": "+33"},
+    "CA": {"name": "Canada", "code": "+1"},
+    "AU": {"name": "Australia", "code": "+61"},
+    "JP": {"name": "Japan", "code": "+81"},
+    "BR": {"name": "Brazil", "code": "+55"},
+    "IT": {"name": "Italy", "code": "+39"},
+    "ES": {"name": "Spain", "code": "+34"},
+    "MX": {"name": "Mexico", "code": "+52"},
+    "KR": {"name": "South Korea", "code": "+82"},
+    "CN": {"name": "China", "code": "+86"},
+    "RU": {"name": "Russia", "code": "+7"},
+    "NL": {"name": "Netherlands", "code": "+31"},
+    "SE": {"name": "Sweden", "code": "+46"},
+    "NO": {"name": "Norway", "code": "+47"},
+    "DK": {"name": "Denmark", "code": "+45"},
+    "FI": {"name": "Finland", "code": "+358"},
+    "CH": {"name": "Switzerland", "code": "+41"},
+    "AT": {"name": "Austria", "code": "+43"},
+    "BE": {"name": "Belgium", "code": "+32"},
+    "PT": {"name": "Portugal", "code": "+351"},
+    "PL": {"name": "Poland", "code": "+48"},
+    "CZ": {"name": "Czech Republic", "code": "+420"},
+    "HU": {"name": "Hungary", "code": "+36"},
+    "GR": {"name": "Greece", "code": "+30"},
+    "TR": {"name": "Turkey", "code": "+90"},
+    "ZA": {"name": "South Africa", "code": "+27"},
+    "NZ": {"name": "New Zealand", "code": "+64"},
+    "SG": {"name": "Singapore", "code": "+65"},
+    "HK": {"name": "Hong Kong", "code": "+852"},
+    "AE": {"name": "UAE", "code": "+971"},
+    "SA": {"name": "Saudi Arabia", "code": "+966"},
+    "IL": {"name": "Israel", "code": "+972"},
+    "TH": {"name": "Thailand", "code": "+66"},
+    "VN": {"name": "Vietnam", "code": "+84"},
+    "PH": {"name": "Philippines", "code": "+63"},
+    "ID": {"name": "Indonesia", "code": "+62"},
+    "MY": {"name": "Malaysia", "code": "+60"},
+    "AR": {"name": "Argentina", "code": "+54"},
+    "CL": {"name": "Chile", "code": "+56"},
+    "CO": {"name": "Colombia", "code": "+57"},
+    "PE": {"name": "Peru", "code": "+51"},
+    "EG": {"name": "Egypt", "code": "+20"},
+    "NG": {"name": "Nigeria", "code": "+234"},
+    "KE": {"name": "Kenya", "code": "+254"},
+    "MA": {"name": "Morocco", "code": "+212"},
+}
+
+# IMEI Brands
+IMEI_BRANDS = {
+    "Apple": "35",
+    "Samsung": "49",
+    "Google": "49",
+    "Huawei": "86",
+    "Xiaomi": "86",
+    "OnePlus": "86",
+    "Sony": "35",
+    "LG": "35",
+    "Motorola": "35",
+    "Nokia": "35",
+}
+
+# Credit Card Types
+CREDIT_CARD_TYPES = {
+    "Visa": {"prefix": "4", "length": 16},
+    "Mastercard": {"prefix": ["51", "52", "53", "54", "55"], "length": 16},
+    "American Express": {"prefix": "37", "length": 15},
+    "Discover": {"prefix": "6011", "length": 16},
+    "JCB": {"prefix": "3528", "length": 16},
+    "Diners Club": {"prefix": "36", "length": 14},
+    "UnionPay": {"prefix": "62", "length": 16},
+}
+
+# URL Domains
+URL_DOMAINS = ["google", "facebook", "amazon", "apple", "microsoft", "twitter", "linkedin", "github", "stackoverflow", "youtube", "netflix", "instagram", "pinterest", "reddit", "tumblr", "whatsapp", "telegram", "discord", "slack", "zoom"]
+URL_TLDS = ["com", "org", "net", "io", "co", "ai", "app", "dev", "tech", "info", "biz"]
+
+# Real-world username patterns
+USERNAME_NAMES = ["alex", "sam", "jordan", "taylor", "morgan", "riley", "jamie", "quinn", "casey", "dakota", "avery", "skyler", "dylan", "tanner", "emma", "olivia", "ava", "isabella", "sophia", "mia", "charlotte", "amelia", "harper", "evelyn", "liam", "noah", "oliver", "elijah", "james", "william", "benjamin"]
+USERNAME_ADJ = ["cool", "happy", "sunny", "lucky", "smart", "swift", "bright", "wild", "funny", "nice", "epic", "super", "mega", "ultra", "hyper", "active", "chill", "fresh", "big", "small", "fast", "slow", "young", "great", "prime", "pro", "max", "ace"]
+USERNAME_NOUN = ["cat", "dog", "wolf", "shark", "lion", "bear", "fox", "hawk", "eagle", "panda", "koala", "puppy", "kitten", "bunny", "duck", "bird", "fish", "unicorn", "dragon", "ninja", "coder", "geek", "hero", "star", "moon", "sun", "wave", "fire", "ice", "storm", "king", "queen", "prince", "lord", "lady"]
+
+# Job Titles
+JOB_TITLES = [
+    "Software Engineer", "Senior Software Engineer", "Staff Engineer", "Principal Engineer",
+    "Full Stack Developer", "Frontend Developer", "Backend Developer", "Mobile Developer",
+    "DevOps Engineer", "Site Reliability Engineer", "Cloud Engineer", "Platform Engineer",
+    "Data Engineer", "Machine Learning Engineer", "AI Engineer", "Data Scientist",
+    "Cloud Architect", "Solutions Architect", "Technical Architect",
+    "Engineering Manager", "Director of Engineering", "VP of Engineering", "CTO",
+    "UI Designer", "UX Designer", "Product Designer", "Visual Designer",
+    "Creative Director", "Art Director",
+    "Product Manager", "Senior Product Manager", "Director of Product", "VP of Product",
+    "Project Manager", "Senior Project Manager", "Program Manager", "Scrum Master",
+    "Data Analyst", "Senior Data Analyst", "Analytics Engineer", "BI Developer",
+    "System Administrator", "Network Engineer", "Security Engineer",
+    "Penetration Tester", "SOC Analyst", "DevSecOps Engineer",
+    "QA Engineer", "QA Automation Engineer", "Test Engineer",
+    "Technical Writer", "Documentation Engineer",
+    "Customer Success Engineer", "Support Engineer", "Sales Engineer",
+    "Recruiter", "Technical Recruiter", "HR Manager",
+    "Marketing Manager", "Digital Marketing Manager", "SEO Specialist",
+]
+
+# Company suffixes
+COMPANY_SUFFIXES = ["Inc", "Corp", "LLC", "Ltd", "Group", "Solutions", "Systems", "Tech", "Labs", "Ventures", "Holdings", "Enterprises", "Co", "Partners", "Associates"]
+
+# Street names
+US_STREETS = ["Main St", "Oak Ave", "Park Blvd", "First St", "Second St", "Elm St", "Maple Dr", "Cedar Ln", "Pine St", "Elmwood Ave", "Washington St", "Lake Dr", "Hill Rd", "River Rd", "Forest Ave", "Broadway", "Market St", "Church St", "School Ave", "Mill Rd"]
+UK_STREETS = ["High Street", "Station Road", "London Road", "Victoria Road", "Church Lane", "Manor Road", "Park Road", "Queens Road", "Kings Road", "Church Street", "Main Road", "River Close", "Hill View", "Station Lane", "Park Lane"]
+DE_STREETS = ["Hauptstraße", "Bahnhofstraße", "Schulstraße", "Gartenstraße", "Dorfstraße", "Bergstraße", "Waldstraße", "Kirchstraße", "Lindenstraße", "Brunnenstraße", "Schloßstraße", "Friedrichstraße", "Bismarckstraße", "Goethestraße", "Schillerstraße"]
+FR_STREETS = ["Rue de la Paix", "Avenue des Champs-Élysées", "Boulevard Saint-Michel", "Place de la République", "Rue Victor Hugo", "Rue du Commerce", "Avenue Jean Jaurès", "Rue de la Gare", "Place du Marché", "Avenue de la Libération"]
+
+# Cities
+CITIES = ["New York", "Los Angeles", "Chicago", "Houston", "Phoenix", "Philadelphia", "San Antonio", "San Diego", "Dallas", "San Jose", "Austin", "Jacksonville", "Fort Worth", "Columbus", "Charlotte", "San Francisco", "Indianapolis", "Seattle", "Denver", "Boston", "London", "Manchester", "Birmingham", "Edinburgh", "Glasgow", "Paris", "Lyon", "Marseille", "Berlin", "Munich", "Hamburg", "Tokyo", "Osaka", "Sydney", "Melbourne", "Toronto", "Vancouver", "Mumbai", "Delhi", "Bangalore", "Shanghai", "Beijing", "Singapore", "Dubai", "Amsterdam", "Barcelona", "Milan", "Rome", "Lisbon", "Vienna", "Prague"]
+
+# Countries list
+COUNTRIES_LIST = ["United States", "Canada", "United Kingdom", "Germany", "France", "Australia", "India", "Japan", "Brazil", "Italy", "Spain", "Mexico", "South Korea", "Netherlands", "Sweden", "Norway", "Denmark", "Finland", "Switzerland", "Austria", "Belgium", "Portugal", "Poland", "Czech Republic", "Hungary", "Greece", "Turkey", "Russia", "China", "Singapore", "UAE", "Thailand", "Vietnam", "Philippines", "Indonesia", "Malaysia", "New Zealand", "South Africa", "Egypt", "Nigeria", "Kenya", "Argentina", "Chile", "Colombia", "Peru"]
+
+# Person names
+FIRST_NAMES = ["James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda", "David", "Elizabeth", "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah", "Charles", "Karen", "Emma", "Olivia", "Ava", "Isabella", "Sophia", "Mia", "Charlotte", "Amelia", "Harper", "Evelyn", "Liam", "Noah", "Oliver", "Elijah"]
+LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin"]
+
+# Email local parts and fallback providers
+EMAIL_NAMES = ["alex", "sam", "jordan", "taylor", "morgan", "riley", "jamie", "quinn", "casey", "dakota", "avery", "skyler"]
+EMAIL_PROVIDERS = ["gmail.com", "yahoo.com", "outlook.com"]
+
+# URL paths
+URL_PATHS = ["about", "products", "services", "blog", "contact"]
+
+# Company name words
+COMPANY_WORDS = ["Solutions", "Systems", "Technologies", "Labs", "Ventures", "Group", "Inc"]
+
+# Sentence parts for grammatically valid sentences
+SENTENCE_SUBJECTS = ["The quick brown fox", "A happy dog", "The clever cat", "An innovative startup", "A dedicated team", "The talented developer", "An amazing product", "A revolutionary idea"]
+SENTENCE_VERBS = ["jumps over", "runs through", "explores", "discovers", "builds", "creates", "transforms", "improves"]
+SENTENCE_OBJECTS = ["the lazy bear", "the tall building", "new horizons", "exciting opportunities", "powerful solutions", "beautiful designs", "complex problems", "amazing experiences"]
+
+# Cities per country
+CITIES_BY_COUNTRY = {
+    "US": ["New York", "Los Angeles", "Chicago", "Houston", "Phoenix", "Philadelphia", "San Antonio", "San Diego", "Dallas", "San Jose", "Austin", "Jacksonville", "Fort Worth", "Columbus", "Charlotte", "San Francisco", "Indianapolis", "Seattle", "Denver", "Boston"],
+    "UK": ["London", "Manchester", "Birmingham", "Edinburgh", "Glasgow", "Liverpool", "Bristol", "Leeds", "Sheffield", "Newcastle", "Nottingham", "Southampton", "Brighton", "Oxford", "Cambridge", "York", "Cardiff", "Belfast", "Bournemouth", "Leicester"],
+    "DE": ["Berlin", "Munich", "Hamburg", "Frankfurt", "Cologne", "Stuttgart", "Düsseldorf", "Dortmund", "Leipzig", "Essen", "Dresden", "Hanover", "Nuremberg", "Duisburg", "Bochum", "Wuppertal", "Bielefeld", "Bonn", "Mannheim", "Karlsruhe"],
+    "FR": ["Paris", "Lyon", "Marseille", "Toulouse", "Nice", "Nantes", "Strasbourg", "Bordeaux", "Lille", "Rennes", "Reims", "Le Havre", "Saint-Étienne", "Toulon", "Grenoble", "Dijon", "Angers", "Nîmes", "Villeurbanne", "Clermont-Ferrand"],
+    "IN": ["Mumbai", "Delhi", "Bangalore", "Chennai", "Kolkata", "Hyderabad", "Pune", "Ahmedabad", "Surat", "Jaipur", "Lucknow", "Kanpur", "Nagpur", "Indore", "Thane", "Bhopal", "Visakhapatnam", "Pimpri", "Kalyan", "Meerut"],
+    "AU": ["Sydney", "Melbourne", "Brisbane", "Perth", "Adelaide", "Canberra", "Hobart", "Darwin", "Newcastle", "Geelong", "Townsville", "Cairns", "Toowoomba", "Ballarat", "Bendigo", "Launceston", "Mackay", "Rockhampton", "Sunshine Coast", "Gold Coast"],
+    "CA": ["Toronto", "Vancouver", "Montreal", "Calgary", "Ottawa", "Edmonton", "Winnipeg", "Halifax", "Victoria", "Brampton", "Kitchener", "London", "Oshawa", "Barrie", "Sherbrooke", "Guelph", "Moncton", "Kelowna", "Sudbury", "Trois-Rivières"],
+    "JP": ["Tokyo", "Osaka", "Kyoto", "Yokohama", "Nagoya", "Sapporo", "Fukuoka", "Kobe", "Kawasaki", "Saitama", "Hiroshima", "Sendai", "Chiba", "Sakai", "Niigata", "Hamamatsu", "Hachioji", "Higashihiroshima", "Okayama", "Kagoshima"],
+    "BR": ["São Paulo", "Rio de Janeiro", "Brasília", "Salvador", "Fortaleza", "Belo Horizonte", "Manaus", "Curitiba", "Recife", "Porto Alegre", "Belém", "Goiânia", "Guarulhos", "Campinas", "São Luís", "São Gonçalo", "Maceió", "Duque de Caxias", "Natal", "Teresina"],
+    "IT": ["Rome", "Milan", "Naples", "Turin", "Florence", "Venice", "Bologna", "Genoa", "Bari", "Palermo", "Verona", "Catania", "Syracuse", "Padua", "Taranto", "Brescia", "Prato", "Reggio Calabria", "Modena", "Cagliari"],
+    "ES": ["Madrid", "Barcelona", "Valencia", "Seville", "Bilbao", "Málaga", "Murcia", "Palma", "Las Palmas", "Zaragoza", "Alicante", "Córdoba", "Valladolid", "Vigo", "Gijón", "Hospitalet", "Vitoria", "Elche", "Terrassa", "Oviedo"],
+    "MX": ["Mexico City", "Guadalajara", "Monterrey", "Cancún", "Puebla", "Tijuana", "Ciudad Juárez", "Torreón", "Toluca", "Chihuahua", "Durango", "Saltillo", "Acapulco", "Morelia", "Veracruz", "Tampico", "Tulum", "Oaxaca", "Guadalupe", "Mazatlán"],
+    "CN": ["Beijing", "Shanghai", "Guangzhou", "Shenzhen", "Chengdu", "Hangzhou", "Wuhan", "Nanjing", "Xi'an", "Chongqing", "Suzhou", "Tianjin", "Kunming", "Qingdao", "Dalian", "Harbin", "Jinan", "Shenyang", "Changchun", "Ningbo"],
+    "NL": ["Amsterdam", "Rotterdam", "The Hague", "Utrecht", "Eindhoven", "Groningen", "Tilburg", "Almere", "Breda", "Nijmegen", "Enschede", "Haarlem", "Arnhem", "Maastricht", "Zaanstad", "Zwolle", "Leeuwarden", "Leiden", "Delft", "Alkmaar"],
+    "SG": ["Singapore"],
+    "AE": ["Dubai", "Abu Dhabi", "Sharjah", "Al Ain", "Ajman", "Ras Al Khaimah", "Fujairah", "Umm Al Quwain", "Khor Fakkan", "Jebel Ali"],
+    "ZA": ["Johannesburg", "Cape Town", "Durban", "Pretoria", "Port Elizabeth", "Bloemfontein", "East London", "Polokwane", "Pietermaritzburg", "Nelspruit", "Kimberley", "George", "Middelburg", "Rustenburg", "Worcester", "Standerton", "Bethlehem", "Mmabatho", "Klerksdorp", "Mossel Bay"],
+    "MA": ["Casablanca", "Rabat", "Marrakech", "Fes", "Tangier", "Agadir", "Meknes", "Oujda", "Kenitra", "Tetouan", "Safi", "El Jadid", "Nador", "Beni Mellal", "Errachidia", "Taza", "Ksar El Kebir", "Guercif", "Tiflet", "Ouarzazate"],
+    "PE": ["Lima", "Arequipa", "Cusco", "Trujillo", "Chiclayo", "Iquitos", "Piura", "Tacna", "Pucallpa", "Sullana", ""],  # Peru cities
+    "AR": ["Buenos Aires", "Córdoba", "Rosario", "Mendoza", "La Plata", "Tucumán", "Mar del Plata", "Salta", "Santa Fe", "Corrientes", "Bahía Blanca", "Posadas", "San Juan", "Resistencia", "Neuquén", "Venado Tuerto", "Villa Lugano", "San Miguel de Tucumán", "Pilar", ""],
+    "CL": ["Santiago", "Valparaíso", "Concepción", "La Serena", "Antofagasta", "Viña del Mar", "Rancagua", "Temuco", "Puerto Montt", "La Reina", ""],
+    "CO": ["Bogotá", "Medellín", "Cali", "Barranquilla", "Cartagena", "Cúcuta", "Soacha", "Soledad", "Bucaramanga", "Pereira", "Santa Marta", "Ibagué", "Pasto", "Manizales", "Neiva", "Armenia", "Villavicencio", "Popayán", "Sincelejo", "Tunja"],
+    "TH": ["Bangkok", "Chiang Mai", "Phuket", "Pattaya", "Krabi", "Hua Hin", "Ayutthaya", "Khon Kaen", "Surat Thani", "Chonburi", "Nonthaburi", "Nakhon Ratchasima", "Udon Thani", "Sakhon Nakhon", "Phitsanulok", "Lampang", "Ubon Ratchathani", "Samut Prakan", "Ratchaburi", "Suphan Buri"],
+    "VN": ["Hanoi", "Ho Chi Minh City", "Da Nang", "Hai Phong", "Can Tho", "Bien Hoa", "Hue", "Thu Dau Mot", "Nha Trang", "Bac Ninh", "Ha Long", "Vung Tau", "Da Lat", "Quy Nhon", "Rach Gia", "Long Xuyen", "Thanh Hoa", "Thai Nguyen", "Yen Bai", "Cau River"],
+    "PH": ["Manila", "Quezon City", "Cebu City", "Davao City", "Makati", "Taguig", "Pasig", "Caloocan", "Bacoor", "Cavite City", "Iloilo City", "Bohol", "Zamboanga City", "Lapu-Lapu City", "Mandaluyong", "Malabon", "San Jose del Monte", "Batangas City", "Legazpi", "Puerto Princesa"],
+    "ID": ["Jakarta", "Surabaya", "Bandung", "Medan", "Semarang", "Tangerang", "Depok", "Palembang", "Makassar", "Bogor", "Bandar Lampung", "Padang", "Denpasar", "Samarinda", "Banjarmasin", "Malang", "Pontianak", "Yogyakarta", "Cirebon", "Bekasi"],
+    "MY": ["Kuala Lumpur", "George Town", "Johor Bahru", "Ipoh", "Shah Alam", "Petaling Jaya", "Kota Kinabalu", "Kuching", "Melaka", "Seremban", "Alor Setar", "Kuantan", "Kuala Terengganu", "Sibu", "Miri", "Sungai Petani", "Batu Pahat", "Kluang", "Tawau", "Sandakan"],
+    "NZ": ["Auckland", "Wellington", "Christchurch", "Hamilton", "Tauranga", "Napier-Hastings", "Palmerston North", "Rotorua", "New Plymouth", "Whangarei", "Dunedin", "Invercargill", "Nelson", "Hastings", "Upper Hutt", "Gisborne", "Timaru", "Blenheim", "Papakura", "Porirua"],
+    "EG": ["Cairo", "Alexandria", "Giza", "Luxor", "Aswan", "Mansoura", "Port Said", "Suez", "Tanta", "Zagazig", "Ismailia", "Faiyum", "Zagazig", "Sohag", "Qena", "Beni Suef", "Hurghada", "Marsa Alam", "Sharm El Sheikh", "Damanhur"],
+    "NG": ["Lagos", "Abuja", "Ibadan", "Kano", "Port Harcourt", "Benin City", "Maiduguri", "Zaria", "Aba", "Jos", "Ilorin", "Owerri", "Yenagoa", "Enugu", "Abuja", "Lagos Island", "Ikeja", "Surulere", "Victoria Island", "Ikoyi"],
+    "KE": ["Nairobi", "Mombasa", "Kisumu", "Nakuru", "Eldoret", "Thika", "Malindi", "Kitale", "Garissa", "Kapenguria", "Nyali", "Kisii", "Nyeri", "Meru", "Embu", "Naivasha", "Kericho", "Kakamega", "Migori", "Bungoma"],
+    "GR": ["Athens", "Thessaloniki", "Patras", "Heraklion", "Larissa", "Volos", "Ioannina", "Chania", "Kalamata", "Alexandroupoli", "Kavala", "Lamia", "Drama", "Trikala", "Serres", "Chios", "Rodos", "Kos", "Corfu", "Santorini"],
+    "TR": ["Istanbul", "Ankara", "Izmir", "Bursa", "Antalya", "Adana", "Gaziantep", "Konya", "Mersin", "Eskisehir", "Denizli", "Samsun", "Diyarbakir", "Kayseri", "Sivas", "Trabzon", "Urfa", "Malatya", "Erzurum", "Tekirdag"],
+    "RU": ["Moscow", "Saint Petersburg", "Novosibirsk", "Yekaterinburg", "Nizhny Novgorod", "Kazan", "Chelyabinsk", "Omsk", "Samara", "Rostov-on-Don", "Ufa", "Krasnoyarsk", "Voronezh", "Volgograd", "Krasnodar", "Saratov", "Tyumen", "Tolyatti", "Izhevsk", "Barnaul"],
+}
+
+# Meaningful words for text generator
+TEXT_WORDS = ["the", "quick", "brown", "fox", "jumps", "over", "lazy", "dog", "hello", "world", "test", "data", "generator", "sample", "text", "random", "useful", "helpful", "amazing", "awesome", "brilliant", "fantastic", "wonderful", "excellent", "perfect", "beautiful", "lovely", "nice", "good", "great"]
+
+# Categories for UI navigation
+CATEGORIES = [
+    {"id": "identifiers_security", "name": "Identifiers & Security", "icon": "🔑", "order": 1},
+    {"id": "contact_identity", "name": "Contact & Identity", "icon": "📞", "order": 2},
+    {"id": "financial_sensitive", "name": "Financial & Sensitive", "icon": "💳", "order": 3},
+    {"id": "network_web", "name": "Network & Web", "icon": "🌐", "order": 4},
+    {"id": "time_text", "name": "Time & Text", "icon": "🕐", "order": 5},
+    {"id": "colors", "name": "Colors", "icon": "🎨", "order": 6},
+    {"id": "work_org", "name": "Work & Organization", "icon": "🏢", "order": 7},
+]
+
+# Data types configuration with category mapping
+DATA_TYPES = [
+    # Identifiers & Security
+    {"type": "uuid", "name": "UUID", "icon": "🎲", "category": "identifiers_security", "supports_prefix_suffix": True},
+    {"type": "password", "name": "Password", "icon": "🔐", "category": "identifiers_security", "supports_prefix_suffix": False},
+    {"type": "username", "name": "Username", "icon": "🎮", "category": "identifiers_security", "supports_prefix_suffix": False},
+    {"type": "imei", "name": "IMEI", "icon": "📱", "category": "identifiers_security", "supports_prefix_suffix": False},
+    {"type": "mac_address", "name": "MAC Address", "icon": "🔌", "category": "identifiers_security", "supports_prefix_suffix": False},
+    
+    # Contact & Identity
+    {"type": "name", "name": "Name", "icon": "👤", "category": "contact_identity", "supports_prefix_suffix": False},
+    {"type": "email", "name": "Email", "icon": "📧", "category": "contact_identity", "supports_prefix_suffix": False},
+    {"type": "phone", "name": "Phone", "icon": "📞", "category": "contact_identity", "supports_prefix_suffix": False},
+    {"type": "address", "name": "Address", "icon": "🏠", "category": "contact_identity", "supports_prefix_suffix": False},
+    {"type": "country", "name": "Country", "icon": "🌍", "category": "contact_identity", "supports_prefix_suffix": False},
+    {"type": "city", "name": "City", "icon": "🏙️", "category": "contact_identity", "supports_prefix_suffix": False},
+    {"type": "zipcode", "name": "ZIP Code", "icon": "📮", "category": "contact_identity", "supports_prefix_suffix": False},
+    
+    # Financial & Sensitive
+    {"type": "credit_card", "name": "Credit Card", "icon": "💳", "category": "financial_sensitive", "supports_prefix_suffix": False},
+    {"type": "ssn", "name": "SSN", "icon": "🔢", "category": "financial_sensitive", "supports_prefix_suffix": False},
+    {"type": "barcode", "name": "Barcode", "icon": "📊", "category": "financial_sensitive", "supports_prefix_suffix": False},
+    {"type": "isbn", "name": "ISBN", "icon": "📚", "category": "financial_sensitive", "supports_prefix_suffix": False},
+    
+    # Network & Web
+    {"type": "ip", "name": "IP Address", "icon": "🌐", "category": "network_web", "supports_prefix_suffix": False},
+    {"type": "url", "name": "URL", "icon": "🔗", "category": "network_web", "supports_prefix_suffix": False},
+    
+    # Time & Text
+    {"type": "datetime", "name": "DateTime", "icon": "🕐", "category": "time_text", "supports_prefix_suffix": False},
+    {"type": "sentence", "name": "Sentence", "icon": "📚", "category": "time_text", "supports_prefix_suffix": False},
+    {"type": "paragraph", "name": "Paragraph", "icon": "📖", "category": "time_text", "supports_prefix_suffix": False},
+    
+    # Colors
+    {"type": "hex_color", "name": "Hex Color", "icon": "🎨", "category": "colors", "supports_prefix_suffix": False},
+    {"type": "rgb_color", "name": "RGB Color", "icon": "🌈", "category": "colors", "supports_prefix_suffix": False},
+    
+    # Work & Organization
+    {"type": "company", "name": "Company", "icon": "🏢", "category": "work_org", "supports_prefix_suffix": False},
+    {"type": "job", "name": "Job Title", "icon": "💼", "category": "work_org", "supports_prefix_suffix": False},
+]
+
+# Option metadata per type, built by type_options on the first request for the type
+TYPE_OPTIONS = {
+    # Identifiers & Security
+    "uuid": lambda: [
+        {"key": "version", "label": "Version", "type": "radio", "values": [("v4", "v4 (random)"), ("v7", "v7 (time-ordered)"), ("ulid", "ULID")], "default": "v4"}
+    ],
+    "password": lambda: [
+        {"key": "uppercase", "label": "Uppercase (A-Z)", "type": "checkbox", "default": True},
+        {"key": "lowercase", "label": "Lowercase (a-z)", "type": "checkbox", "default": True},
+        {"key": "numbers", "label": "Numbers (0-9)", "type": "checkbox", "default": True},
+        {"key": "special", "label": "Special (!@#$)", "type": "checkbox", "default": False},
+        {"key": "length", "label": "Length", "type": "number", "default": 16, "min": 4, "max": 128},
+        {"key": "require_each", "label": "At least one of each", "type": "checkbox", "default": False}
+    ],
+    "username": lambda: [
+        {"key": "prefix", "label": "Prefix", "type": "text", "placeholder": "e.g., user_"},
+        {"key": "style", "label": "Style", "type": "select", "values": [("name_year", "name + year"), ("adj_noun", "adjective + noun"), ("name_random", "name + random"), ("mrx", "mrx + name")], "default": "name_year"}
+    ],
+    "imei": lambda: [
+        {"key": "brand", "label": "Manufacturer", "type": "select", "values": [("Apple", "Apple"), ("Samsung", "Samsung"), ("Xiaomi", "Xiaomi"), ("Generic", "Generic")], "default": "Generic"},
+        {"key": "valid_checksum", "label": "Valid checksum only", "type": "checkbox", "default": True}
+    ],
+    "mac_address": lambda: [
+        {"key": "uppercase", "label": "Uppercase", "type": "checkbox", "default": True},
+        {"key": "separator", "label": "Separator", "type": "radio", "values": [(":", ":"), ("-", "-")], "default": ":"}
+    ],
+    
+    # Contact & Identity
+    "name": lambda: [
+        {"key": "starts_with", "label": "Starts with", "type": "text", "placeholder": "Letter or word"},
+        {"key": "ends_with", "label": "Ends with", "type": "text", "placeholder": "Letter or word"},
+        {"key": "distribution", "label": "Distribution", "type": "radio", "values": [("uniform", "Uniform"), ("weighted", "Realistic")], "default": "uniform"}
+    ],
+    "email": lambda: [
+        {"key": "domain", "label": "Domain", "type": "text", "placeholder": "e.g., example"},
+        {"key": "extension", "label": "Extension", "type": "select", "values": [("com", ".com"), ("org", ".org"), ("net", ".net"), ("io", ".io"), ("test", ".test"), ("co", ".co")], "default": "com"}
+    ],
+    "phone": lambda: [
+        {"key": "country", "label": "Country", "type": "select", "values": [[k, f"{v['code']} - {v['name']}"] for k, v in COUNTRIES.items()], "default": "US"},
+        {"key": "include_code", "label": "Include country code", "type": "checkbox", "default": True}
+    ],
+    "address": lambda: [
+        {"key": "country", "label": "Country", "type": "select", "values": [[k, v['name']] for k, v in COUNTRIES.items()], "default": "US"}
+    ],
+    "country": lambda: [
+        {"key": "starts_with", "label": "Starts with", "type": "text", "placeholder": "e.g., U"}
+    ],
+    "city": lambda: [
+        {"key": "country", "label": "Country", "type": "select", "values": [[k, v['name']] for k, v in COUNTRIES.items()], "default": None},
+        {"key": "distribution", "label": "Distribution", "type": "radio", "values": [("uniform", "Uniform"), ("weighted", "Realistic")], "default": "uniform"}
+    ],
+    "zipcode": lambda: [
+        {"key": "country", "label": "Country", "type": "select", "values": [[k, v['name']] for k, v in COUNTRIES.items()], "default": "US"},
+        {"key": "from", "label": "From", "type": "number", "default": 10000},
+        {"key": "to", "label": "To", "type": "number", "default": 99999}
+    ],
+    
+    # Financial & Sensitive
+    "credit_card": lambda: [
+        {"key": "card_type", "label": "Card variant", "type": "select", "values": [("Visa", "Visa"), ("Mastercard", "Mastercard"), ("American Express", "AmEx"), ("Random", "Random")], "default": "Random"},
+        {"key": "valid", "label": "Valid", "type": "radio", "values": [("valid", "Valid"), ("invalid", "Invalid")], "default": "valid"},
+        {"key": "distribution", "label": "Distribution", "type": "radio", "values": [("uniform", "Uniform"), ("weighted", "Realistic")], "default": "uniform"}
+    ],
+    "ssn": lambda: [
+        {"key": "country", "label": "Country", "type": "select", "values": [("US", "US"), ("UK", "UK"), ("Random", "Random")], "default": "US"}
+    ],
+    "barcode": lambda: [
+        {"key": "numeric_only", "label": "Numeric only", "type": "checkbox", "default": True},
+        {"key": "length", "label": "Length", "type": "number", "default": 13, "min": 8, "max": 20}
+    ],
+    "isbn": lambda: [
+        {"key": "format", "label": "Format", "type": "radio", "values": [("isbn10", "ISBN-10"), ("isbn13", "ISBN-13")], "default": "isbn13"}
+    ],
+    
+    # Network & Web
+    "ip": lambda: [
+        {"key": "version", "label": "IP Version", "type": "radio", "values": [("ipv4", "IPv4"), ("ipv6", "IPv6")], "default": "ipv4"}
+    ],
+    "url": lambda: [
+        {"key": "domain", "label": "Domain", "type": "text", "placeholder": "e.g., google"},
+        {"key": "extension", "label": "Extension", "type": "select", "values": [("com", ".com"), ("net", ".net"), ("org", ".org"), ("io", ".io"), ("test", ".test"), ("co", ".co")], "default": "com"},
+        {"key": "protocol", "label": "Protocol", "type": "radio", "values": [("https", "https"), ("http", "http")], "default": "https"}
+    ],
+    
+    # Time & Text
+    "datetime": lambda: [
+        {"key": "include_date", "label": "Date (dd/mm/yyyy)", "type": "checkbox", "default": True},
+        {"key": "include_time", "label": "Time (hh:mm:ss)", "type": "checkbox", "default": True},
+        {"key": "include_timezone", "label": "Timezone (Z)", "type": "checkbox", "default": False}
+    ],
+    "sentence": lambda: [
+        {"key": "grammatically_valid", "label": "Grammatically valid", "type": "checkbox", "default": True}
+    ],
+    "paragraph": lambda: [
+        {"key": "min_sentences", "label": "Min sentences", "type": "number", "default": 3, "min": 1, "max": 10},
+        {"key": "max_sentences", "label": "Max sentences", "type": "number", "default": 6, "min": 1, "max": 20}
+    ],
+    
+    # Colors
+    "hex_color": lambda: [
+        {"key": "uppercase", "label": "Uppercase", "type": "checkbox", "default": True}
+    ],
+    "rgb_color": lambda: [
+        {"key": "min_value", "label": "Min value", "type": "number", "default": 0, "min": 0, "max": 255},
+        {"key": "max_value", "label": "Max value", "type": "number", "default": 255, "min": 0, "max": 255}
+    ],
+    
+    # Work & Organization
+    "company": lambda: [
+        {"key": "starts_with", "label": "Starts with", "type": "text", "placeholder": "e.g., Tech"}
+    ],
+    "job": lambda: [
+        {"key": "seniority", "label": "Seniority", "type": "select", "values": [("any", "Any"), ("junior", "Junior"), ("senior", "Senior"), ("lead", "Lead")], "default": "any"}
+    ],
+}
+
+@lru_cache(maxsize=None)
+def type_options(type_id: str) -> list:
+    """A type's option metadata, built the first time the type is used; [] for types without any"""
+    build = TYPE_OPTIONS.get(type_id)
+    return build() if build else []
+
+# ============ Corpora ============
+
+# Corpus files in TDG_CORPUS_DIR replace the built-in lists (see corpora.py).
+# They are memory-mapped, so large corpora cost no per-process memory.
+REFERENCE_LISTS = {
+    "first_names": lambda: FIRST_NAMES,
+    "last_names": lambda: LAST_NAMES,
+    "job_titles": lambda: JOB_TITLES,
+    "us_streets": lambda: US_STREETS,
+    # Every city, flattened for generation without a country
+    "cities": lambda: [city for cities in CITIES_BY_COUNTRY.values() for city in cities],
+}
+
+@lru_cache(maxsize=None)
+def reference_list(name: str):
+    """A reference list, from its corpus if there is one, loaded the first time it is used"""
+    return load_corpus(name) or REFERENCE_LISTS[name]()
+
+@lru_cache(maxsize=256)
+def country_cities(country: str):
+    """Cities for a country code, from its locale corpus if there is one"""
+    return load_corpus("cities", country) or CITIES_BY_COUNTRY.get(country)
+
+# ============ Filter Indexes ============
+
+# Distinct filter values remembered per view, so arbitrary input can't grow memory
+FILTER_CACHE_SIZE = 1024
+
+def _affix_index(values: list, suffix: bool = False) -> tuple:
+    """Upper-cased keys sorted for bisect, with each key's position in values
+
+    Suffix indexes hold reversed keys, so an ends-with lookup is a prefix lookup.
+    """
+    entries = sorted((value.upper()[::-1] if suffix else value.upper(), i) for i, value in enumerate(values))
+    return [key for key, _ in entries], [i for _, i in entries]
+
+def _affix_matches(index: tuple, needle: str, suffix: bool = False) -> list:
+    """Positions of values starting (or ending) with an upper-cased needle, in list order"""
+    keys, positions = index
+    if suffix:
+        needle = needle[::-1]
+    start = end = bisect_left(keys, needle)
+    while end < len(keys) and keys[end].startswith(needle):
+        end += 1
+    return sorted(positions[start:end])
+
+@lru_cache(maxsize=None)
+def _name_indexes(suffix: bool) -> tuple:
+    """First and last name indexes, built on the first filtered request"""
+    return _affix_index(reference_list("first_names"), suffix), _affix_index(reference_list("last_names"), suffix)
+
+@lru_cache(maxsize=None)
+def _country_index() -> tuple:
+    """Country name index, built on the first starts_with request"""
+    return _affix_index(COUNTRIES_LIST)
+
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
+def _name_matches(starts_with=None, ends_with=None) -> tuple:
+    """(is_last_name, position) of every name matching the filters"""
+    matches = []
+    for needle, suffix in ((starts_with, False), (ends_with, True)):
+        if needle:
+            needle = needle.strip().upper()
+            first_index, last_index = _name_indexes(suffix)
+            matches += [(False, i) for i in _affix_matches(first_index, needle, suffix)]
+            matches += [(True, i) for i in _affix_matches(last_index, needle, suffix)]
+    return tuple(matches)
+
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
+def name_candidates(starts_with=None, ends_with=None) -> tuple:
+    """(first, last) pairs matching the filters; None marks the part drawn at random
+
+    Each matching first name and each matching last name is one candidate.
+    """
+    first_names, last_names = reference_list("first_names"), reference_list("last_names")
+    return tuple((None, last_names[i]) if is_last else (first_names[i], None) for is_last, i in _name_matches(starts_with, ends_with))
+
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
+def country_candidates(starts_with: str) -> tuple:
+    """Distinct countries starting with starts_with, in list order"""
+    matches = _affix_matches(_country_index(), starts_with.strip().upper())
+    return tuple(dict.fromkeys(COUNTRIES_LIST[i] for i in matches))
+
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
+def job_candidates(seniority: str) -> tuple:
+    """Job titles containing the seniority word"""
+    return tuple(j for j in reference_list("job_titles") if seniority.lower() in j.lower())
+
+# ============ Weighted Sampling ============
+
+# Card brand share of purchase volume, used for card_type=Random when weighted
+CARD_BRAND_SHARES = {"Visa": 0.55, "Mastercard": 0.27, "American Express": 0.18}
+CARD_BRANDS = list(CARD_BRAND_SHARES)
+
+@lru_cache(maxsize=None)
+def card_brand_table() -> AliasTable:
+    """Alias table over CARD_BRAND_SHARES, built on the first weighted request"""
+    return AliasTable(list(CARD_BRAND_SHARES.values()))
+
+def _dataset(name: str, locale: str = None):
+    if name == "cities" and locale:
+        return country_cities(locale)
+    return reference_list(name)
+
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
+def dataset_weights(name: str, locale: str = None) -> np.ndarray:
+    """Weights from the corpus' weights file, else Zipf by rank
+
+    The built-in lists are ordered most common first, and name and city
+    frequencies are close to Zipfian.
+    """
+    weights = load_weights(name, locale)
+    if weights is not None:
+        return np.asarray(weights)
+    if name == "cities" and not locale and load_corpus("cities") is None:
+        # Rank cities within their own country, not across the flattened list
+        return np.concatenate([zipf_weights(len(cities)) for cities in CITIES_BY_COUNTRY.values()])
+    return zipf_weights(len(_dataset(name, locale)))
+
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
+def alias_table(name: str, locale: str = None) -> AliasTable:
+    """Alias table for a whole dataset, built once per dataset and locale"""
+    return AliasTable(dataset_weights(name, locale))
+
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
+def name_candidate_table(starts_with=None, ends_with=None) -> AliasTable:
+    """Alias table over name_candidates, weighting each by its name's frequency"""
+    first, last = dataset_weights("first_names"), dataset_weights("last_names")
+    first, last = first / first.sum(), last / last.sum()
+    return AliasTable([last[i] if is_last else first[i] for is_last, i in _name_matches(starts_with, ends_with)])
+
+def _pick(rng, values, table: AliasTable = None):
+    """One value, uniform or drawn from an alias table"""
+    return values[table.draw(rng)] if table else rng.choice(values)
+
+def _picks(rng, values, n: int, table: AliasTable = None) -> list:
+    """n values, uniform or drawn from an alias table"""
+    if table is None:
+        return _choices(rng, values, n)
+    return [values[i] for i in table.sample(rng, n).tolist()]
+
+# ============ Generator Functions ============
+
+def apply_prefix_suffix(value: str, prefix: str = None, suffix: str = None) -> str:
+    """Apply prefix and suffix to a value"""
+    prefix = prefix or ""
+    suffix = suffix or ""
+    if not prefix and not suffix:
+        return value
+    max_len = len(value) - len(prefix) - len(suffix)
+    if max_len < 1:
+        return prefix + suffix
+    return prefix + value[:max_len] + suffix
+
+# Time-ordered ids (UUIDv7, ULID) carry a 48-bit Unix millisecond timestamp
+# followed by 12 bits of sub-millisecond clock ticks (RFC 9562, method 3).
+# Ticks handed out by one process never repeat, so its ids are strictly increasing.
+# Shards generated on the worker pool get their ticks from the parent (see reserve_ticks).
+TICKS_PER_MS = 4096
+TIME_ORDERED_VERSIONS = ("v7", "ulid")
+CROCKFORD_BASE32 = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+_clock_lock = threading.Lock()
+_last_tick = 0
+
+def clock_ticks(n: int) -> int:
+    """First of n consecutive, never-repeated 1/4096 ms ticks at or after now"""
+    global _last_tick
+    now = time.time_ns() * TICKS_PER_MS // 1000000
+    with _clock_lock:
+        start = max(now, _last_tick + 1)
+        _last_tick = start + n - 1
+    return start
+
+def encode_ulid(value: int) -> str:
+    return "".join(CROCKFORD_BASE32[(value >> shift) & 31] for shift in range(125, -1, -5))
+
+def generate_uuid(version="v4", rng=random):
+    if version not in TIME_ORDERED_VERSIONS:
+        if rng is random:
+            return str(uuid.uuid4())
+        return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+    
+    tick = clock_ticks(1)
+    ms, fraction = divmod(tick, TICKS_PER_MS)
+    if version == "v7":
+        bits = secrets.randbits(62) if rng is random else rng.getrandbits(62)
+        return str(uuid.UUID(int=(ms << 80) | (0x7 << 76) | (fraction << 64) | (0b10 << 62) | bits))
+    bits = secrets.randbits(68) if rng is random else rng.getrandbits(68)
+    return encode_ulid((ms << 80) | (fraction << 68) | bits)
+
+def apply_uuid_affixes(value: str, prefix: str = None, suffix: str = None) -> str:
+    """Overwrite the first (up to 8) / last (up to 12) characters of an id with prefix / suffix
+
+    Hyphens are skipped and kept, so the result has the same layout as the id.
+    """
+    positions = [i for i, ch in enumerate(value) if ch != "-"]
+    chars = list(value)
+    prefix, suffix = (prefix or "")[:8], (suffix or "")[:12]
+    for i, ch in zip(positions, prefix):
+        chars[i] = ch
+    for i, ch in zip(positions[len(positions) - len(suffix):], suffix):
+        chars[i] = ch
+    return "".join(chars)
+
+def generate_phone(country="US", include_code=True, rng=random):
+    c = COUNTRIES.get(country, COUNTRIES["US"])
+    code = c["code"]
+    
+    if country in ["US", "CA"]:
+        num = f"({rng.randint(200, 999)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}"
+        return f"{code} {num}" if include_code else num
+    elif country == "IN":
+        num = str(rng.randint(7000000000, 9999999999))
+        return f"{code} {num}" if include_code else num
+    elif country == "GB":
+        num = f"{rng.randint(20, 99)} {rng.randint(1000, 9999)} {rng.randint(100, 999)}"
+        return f"{code} {num}" if include_code else num
+    else:
+        num = str(rng.randint(100000000, 999999999))
+        return f"{code} {num}" if include_code else num
+
+def generate_email(domain=None, extension=None, rng=random):
+    # Ensure extension has a dot prefix
+    if extension and not extension.startswith('.'):
+        extension = '.' + extension
+    
+    if domain and extension:
+        return f"{rng.choice(EMAIL_NAMES).lower()}{rng.randint(1, 999)}@{domain}{extension}"
+    elif domain:
+        # If no explicit extension but domain is provided, use domain as-is (no TLD)
+        return f"{rng.choice(EMAIL_NAMES).lower()}{rng.randint(1, 999)}@{domain}"
+    elif extension:
+        return f"{rng.choice(EMAIL_NAMES).lower()}{rng.randint(1, 999)}@example{extension}"
+    else:
+        return f"{rng.choice(EMAIL_NAMES).lower()}{rng.randint(1, 999)}@{rng.choice(EMAIL_PROVIDERS)}"
+
+def generate_address(country="US", rng=random):
+    # Street numbers and streets
+    street_num = rng.randint(1, 9999)
+    
+    # Country-specific addresses
+    if country == "US":
+        streets = ["Main St", "Oak Ave", "Park Blvd", "First St", "Elm St", "Maple Dr", "Cedar Ln", "Pine St", "Washington St", "Lake Dr"]
+        cities = ["New York", "Los Angeles", "Chicago", "Houston", "Phoenix", "Philadelphia", "San Antonio", "San Diego", "Dallas", "San Jose"]
+        states = ["CA", "NY", "TX", "FL", "IL", "PA", "OH", "GA", "NC", "MI"]
+        zip_code = rng.randint(10000, 99999)
+        return f"{street_num} {rng.choice(streets)}, {rng.choice(cities)}, {rng.choice(states)} {zip_code}"
+    
+    elif country == "UK":
+        streets = ["High Street", "Station Road", "London Road", "Victoria Road", "Church Lane", "Manor Road", "Park Road", "Queens Road"]
+        cities = ["London", "Manchester", "Birmingham", "Edinburgh", "Glasgow", "Liverpool", "Bristol", "Leeds"]
+        postcodes = ["SW1A", "EC1A", "W1A", "M1", "B1", "EH1", "G1", "L1", "BS1", "LS1"]
+        return f"{rng.randint(1, 200)} {rng.choice(streets)}, {rng.choice(cities)}, {rng.choice(postcodes)}"
+    
+    elif country == "DE":
+        streets = ["Hauptstraße", "Bahnhofstraße", "Schulstraße", "Gartenstraße", "Dorfstraße", "Bergstraße", "Waldstraße", "Kirchstraße"]
+        cities = ["Berlin", "Munich", "Hamburg", "Frankfurt", "Cologne", "Stuttgart", "Düsseldorf", "Dortmund"]
+        return f"{rng.randint(1, 200)} {rng.choice(streets)}, {rng.choice(cities)}, {rng.randint(10000, 99999)}"
+    
+    elif country == "FR":
+        streets = ["Rue de la Paix", "Avenue des Champs-Élysées", "Boulevard Saint-Michel", "Rue Victor Hugo", "Rue du Commerce"]
+        cities = ["Paris", "Lyon", "Marseille", "Toulouse", "Nice", "Nantes", "Strasbourg", "Bordeaux"]
+        return f"{rng.randint(1, 200)} {rng.choice(streets)}, {rng.choice(cities)}, {rng.randint(10000, 99999)}"
+    
+    elif country == "IN":
+        streets = ["MG Road", "Ring Road", "Main Market", "Sector Road", "College Road", "Station Road"]
+        cities = ["Mumbai", "Delhi", "Bangalore", "Chennai", "Kolkata", "Hyderabad", "Pune", "Ahmedabad"]
+        pincode = rng.randint(100000, 999999)
+        return f"{rng.randint(1, 999)} {rng.choice(streets)}, {rng.choice(cities)} - {pincode}"
+    
+    elif country == "AU":
+        streets = ["George St", "Queen St", "King St", "Elizabeth St", "Bourke St", "Collins St"]
+        cities = ["Sydney", "Melbourne", "Brisbane", "Perth", "Adelaide", "Canberra", "Hobart", "Darwin"]
+        postcode = rng.randint(1000, 9999)
+        return f"{rng.randint(1, 999)} {rng.choice(streets)}, {rng.choice(cities)} {postcode}"
+    
+    elif country == "CA":
+        streets = ["Yonge St", "Queen St", "King St", "Dundas St", "Bloor St", "Huntington Ave"]
+        cities = ["Toronto", "Vancouver", "Montreal", "Calgary", "Ottawa", "Edmonton", "Winnipeg", "Halifax"]
+        postal = f"{rng.choice(['M','V','H','K','L','N'])}{rng.randint(1, 9)}{rng.choice(['A','B','C','D','E','F','G','H','J','K','L','M','N','P','R','S','T','V','W','X','Y'])}{rng.randint(1, 9)}{rng.choice(['A','B','C','D','E','F','G','H','J','K','L','M','N','P','R','S','T','V','W','X','Y'])}{rng.randint(1, 9)}"
+        return f"{rng.randint(1, 999)} {rng.choice(streets)}, {rng.choice(cities)}, {postal}"
+    
+    elif country == "JP":
+        streets = ["Main Street", "Cherry Blossom Ave", "Central Blvd", "Garden Road", "Temple Street"]
+        cities = ["Tokyo", "Osaka", "Kyoto", "Yokohama", "Nagoya", "Sapporo", "Fukuoka", "Kobe"]
+        return f"{rng.randint(1, 999)}-{rng.randint(1, 99)} {rng.choice(streets)}, {rng.choice(cities)}, {rng.randint(100, 999)}"
+    
+    elif country == "BR":
+        streets = ["Avenida Paulista", "Rua das Flores", "Avenida Brasil", "Rua 25 de Março", "Avenida Copacabana"]
+        cities = ["São Paulo", "Rio de Janeiro", "Brasília", "Salvador", "Fortaleza", "Belo Horizonte", "Manaus", "Curitiba"]
+        cep = f"{rng.randint(10000, 99999)}-{rng.randint(100, 999)}"
+        return f"{rng.randint(1, 9999)} {rng.choice(streets)}, {rng.choice(cities)} - {cep}"
+    
+    elif country == "IT":
+        streets = ["Via Roma", "Corso Italia", "Via Garibaldi", "Piazza del Duomo", "Via del Corso"]
+        cities = ["Rome", "Milan", "Naples", "Turin", "Florence", "Venice", "Bologna", "Genoa"]
+        return f"{rng.randint(1, 200)} {rng.choice(streets)}, {rng.choice(cities)}, {rng.randint(10000, 99999)}"
+    
+    elif country == "ES":
+        streets = ["Gran Vía", "Paseo de la Castellana", "Avenida de la Constitución", "Calle Mayor", "Rambla de Barcelona"]
+        cities = ["Madrid", "Barcelona", "Valencia", "Seville", "Bilbao", "Málaga", "Murcia", "Palma"]
+        return f"{rng.randint(1, 200)} {rng.choice(streets)}, {rng.choice(cities)}, {rng.randint(10000, 52999)}"
+    
+    elif country == "MX":
+        streets = ["Paseo de la Reforma", "Avenida Insurgentes", "Calle Madero", "Avenida Chapultepec", "Gran Avenida"]
+        cities = ["Mexico City", "Guadalajara", "Monterrey", "Cancún", "Puebla", "Tijuana", "Córdoba", "Veracruz"]
+        cp = rng.randint(10000, 99999)
+        return f"{rng.randint(1, 9999)} {rng.choice(streets)}, {rng.choice(cities)}, CP {cp}"
+    
+    elif country == "CN":
+        streets = ["Nanjing Road", "Beijing Road", "Shanghai Street", "Guangzhou Avenue", "Shenzhen Boulevard"]
+        cities = ["Beijing", "Shanghai", "Guangzhou", "Shenzhen", "Chengdu", "Hangzhou", "Wuhan", "Nanjing"]
+        return f"{rng.randint(1, 999)} {rng.choice(streets)}, {rng.choice(cities)}, {rng.randint(100000, 999999)}"
+    
+    elif country == "RU":
+        streets = ["Tverskaya Street", "Arbat Street", "Nevsky Prospect", "Lenin Street", "Gorky Street"]
+        cities = ["Moscow", "Saint Petersburg", "Novosibirsk", "Yekaterinburg", "Nizhny Novgorod", "Kazan", "Chelyabinsk", "Omsk"]
+        return f"{rng.randint(1, 200)} {rng.choice(streets)}, {rng.choice(cities)}, {rng.randint(100000, 999999)}"
+    
+    elif country == "NL":
+        streets = ["Damrak", "Kalverstraat", "Rokin", "Leidsestraat", "PC Hooftstraat"]
+        cities = ["Amsterdam", "Rotterdam", "The Hague", "Utrecht", "Eindhoven", "Groningen", "Tilburg", "Almere"]
+        return f"{rng.randint(1, 200)} {rng.choice(streets)}, {rng.choice(cities)}, {rng.randint(1000, 9999)}"
+    
+    elif country == "SE":
+        streets = ["Drottninggatan", "Sveavägen", "Göta Boulevard", "Kungsgatan", "Storgatan"]
+        cities = ["Stockholm", "Gothenburg", "Malmö", "Uppsala", "Västerås", "Örebro", "Linköping", "Helsingborg"]
+        return f"{rng.randint(1, 200)} {rng.choice(streets)}, {rng.choice(cities)}, {rng.randint(11111, 99999)}"
+    
+    elif country == "SG":
+        streets = ["Orchard Road", "Marina Bay", "Bugis Street", "Clarke Quay", "Havelock Road"]
+        return f"{rng.randint(1, 999)} {rng.choice(streets)}, Singapore {rng.randint(100000, 999999)}"
+    
+    elif country == "AE":
+        streets = ["Sheikh Zayed Road", "Al Diyafah Street", "Jumeirah Beach Road", "Deira Corniche", "Business Bay"]
+        cities = ["Dubai", "Abu Dhabi", "Sharjah", "Al Ain", "Ajman", "Ras Al Khaimah"]
+        return f"{rng.randint(1, 999)} {rng.choice(streets)}, {rng.choice(cities)}"
+    
+    elif country == "ZA":
+        streets = ["Sandton City", "Oxford Street", "Main Road", "Long Street", "Kloof Street"]
+        cities = ["Johannesburg", "Cape Town", "Durban", "Pretoria", "Port Elizabeth", "Bloemfontein"]
+        return f"{rng.randint(1, 999)} {rng.choice(streets)}, {rng.choice(cities)}, {rng.randint(1000, 9999)}"
+    
+    else:
+        # Default US-style address for unspecified countries
+        streets = reference_list("us_streets")
+        return f"{street_num} {rng.choice(streets)}, {rng.choice(CITIES[:10])}, {rng.randint(10000, 99999)}"
+
+def generate_name(starts_with=None, ends_with=None, distribution="uniform", rng=random):
+    weighted = distribution == "weighted"
+    candidates = name_candidates(starts_with, ends_with) if starts_with or ends_with else ()
+    first_names, last_names = reference_list("first_names"), reference_list("last_names")
+    first_table = alias_table("first_names") if weighted else None
+    last_table = alias_table("last_names") if weighted else None
+    
+    # Pick a matching first or last name and fill in the other part
+    if candidates:
+        first, last = _pick(rng, candidates, name_candidate_table(starts_with, ends_with) if weighted else None)
+        return f"{first or _pick(rng, first_names, first_table)} {last or _pick(rng, last_names, last_table)}"
+    
+    # Otherwise return random name
+    return f"{_pick(rng, first_names, first_table)} {_pick(rng, last_names, last_table)}"
+
+def generate_imei(brand="Generic", valid_checksum=True, rng=random):
+    if brand == "Generic":
+        tac = str(rng.randint(35, 86))
+    else:
+        tac = IMEI_BRANDS.get(brand, "35")
+    
+    imei = tac + "".join([str(rng.randint(0, 9)) for _ in range(12)])
+    
+    if not valid_checksum:
+        return imei + str((int(imei[-1]) + 1) % 10)
+    
+    total = 0
+    doubled = True
+    for digit in imei[::-1]:
+        d = int(digit) * (2 if doubled else 1)
+        total += d if d < 10 else d - 9
+        doubled = not doubled
+    check = (10 - (total % 10)) % 10
+    return imei + str(check)
+
+def generate_mac_address(uppercase=True, separator=":", rng=random):
+    parts = [f"{rng.randint(0, 255):02x}" for _ in range(6)]
+    result = separator.join(parts)
+    return result.upper() if uppercase else result
+
+def generate_credit_card(card_type="Random", valid=True, distribution="uniform", rng=random):
+    if card_type == "Random":
+        card_type = _pick(rng, CARD_BRANDS, card_brand_table() if distribution == "weighted" else None)
+    
+    config = CREDIT_CARD_TYPES.get(card_type, CREDIT_CARD_TYPES["Visa"])
+    prefix = config["prefix"]
+    if isinstance(prefix, list):
+        prefix = rng.choice(prefix)
+    length = config["length"]
+    
+    cc = prefix
+    while len(cc) < length - 1:
+        cc += str(rng.randint(0, 9))
+    
+    total = 0
+    doubled = True
+    for digit in cc[::-1]:
+        d = int(digit) * (2 if doubled else 1)
+        if d > 9: d -= 9
+        total += d
+        doubled = not doubled
+    check = (10 - (total % 10)) % 10
+    cc += str(check)
+    
+    if not valid:
+        cc = cc[:-1] + str((int(cc[-1]) + 1) % 10)
+    
+    if card_type == "American Express":
+        return f"{cc[:4]}-{cc[4:10]}-{cc[10:]}"
+    else:
+        return "-".join([cc[i:i+4] for i in range(0, len(cc), 4)])
+
+def generate_ssn(country="US", rng=random):
+    if country == "US":
+        return f"{rng.randint(100, 999)}-{rng.randint(10, 99)}-{rng.randint(1000, 9999)}"
+    elif country == "UK":
+        return f"{rng.randint(10, 99)} {rng.randint(100000, 999999)} {rng.randint(100000, 999999)}"
+    else:
+        return f"{rng.randint(100, 999)}-{rng.randint(10, 99)}-{rng.randint(1000, 9999)}"
+
+def generate_barcode(numeric_only=True, length=13, rng=random):
+    if numeric_only:
+        return "".join([str(rng.randint(0, 9)) for _ in range(length)])
+    else:
+        chars = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+        return "".join([rng.choice(chars) for _ in range(length)])
+
+def generate_isbn(format="isbn13", rng=random):
+    if format == "isbn10":
+        digits = "".join([str(rng.randint(0, 9)) for _ in range(9)])
+        total = sum((10 - i) * int(d) for i, d in enumerate(digits))
+        check = (11 - (total % 11)) % 11
+        check_char = 'X' if check == 10 else str(check)
+        return f"{digits[:1]}-{digits[1:6]}-{digits[6:10]}-{check_char}"
+    else:
+        # ISBN-13: 12 digits + check digit = 13 total
+        prefix = "978" + "".join([str(rng.randint(0, 9)) for _ in range(9)])
+        total = sum((3 if i % 2 else 1) * int(d) for i, d in enumerate(prefix))
+        check = (10 - (total % 10)) % 10
+        return f"{prefix[:3]}-{prefix[3:5]}-{prefix[5:10]}-{prefix[10:12]}-{prefix[12:]}{check}"
+
+def generate_ip(version="ipv4", rng=random):
+    if version == "ipv6":
+        return ":".join([f"{rng.randint(0, 65535):x}" for _ in range(8)])
+    return f"{rng.randint(1, 255)}.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(0, 255)}"
+
+def generate_url(domain=None, extension="com", protocol="https", rng=random):
+    if domain:
+        dom = domain
+    else:
+        dom = rng.choice(URL_DOMAINS)
+    path = rng.choice(URL_PATHS)
+    return f"{protocol}://{dom}.{extension}/{path}"
+
+def generate_datetime(include_date=True, include_time=True, include_timezone=False, rng=random):
+    year = rng.randint(2020, 2025)
+    month = rng.randint(1, 12)
+    day = rng.randint(1, 28)
+    hour = rng.randint(0, 23)
+    minute = rng.randint(0, 59)
+    second = rng.randint(0, 59)
+    millisecond = rng.randint(0, 999)
+    
+    # ISO 8601 format: YYYY-MM-DDThh:mm:ss.sssZ
+    date_str = f"{year:04d}-{month:02d}-{day:02d}"
+    time_str = f"{hour:02d}:{minute:02d}:{second:02d}.{millisecond:03d}"
+    
+    if include_date and include_time:
+        result = f"{date_str}T{time_str}"
+    elif include_date:
+        result = date_str
+    elif include_time:
+        result = time_str
+    else:
+        result = ""
+    
+    if include_timezone and result:
+        result += "Z"
+    
+    return result
+
+def generate_sentence(grammatically_valid=True, rng=random):
+    if grammatically_valid:
+        return f"{rng.choice(SENTENCE_SUBJECTS)} {rng.choice(SENTENCE_VERBS)} {rng.choice(SENTENCE_OBJECTS)}."
+    else:
+        words = TEXT_WORDS
+        sentence = " ".join([rng.choice(words) for _ in range(rng.randint(5, 12))])
+        return sentence[0].upper() + sentence[1:] + "."
+
+def generate_paragraph(min_sentences=3, max_sentences=6, rng=random):
+    sentences = []
+    for _ in range(rng.randint(min_sentences, max_sentences)):
+        sentences.append(generate_sentence(grammatically_valid=True, rng=rng))
+    return " ".join(sentences)
+
+def generate_hex_color(uppercase=True, rng=random):
+    color = "#" + "".join([f"{rng.randint(0, 255):02x}" for _ in range(3)])
+    return color.upper() if uppercase else color
+
+def generate_rgb_color(min_value=0, max_value=255, rng=random):
+    r = rng.randint(min_value, max_value)
+    g = rng.randint(min_value, max_value)
+    b = rng.randint(min_value, max_value)
+    return f"rgb({r}, {g}, {b})"
+
+def generate_company(starts_with=None, rng=random):
+    name = rng.choice(USERNAME_ADJ).capitalize() + " " + rng.choice(COMPANY_WORDS)
+    if starts_with:
+        if starts_with.strip().upper() in name.upper():
+            return name
+        return starts_with + name
+    return name
+
+def generate_job(seniority="any", rng=random):
+    if seniority != "any":
+        jobs = job_candidates(seniority)
+        if jobs:
+            return rng.choice(jobs)
+    return rng.choice(reference_list("job_titles"))
+
+# Unseeded passwords come from the OS CSPRNG; seeded ones from the seed, so they can be reproduced
+_SYSTEM_RANDOM = random.SystemRandom()
+
+def generate_password(uppercase=True, lowercase=True, numbers=True, special=False, length=16,
+                      require_each=False, rng=random):
+    rng = _SYSTEM_RANDOM if rng is random else rng
+    classes = password_classes(uppercase, lowercase, numbers, special)
+    charset = "".join(classes)
+    # One character from each class in a random position; the rest from the whole charset
+    chars = [rng.choice(cls) for cls in classes] if require_each else []
+    chars += [rng.choice(charset) for _ in range(length - len(chars))]
+    rng.shuffle(chars)
+    return "".join(chars)
+
+def password_classes(uppercase=True, lowercase=True, numbers=True, special=False) -> list:
+    classes = []
+    if uppercase:
+        classes.append("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+    if lowercase:
+        classes.append("abcdefghijklmnopqrstuvwxyz")
+    if numbers:
+        classes.append("0123456789")
+    if special:
+        classes.append("!@#$%^&*()_+-=[]{}|;:,.<>?")
+    
+    if not classes:
+        classes.append("abcdefghijklmnopqrstuvwxyz")
+    
+    return classes
+
+def password_charset(uppercase=True, lowercase=True, numbers=True, special=False):
+    return "".join(password_classes(uppercase, lowercase, numbers, special))
+
+def generate_username(prefix=None, style="name_year", rng=random):
+    name = rng.choice(USERNAME_NAMES)
+    adj = rng.choice(USERNAME_ADJ)
+    noun = rng.choice(USERNAME_NOUN)
+    
+    if style == "name_year":
+        result = f"{name}{rng.randint(1, 99)}"
+    elif style == "adj_noun":
+        result = f"{adj}_{noun}"
+    elif style == "name_random":
+        result = f"{name}.{rng.randint(100, 999)}"
+    else:
+        result = f"mrx_{name}"
+    
+    return (prefix or "") + result
+
+def generate_country(starts_with=None, rng=random):
+    """Generate country - unique names"""
+    if starts_with:
+        candidates = country_candidates(starts_with)
+        if candidates:
+            return rng.choice(candidates)
+    # Return unique country from full list
+    return rng.choice(COUNTRIES_LIST)
+
+def generate_city(country=None, distribution="uniform", rng=random):
+    """Generate city based on country selection"""
+    weighted = distribution == "weighted"
+    
+    cities = country_cities(country) if country else None
+    if cities:
+        return _pick(rng, cities, alias_table("cities", country) if weighted else None)
+    
+    # Return random city from all cities if no country specified
+    return _pick(rng, reference_list("cities"), alias_table("cities") if weighted else None)
+
+def generate_zipcode(country=None, zip_from=10000, zip_to=99999, rng=random):
+    """Generate zipcode based on from/to range"""
+    # Convert to integers in case they come as strings
+    zip_from = int(zip_from) if zip_from else 10000
+    zip_to = int(zip_to) if zip_to else 99999
+    
+    # Handle case where from > to by swapping
+    if zip_from > zip_to:
+        zip_from, zip_to = zip_to, zip_from
+    
+    # Generate random zipcode within range
+    zip_code = rng.randint(zip_from, zip_to)
+    return str(zip_code)
+
+def generate_street(rng=random):
+    street = rng.choice(reference_list("us_streets"))
+    return f"{rng.randint(100, 9999)} {street}"
+
+def generate_text(length=5, rng=random):
+    return " ".join(rng.choice(TEXT_WORDS) for _ in range(length))
+
+# ============ Batch Generators ============
+#
+# Each generate_*_batch(n, ...) returns a list of n values and accepts the
+# same options as its single-value counterpart. Random draws are made for
+# the whole batch at once and fixed-width values are assembled as uint8
+# character matrices, so the per-value Python work is a single slice.
+
+class UnseededGenerator(np.random.Generator):
+    """A NumPy generator seeded from OS entropy, for shards of jobs without a seed
+
+    Password batches read their entropy from a CSPRNG instead of drawing from it.
+    """
+
+def unseeded_rng() -> UnseededGenerator:
+    """A fresh generator for one unseeded shard, so concurrent jobs never share random state"""
+    return UnseededGenerator(np.random.PCG64())
+
+# Default for batch generators called without an rng, outside of any job
+NP_RNG = unseeded_rng()
+
+# Rows per shard of a seeded job. Each shard draws from its own substream, so
+# a job split across any number of workers reproduces the single-worker output.
+SHARD_ROWS = 10000
+
+def shard_rng(seed: int, shard: int, stream: int = 0):
+    """Independent NumPy generator for one shard of a seeded job"""
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(stream, shard)))
+
+def shard_py_rng(seed: int, shard: int, stream: int = 0) -> random.Random:
+    """Independent random.Random for one shard of a seeded job"""
+    return random.Random(int(shard_rng(seed, shard, stream).integers(0, 1 << 63)))
+
+_HEX_LOWER = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+_HEX_UPPER = np.frombuffer(b"0123456789ABCDEF", dtype=np.uint8)
+_ALNUM = np.frombuffer(b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ", dtype=np.uint8)
+_LUHN_DOUBLE = np.array([0, 2, 4, 6, 8, 1, 3, 5, 7, 9], dtype=np.uint8)
+_BYTE_STRS = tuple(str(i) for i in range(256))
+
+def _strings(chars) -> list:
+    """Split an (n, width) uint8 matrix of UTF-8 bytes into n strings"""
+    n = chars.shape[0]
+    if n == 0:
+        return []
+    blob = np.ascontiguousarray(chars).tobytes().decode("utf-8")
+    # Every row has the same layout, so rows decode to equal-length strings
+    width = len(blob) // n
+    if width == 0:
+        return [""] * n
+    return [blob[i:i + width] for i in range(0, len(blob), width)]
+
+def _join_columns(n: int, parts: list) -> list:
+    """Concatenate literal strings and (n, w) uint8 blocks column-wise into n strings"""
+    blocks = []
+    for part in parts:
+        if isinstance(part, str):
+            if part:
+                literal = np.frombuffer(part.encode("utf-8"), dtype=np.uint8)
+                blocks.append(np.broadcast_to(literal, (n, literal.size)))
+        else:
+            blocks.append(part)
+    if not blocks:
+        return [""] * n
+    return _strings(np.concatenate(blocks, axis=1))
+
+def _grouped(chars, widths: list, separator: str) -> list:
+    """Split each row of a char matrix into groups joined by separator"""
+    parts = []
+    start = 0
+    for i, width in enumerate(widths):
+        if i:
+            parts.append(separator)
+        parts.append(chars[:, start:start + width])
+        start += width
+    return _join_columns(chars.shape[0], parts)
+
+def _random_digits(rng, n: int, width: int):
+    return rng.integers(0, 10, size=(n, width), dtype=np.uint8)
+
+def _int_chars(rng, n: int, low: int, high: int, width: int):
+    """Draw n integers in [low, high] as a zero-padded (n, width) digit char matrix"""
+    values = rng.integers(low, high + 1, size=n, dtype=np.int64)
+    powers = 10 ** np.arange(width - 1, -1, -1, dtype=np.int64)
+    return ((values[:, None] // powers) % 10 + 48).astype(np.uint8)
+
+def _luhn_check_digits(digits):
+    """Luhn check digit for each row of an (n, k) digit matrix"""
+    k = digits.shape[1]
+    # The rightmost payload digit is doubled, then every other one to its left
+    doubled = (np.arange(k) % 2) == ((k - 1) % 2)
+    total = np.where(doubled, _LUHN_DOUBLE[digits], digits).sum(axis=1, dtype=np.int64)
+    return ((10 - total % 10) % 10).astype(np.uint8)
+
+def _choices(rng, values, n: int) -> list:
+    """n uniform picks from a sequence"""
+    return [values[i] for i in rng.integers(0, len(values), size=n).tolist()]
+
+def _repeat(rng, func, n: int, **kwargs) -> list:
+    """Batch fallback for generators whose output shape varies per value"""
+    # Seed a Python RNG from the batch generator so seeded batches stay reproducible
+    py_rng = random.Random(int(rng.integers(0, 1 << 63)))
+    return [func(rng=py_rng, **kwargs) for _ in range(n)]
+
+def generate_uuid_batch(n, version="v4", rng=NP_RNG, first_tick=None):
+    if version in TIME_ORDERED_VERSIONS:
+        return _time_ordered_batch(n, version, rng, first_tick)
+    raw = rng.integers(0, 256, size=(n, 16), dtype=np.uint8)
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40  # version 4
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+    return _uuid_strings(raw)
+
+def _uuid_strings(raw) -> list:
+    """Format an (n, 16) byte matrix as 8-4-4-4-12 hex UUIDs"""
+    chars = np.empty((raw.shape[0], 32), dtype=np.uint8)
+    chars[:, 0::2] = _HEX_LOWER[raw >> 4]
+    chars[:, 1::2] = _HEX_LOWER[raw & 0x0F]
+    return _grouped(chars, [8, 4, 4, 4, 12], "-")
+
+_CROCKFORD = np.frombuffer(CROCKFORD_BASE32.encode(), dtype=np.uint8)
+
+def _time_ordered_batch(n: int, version: str, rng, first_tick: int = None) -> list:
+    """UUIDv7s or ULIDs for n consecutive clock ticks, with entropy from one rng read"""
+    raw = np.frombuffer(rng.bytes(16 * n), dtype=np.uint8).reshape(n, 16).copy()
+    if first_tick is None:
+        first_tick = clock_ticks(n)
+    ticks = np.uint64(first_tick) + np.arange(n, dtype=np.uint64)
+    ms, fraction = ticks >> np.uint64(12), ticks & np.uint64(0xFFF)
+    if version == "v7":
+        raw[:, :6] = ms.astype(">u8").view(np.uint8).reshape(n, 8)[:, 2:]
+        raw[:, 6] = 0x70 | (fraction >> np.uint64(8)).astype(np.uint8)  # version 7
+        raw[:, 7] = (fraction & np.uint64(0xFF)).astype(np.uint8)
+        raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+        return _uuid_strings(raw)
+    
+    # ULID: 26 Crockford base32 digits of 128 bits, the first digit holding 3 bits
+    words = raw.view(">u8").astype(np.uint64)
+    high = (ms << np.uint64(16)) | (fraction << np.uint64(4)) | (words[:, 0] & np.uint64(0xF))
+    low = words[:, 1]
+    chars = np.empty((n, 26), dtype=np.uint8)
+    for i, shift in enumerate(range(125, -1, -5)):
+        if shift >= 64:
+            digits = high >> np.uint64(shift - 64)
+        elif shift > 59:
+            digits = (low >> np.uint64(shift)) | (high << np.uint64(64 - shift))
+        else:
+            digits = low >> np.uint64(shift)
+        chars[:, i] = _CROCKFORD[(digits & np.uint64(31)).astype(np.intp)]
+    return _strings(chars)
+
+def apply_uuid_affixes_batch(values: list, prefix: str = None, suffix: str = None) -> list:
+    """apply_uuid_affixes for a batch, done on a byte matrix of the formatted ids"""
+    affixes = (prefix or "")[:8] + (suffix or "")[:12]
+    if not values or not affixes.isascii():
+        return [apply_uuid_affixes(value, prefix, suffix) for value in values]
+    chars = np.frombuffer("".join(values).encode("ascii"), dtype=np.uint8).reshape(len(values), -1).copy()
+    positions = np.flatnonzero(chars[0] != ord("-"))
+    if prefix:
+        head = prefix[:8].encode("ascii")
+        chars[:, positions[:len(head)]] = np.frombuffer(head, dtype=np.uint8)
+    if suffix:
+        tail = suffix[:12].encode("ascii")
+        chars[:, positions[len(positions) - len(tail):]] = np.frombuffer(tail, dtype=np.uint8)
+    return _strings(chars)
+
+@lru_cache(maxsize=None)
+def _chacha20():
+    """ChaCha20 from the cryptography package, imported on first use; None if it is not installed"""
+    try:
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms
+    except ImportError:
+        # Optional: without it, unseeded batches read all their entropy from os.urandom
+        return None
+    return lambda key, nonce: Cipher(algorithms.ChaCha20(key, nonce), mode=None).encryptor()
+
+def _secure_bytes(nbytes: int) -> bytes:
+    """nbytes from a CSPRNG: a ChaCha20 keystream keyed from os.urandom, else os.urandom itself
+
+    A fresh key per call keeps no state between calls or threads, and the
+    keystream is several times faster than reading os.urandom directly.
+    """
+    chacha20 = _chacha20()
+    if chacha20 is None:
+        return os.urandom(nbytes)
+    return chacha20(os.urandom(32), os.urandom(16)).update(bytes(nbytes))
+
+def _entropy(rng, nbytes: int):
+    """nbytes random bytes: a CSPRNG for unseeded batches, the seeded generator otherwise"""
+    data = _secure_bytes(nbytes) if isinstance(rng, UnseededGenerator) else rng.bytes(nbytes)
+    return np.frombuffer(data, dtype=np.uint8)
+
+@lru_cache(maxsize=64)
+def _pair_table(chars: bytes) -> np.ndarray:
+    """Every two-character string over chars as a uint16, indexed by first * len(chars) + second"""
+    table = np.frombuffer(chars, dtype=np.uint8)
+    pairs = np.empty((table.size, table.size, 2), dtype=np.uint8)
+    pairs[:, :, 0] = table[:, None]
+    pairs[:, :, 1] = table[None, :]
+    return pairs.view("<u2").reshape(-1)
+
+def _uniform_choice(rng, table, count: int):
+    """count bytes drawn uniformly from table (at most 256 entries), by rejection sampling
+
+    Each random 32-bit word is read as per_word base len(table)**2 digits,
+    so one word gives 2 * per_word characters through a table of character
+    pairs. Words at or above the largest multiple of len(table)**(2 * per_word)
+    are redrawn, so every digit is exactly uniform.
+    """
+    k = table.size
+    if k == 1:
+        return np.full(count, table[0], dtype=np.uint8)
+    pairs = _pair_table(table.tobytes())
+    per_word = 1
+    while (k * k) ** (per_word + 1) < 1 << 32:
+        per_word += 1
+    span = (k * k) ** per_word
+    limit = (1 << 32) // span * span
+    nwords = -(-count // (2 * per_word))
+    raw = _entropy(rng, 4 * nwords).view("<u4")
+    words = raw % np.uint32(span)
+    rejected = np.flatnonzero(raw >= limit)
+    while rejected.size:
+        raw = _entropy(rng, 4 * rejected.size).view("<u4")
+        accepted = raw < limit
+        words[rejected[accepted]] = raw[accepted] % np.uint32(span)
+        rejected = rejected[~accepted]
+    out = np.empty((per_word, nwords), dtype="<u2")
+    base = np.uint32(k * k)
+    for digit in range(per_word - 1):
+        rest = words // base
+        np.take(pairs, words - rest * base, out=out[digit])
+        words = rest
+    np.take(pairs, words, out=out[per_word - 1])
+    return out.view(np.uint8).reshape(-1)[:count]
+
+def generate_password_batch(n, uppercase=True, lowercase=True, numbers=True, special=False, length=16,
+                            require_each=False, rng=NP_RNG):
+    classes = password_classes(uppercase, lowercase, numbers, special)
+    table = np.frombuffer("".join(classes).encode(), dtype=np.uint8)
+    chars = _uniform_choice(rng, table, n * length).reshape(n, length)
+    if require_each:
+        # One character of each class at distinct random positions, picked by
+        # the first len(classes) steps of a Fisher-Yates shuffle of each row
+        rows = np.arange(n)
+        positions = np.tile(np.arange(length, dtype=np.uint8), (n, 1))
+        for step, cls in enumerate(classes):
+            swap = step + _uniform_choice(rng, np.arange(length - step, dtype=np.uint8), n)
+            positions[rows, step], positions[rows, swap] = positions[rows, swap], positions[rows, step]
+            chars[rows, positions[:, step]] = _uniform_choice(rng, np.frombuffer(cls.encode(), dtype=np.uint8), n)
+    return _strings(chars)
+
+def generate_username_batch(n, prefix=None, style="name_year", rng=NP_RNG):
+    prefix = prefix or ""
+    if style == "name_year":
+        nums = rng.integers(1, 100, size=n).tolist()
+        return [f"{prefix}{name}{num}" for name, num in zip(_choices(rng, USERNAME_NAMES, n), nums)]
+    elif style == "adj_noun":
+        return [f"{prefix}{adj}_{noun}" for adj, noun in zip(_choices(rng, USERNAME_ADJ, n), _choices(rng, USERNAME_NOUN, n))]
+    elif style == "name_random":
+        nums = rng.integers(100, 1000, size=n).tolist()
+        return [f"{prefix}{name}.{num}" for name, num in zip(_choices(rng, USERNAME_NAMES, n), nums)]
+    return [f"{prefix}mrx_{name}" for name in _choices(rng, USERNAME_NAMES, n)]
+
+def generate_imei_batch(n, brand="Generic", valid_checksum=True, rng=NP_RNG):
+    if brand == "Generic":
+        tac = _int_chars(rng, n, 35, 86, 2) - 48
+    else:
+        code = np.frombuffer(IMEI_BRANDS.get(brand, "35").encode(), dtype=np.uint8) - 48
+        tac = np.broadcast_to(code, (n, code.size))
+    digits = np.concatenate([tac, _random_digits(rng, n, 12)], axis=1)
+    
+    if valid_checksum:
+        check = _luhn_check_digits(digits)
+    else:
+        check = (digits[:, -1] + 1) % 10
+    return _strings(np.concatenate([digits, check[:, None]], axis=1) + 48)
+
+def generate_mac_address_batch(n, uppercase=True, separator=":", rng=NP_RNG):
+    hex_table = _HEX_UPPER if uppercase else _HEX_LOWER
+    octets = rng.integers(0, 256, size=(n, 6), dtype=np.uint8)
+    chars = np.empty((n, 12), dtype=np.uint8)
+    chars[:, 0::2] = hex_table[octets >> 4]
+    chars[:, 1::2] = hex_table[octets & 0x0F]
+    return _grouped(chars, [2] * 6, separator.upper() if uppercase else separator)
+
+def generate_name_batch(n, starts_with=None, ends_with=None, distribution="uniform", rng=NP_RNG):
+    weighted = distribution == "weighted"
+    candidates = name_candidates(starts_with, ends_with) if starts_with or ends_with else ()
+    firsts = _picks(rng, reference_list("first_names"), n, alias_table("first_names") if weighted else None)
+    lasts = _picks(rng, reference_list("last_names"), n, alias_table("last_names") if weighted else None)
+    if candidates:
+        picks = _picks(rng, candidates, n, name_candidate_table(starts_with, ends_with) if weighted else None)
+        return [f"{first or f} {last or l}" for (first, last), f, l in zip(picks, firsts, lasts)]
+    return [f"{first} {last}" for first, last in zip(firsts, lasts)]
+
+def generate_email_batch(n, domain=None, extension=None, rng=NP_RNG):
+    # Ensure extension has a dot prefix
+    if extension and not extension.startswith('.'):
+        extension = '.' + extension
+    
+    if domain and extension:
+        hosts = [f"{domain}{extension}"]
+    elif domain:
+        hosts = [domain]
+    elif extension:
+        hosts = [f"example{extension}"]
+    else:
+        hosts = EMAIL_PROVIDERS
+    nums = rng.integers(1, 1000, size=n).tolist()
+    return [f"{name}{num}@{host}" for name, num, host in zip(_choices(rng, EMAIL_NAMES, n), nums, _choices(rng, hosts, n))]
+
+def generate_phone_batch(n, country="US", include_code=True, rng=NP_RNG):
+    code = COUNTRIES.get(country, COUNTRIES["US"])["code"]
+    lead = f"{code} " if include_code else ""
+    
+    if country in ["US", "CA"]:
+        parts = [lead + "(", _int_chars(rng, n, 200, 999, 3), ") ", _int_chars(rng, n, 200, 999, 3), "-", _int_chars(rng, n, 1000, 9999, 4)]
+    elif country == "IN":
+        parts = [lead, _int_chars(rng, n, 7000000000, 9999999999, 10)]
+    elif country == "GB":
+        parts = [lead, _int_chars(rng, n, 20, 99, 2), " ", _int_chars(rng, n, 1000, 9999, 4), " ", _int_chars(rng, n, 100, 999, 3)]
+    else:
+        parts = [lead, _int_chars(rng, n, 100000000, 999999999, 9)]
+    return _join_columns(n, parts)
+
+def generate_address_batch(n, country="US", rng=NP_RNG):
+    return _repeat(rng, generate_address, n, country=country)
+
+def generate_country_batch(n, starts_with=None, rng=NP_RNG):
+    if starts_with:
+        candidates = country_candidates(starts_with)
+        if candidates:
+            return _choices(rng, candidates, n)
+    return _choices(rng, COUNTRIES_LIST, n)
+
+def generate_city_batch(n, country=None, distribution="uniform", rng=NP_RNG):
+    weighted = distribution == "weighted"
+    cities = country_cities(country) if country else None
+    if cities:
+        return _picks(rng, cities, n, alias_table("cities", country) if weighted else None)
+    return _picks(rng, reference_list("cities"), n, alias_table("cities") if weighted else None)
+
+def generate_zipcode_batch(n, country=None, zip_from=10000, zip_to=99999, rng=NP_RNG):
+    zip_from = int(zip_from) if zip_from else 10000
+    zip_to = int(zip_to) if zip_to else 99999
+    if zip_from > zip_to:
+        zip_from, zip_to = zip_to, zip_from
+    return list(map(str, rng.integers(zip_from, zip_to + 1, size=n).tolist()))
+
+def _credit_card_batch(rng, n, card_type, valid):
+    config = CREDIT_CARD_TYPES.get(card_type, CREDIT_CARD_TYPES["Visa"])
+    prefixes = config["prefix"] if isinstance(config["prefix"], list) else [config["prefix"]]
+    prefix_table = np.array([[int(d) for d in p] for p in prefixes], dtype=np.uint8)
+    prefix = prefix_table[rng.integers(0, len(prefixes), size=n)]
+    length = config["length"]
+    
+    payload = np.concatenate([prefix, _random_digits(rng, n, length - 1 - prefix.shape[1])], axis=1)
+    check = _luhn_check_digits(payload)
+    if not valid:
+        check = (check + 1) % 10
+    chars = np.concatenate([payload, check[:, None]], axis=1) + 48
+    
+    if card_type == "American Express":
+        return _grouped(chars, [4, 6, length - 10], "-")
+    return _grouped(chars, [4] * (length // 4) + ([length % 4] if length % 4 else []), "-")
+
+def generate_credit_card_batch(n, card_type="Random", valid=True, distribution="uniform", rng=NP_RNG):
+    if card_type != "Random":
+        return _credit_card_batch(rng, n, card_type, valid)
+    
+    if distribution == "weighted":
+        picks = card_brand_table().sample(rng, n)
+    else:
+        picks = rng.integers(0, len(CARD_BRANDS), size=n)
+    result = np.empty(n, dtype=object)
+    for i, name in enumerate(CARD_BRANDS):
+        rows = np.flatnonzero(picks == i)
+        if rows.size:
+            result[rows] = _credit_card_batch(rng, rows.size, name, valid)
+    return result.tolist()
+
+def generate_ssn_batch(n, country="US", rng=NP_RNG):
+    if country == "UK":
+        return _join_columns(n, [_int_chars(rng, n, 10, 99, 2), " ", _int_chars(rng, n, 100000, 999999, 6), " ", _int_chars(rng, n, 100000, 999999, 6)])
+    return _join_columns(n, [_int_chars(rng, n, 100, 999, 3), "-", _int_chars(rng, n, 10, 99, 2), "-", _int_chars(rng, n, 1000, 9999, 4)])
+
+def generate_barcode_batch(n, numeric_only=True, length=13, rng=NP_RNG):
+    if numeric_only:
+        return _strings(_random_digits(rng, n, length) + 48)
+    return _strings(_ALNUM[rng.integers(0, _ALNUM.size, size=(n, length))])
+
+def generate_isbn_batch(n, format="isbn13", rng=NP_RNG):
+    if format == "isbn10":
+        digits = _random_digits(rng, n, 9)
+        total = (digits * np.arange(10, 1, -1, dtype=np.uint8)).sum(axis=1, dtype=np.int64)
+        check = (11 - (total % 11)) % 11
+        check_char = np.where(check == 10, ord("X"), check + 48).astype(np.uint8)
+        chars = digits + 48
+        return _join_columns(n, [chars[:, :1], "-", chars[:, 1:6], "-", chars[:, 6:], "-", check_char[:, None]])
+    
+    # ISBN-13: 978 + 9 digits + check digit
+    digits = np.concatenate([np.broadcast_to(np.array([9, 7, 8], dtype=np.uint8), (n, 3)), _random_digits(rng, n, 9)], axis=1)
+    total = (digits * np.tile(np.array([1, 3], dtype=np.uint8), 6)).sum(axis=1, dtype=np.int64)
+    check = ((10 - (total % 10)) % 10).astype(np.uint8)
+    chars = np.concatenate([digits, check[:, None]], axis=1) + 48
+    return _grouped(chars, [3, 2, 5, 2, 1], "-")
+
+def generate_ip_batch(n, version="ipv4", rng=NP_RNG):
+    if version == "ipv6":
+        groups = rng.integers(0, 65536, size=(n, 8))
+        return ["%x:%x:%x:%x:%x:%x:%x:%x" % tuple(row) for row in groups.tolist()]
+    octets = rng.integers(0, 256, size=(n, 4))
+    octets[:, 0] = rng.integers(1, 256, size=n)
+    s = _BYTE_STRS
+    return [f"{s[a]}.{s[b]}.{s[c]}.{s[d]}" for a, b, c, d in octets.tolist()]
+
+def generate_url_batch(n, domain=None, extension="com", protocol="https", rng=NP_RNG):
+    domains = [domain] if domain else URL_DOMAINS
+    return [f"{protocol}://{dom}.{extension}/{path}" for dom, path in zip(_choices(rng, domains, n), _choices(rng, URL_PATHS, n))]
+
+def generate_datetime_batch(n, include_date=True, include_time=True, include_timezone=False, rng=NP_RNG):
+    parts = []
+    if include_date:
+        parts += [_int_chars(rng, n, 2020, 2025, 4), "-", _int_chars(rng, n, 1, 12, 2), "-", _int_chars(rng, n, 1, 28, 2)]
+    if include_date and include_time:
+        parts.append("T")
+    if include_time:
+        parts += [_int_chars(rng, n, 0, 23, 2), ":", _int_chars(rng, n, 0, 59, 2), ":", _int_chars(rng, n, 0, 59, 2), ".", _int_chars(rng, n, 0, 999, 3)]
+    if include_timezone and parts:
+        parts.append("Z")
+    return _join_columns(n, parts)
+
+def generate_sentence_batch(n, grammatically_valid=True, rng=NP_RNG):
+    if grammatically_valid:
+        return [f"{s} {v} {o}." for s, v, o in zip(_choices(rng, SENTENCE_SUBJECTS, n), _choices(rng, SENTENCE_VERBS, n), _choices(rng, SENTENCE_OBJECTS, n))]
+    return _repeat(rng, generate_sentence, n, grammatically_valid=False)
+
+def generate_paragraph_batch(n, min_sentences=3, max_sentences=6, rng=NP_RNG):
+    counts = rng.integers(min_sentences, max_sentences + 1, size=n).tolist()
+    sentences = iter(generate_sentence_batch(sum(counts), rng=rng))
+    return [" ".join([next(sentences) for _ in range(k)]) for k in counts]
+
+def generate_hex_color_batch(n, uppercase=True, rng=NP_RNG):
+    hex_table = _HEX_UPPER if uppercase else _HEX_LOWER
+    octets = rng.integers(0, 256, size=(n, 3), dtype=np.uint8)
+    chars = np.empty((n, 6), dtype=np.uint8)
+    chars[:, 0::2] = hex_table[octets >> 4]
+    chars[:, 1::2] = hex_table[octets & 0x0F]
+    return _join_columns(n, ["#", chars])
+
+def generate_rgb_color_batch(n, min_value=0, max_value=255, rng=NP_RNG):
+    channels = rng.integers(min_value, max_value + 1, size=(n, 3))
+    return [f"rgb({r}, {g}, {b})" for r, g, b in channels.tolist()]
+
+def generate_company_batch(n, starts_with=None, rng=NP_RNG):
+    names = [f"{adj.capitalize()} {word}" for adj, word in zip(_choices(rng, USERNAME_ADJ, n), _choices(rng, COMPANY_WORDS, n))]
+    if starts_with:
+        needle = starts_with.strip().upper()
+        return [name if needle in name.upper() else starts_with + name for name in names]
+    return names
+
+def generate_job_batch(n, seniority="any", rng=NP_RNG):
+    if seniority != "any":
+        jobs = job_candidates(seniority)
+        if jobs:
+            return _choices(rng, jobs, n)
+    return _choices(rng, reference_list("job_titles"), n)
+
+def generate_street_batch(n, rng=NP_RNG):
+    nums = rng.integers(100, 10000, size=n).tolist()
+    return [f"{num} {street}" for num, street in zip(nums, _choices(rng, reference_list("us_streets"), n))]
+
+def generate_text_batch(n, length=5, rng=NP_RNG):
+    words = iter(_choices(rng, TEXT_WORDS, n * length))
+    return [" ".join([next(words) for _ in range(length)]) for _ in range(n)]
+
+# ============ Generator Registry ============
+#
+# Maps each type to its single-value generator, its batch generator and the
+# keyword arguments it takes, as {option key: (kwarg, default)}. Requests are
+# compiled once into a GeneratorPlan so per-value work is only generation.
+
+GENERATOR_REGISTRY = {
+    "uuid": (generate_uuid, generate_uuid_batch, {"version": ("version", "v4")}),
+    "password": (generate_password, generate_password_batch, {
+        "uppercase": ("uppercase", True),
+        "lowercase": ("lowercase", True),
+        "numbers": ("numbers", True),
+        "special": ("special", False),
+        "length": ("length", 16),
+        "require_each": ("require_each", False),
+    }),
+    "username": (generate_username, generate_username_batch, {
+        "prefix": ("prefix", None),
+        "style": ("style", "name_year"),
+    }),
+    "imei": (generate_imei, generate_imei_batch, {
+        "brand": ("brand", "Generic"),
+        "valid_checksum": ("valid_checksum", True),
+    }),
+    "mac_address": (generate_mac_address, generate_mac_address_batch, {
+        "uppercase": ("uppercase", True),
+        "separator": ("separator", ":"),
+    }),
+    "name": (generate_name, generate_name_batch, {
+        "starts_with": ("starts_with", None),
+        "ends_with": ("ends_with", None),
+        "distribution": ("distribution", "uniform"),
+    }),
+    "email": (generate_email, generate_email_batch, {
+        "domain": ("domain", None),
+        "extension": ("extension", None),
+    }),
+    "phone": (generate_phone, generate_phone_batch, {
+        "country": ("country", "US"),
+        "include_code": ("include_code", True),
+    }),
+    "address": (generate_address, generate_address_batch, {
+        "country": ("country", "US"),
+    }),
+    "country": (generate_country, generate_country_batch, {
+        "starts_with": ("starts_with", None),
+    }),
+    "city": (generate_city, generate_city_batch, {
+        "country": ("country", None),
+        "distribution": ("distribution", "uniform"),
+    }),
+    "zipcode": (generate_zipcode, generate_zipcode_batch, {
+        "country": ("country", None),
+        "from": ("zip_from", 10000),
+        "to": ("zip_to", 99999),
+    }),
+    "credit_card": (generate_credit_card, generate_credit_card_batch, {
+        "card_type": ("card_type", "Random"),
+        "valid": ("valid", "valid"),
+        "distribution": ("distribution", "uniform"),
+    }),
+    "ssn": (generate_ssn, generate_ssn_batch, {
+        "country": ("country", "US"),
+    }),
+    "barcode": (generate_barcode, generate_barcode_batch, {
+        "numeric_only": ("numeric_only", True),
+        "length": ("length", 13),
+    }),
+    "isbn": (generate_isbn, generate_isbn_batch, {
+        "format": ("format", "isbn13"),
+    }),
+    "ip": (generate_ip, generate_ip_batch, {
+        "version": ("version", "ipv4"),
+    }),
+    "url": (generate_url, generate_url_batch, {
+        "domain": ("domain", None),
+        "extension": ("extension", "com"),
+        "protocol": ("protocol", "https"),
+    }),
+    "datetime": (generate_datetime, generate_datetime_batch, {
+        "include_date": ("include_date", True),
+        "include_time": ("include_time", True),
+        "include_timezone": ("include_timezone", False),
+    }),
+    "sentence": (generate_sentence, generate_sentence_batch, {
+        "grammatically_valid": ("grammatically_valid", True),
+    }),
+    "paragraph": (generate_paragraph, generate_paragraph_batch, {
+        "min_sentences": ("min_sentences", 3),
+        "max_sentences": ("max_sentences", 6),
+    }),
+    "hex_color": (generate_hex_color, generate_hex_color_batch, {
+        "uppercase": ("uppercase", True),
+    }),
+    "rgb_color": (generate_rgb_color, generate_rgb_color_batch, {
+        "min_value": ("min_value", 0),
+        "max_value": ("max_value", 255),
+    }),
+    "company": (generate_company, generate_company_batch, {
+        "starts_with": ("starts_with", None),
+    }),
+    "job": (generate_job, generate_job_batch, {
+        "seniority": ("seniority", "any"),
+    }),
+    "street": (generate_street, generate_street_batch, {}),
+    "text": (generate_text, generate_text_batch, {
+        "length": ("length", 5),
+    }),
+}
+
+# Option values converted before binding, keyed by (type, option key)
+OPTION_CONVERTERS = {
+    ("credit_card", "valid"): lambda v: v == "valid" if isinstance(v, str) else bool(v),
+}
+
+# (low, high) option pairs that must satisfy low <= high, keyed by type
+OPTION_RANGES = {
+    "zipcode": [("from", "to")],
+    "paragraph": [("min_sentences", "max_sentences")],
+    "rgb_color": [("min_value", "max_value")],
+}
+
+# O(1) lookup of type metadata by type id
+DATA_TYPES_BY_ID = {t["type"]: t for t in DATA_TYPES}
+
+GeneratorPlan = namedtuple("GeneratorPlan", ["type_id", "one", "batch", "kwargs"])
+
+# Option type for options without metadata, from the type of their default
+DEFAULT_OPTION_TYPES = {bool: "checkbox", int: "number", str: "text"}
+
+TRUE_STRINGS = ("true", "1", "yes", "on")
+FALSE_STRINGS = ("false", "0", "no", "off")
+
+def check_option(key: str, value, kind: str, meta: dict = None):
+    """A caller-supplied option value as the type its generator expects; raises ValueError"""
+    if kind == "number":
+        if isinstance(value, bool):
+            raise ValueError(f"Option '{key}' must be a number")
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"Option '{key}' must be a number")
+        if meta and "min" in meta and value < meta["min"]:
+            raise ValueError(f"Option '{key}' must be at least {meta['min']}")
+        if meta and "max" in meta and value > meta["max"]:
+            raise ValueError(f"Option '{key}' must be at most {meta['max']}")
+    elif kind == "checkbox":
+        # Same lax booleans as the request models: true/false, 0/1 or their strings
+        if isinstance(value, str) and value.lower() in TRUE_STRINGS + FALSE_STRINGS:
+            value = value.lower() in TRUE_STRINGS
+        elif not isinstance(value, (bool, int)) or value not in (0, 1):
+            raise ValueError(f"Option '{key}' must be true or false")
+        value = bool(value)
+    elif not isinstance(value, str):
+        raise ValueError(f"Option '{key}' must be a string")
+    elif kind in ("select", "radio") and meta and isinstance(meta.get("values"), list):
+        choices = [choice for choice, _ in meta["values"]]
+        if value not in choices:
+            raise ValueError(f"Option '{key}' must be one of: {', '.join(choices)}")
+    return value
+
+def resolve_options(type_id: str, options: dict) -> dict:
+    """Validate options for a type and apply defaults, returning generator kwargs"""
+    _, _, params = GENERATOR_REGISTRY[type_id]
+    limits = {o["key"]: o for o in type_options(type_id)}
+    
+    kwargs = {}
+    for key, (kwarg, default) in params.items():
+        value = options.get(key)
+        convert = OPTION_CONVERTERS.get((type_id, key))
+        if value is None:
+            value = default
+        elif not convert:
+            meta = limits.get(key)
+            kind = meta["type"] if meta else DEFAULT_OPTION_TYPES.get(type(default))
+            if kind:
+                value = check_option(key, value, kind, meta)
+        
+        kwargs[kwarg] = convert(value) if convert else value
+    
+    for low, high in OPTION_RANGES.get(type_id, []):
+        low_value, high_value = kwargs[params[low][0]], kwargs[params[high][0]]
+        if low_value > high_value:
+            raise ValueError(f"Option '{low}' ({low_value}) must not be greater than '{high}' ({high_value})")
+    return kwargs
+
+def compile_generator(type_id: str, options: dict) -> GeneratorPlan:
+    """Resolve a type and its options once into bound single-value and batch generators"""
+    if type_id not in GENERATOR_REGISTRY:
+        raise KeyError(f"Unknown type: {type_id}")
+    one, batch, _ = GENERATOR_REGISTRY[type_id]
+    kwargs = resolve_options(type_id, options)
+    return GeneratorPlan(type_id, partial(one, **kwargs), partial(batch, **kwargs), kwargs)
+
+def generate_by_type(type_id: str, options: dict) -> str:
+    """Generate a single value of the specified type"""
+    if type_id not in GENERATOR_REGISTRY:
+        return ""
+    return compile_generator(type_id, options).one()
+
+def generate_batch(type_id: str, count: int, options: dict) -> list:
+    """Generate count values of the specified type in one batch"""
+    if type_id not in GENERATOR_REGISTRY:
+        return [""] * count
+    return compile_generator(type_id, options).batch(count)
+
+def _name_space(starts_with=None, ends_with=None, distribution="uniform"):
+    first, last = set(reference_list("first_names")), set(reference_list("last_names"))
+    candidates = name_candidates(starts_with, ends_with) if starts_with or ends_with else ()
+    matched_first = {f for f, _ in candidates if f}
+    matched_last = {l for _, l in candidates if l}
+    if not matched_first and not matched_last:
+        return len(first) * len(last)
+    return len(matched_first) * len(last) + len(first) * len(matched_last) - len(matched_first) * len(matched_last)
+
+def _username_space(prefix=None, style="name_year"):
+    names = len(set(USERNAME_NAMES))
+    if style == "name_year":
+        return names * 99
+    elif style == "adj_noun":
+        return len(set(USERNAME_ADJ)) * len(set(USERNAME_NOUN))
+    elif style == "name_random":
+        return names * 900
+    return names
+
+def _credit_card_space(card_type="Random", valid=True, distribution="uniform"):
+    card_types = ["Visa", "Mastercard", "American Express"] if card_type == "Random" else [card_type]
+    total = 0
+    for name in card_types:
+        config = CREDIT_CARD_TYPES.get(name, CREDIT_CARD_TYPES["Visa"])
+        prefixes = config["prefix"] if isinstance(config["prefix"], list) else [config["prefix"]]
+        total += len(prefixes) * 10 ** (config["length"] - 1 - len(prefixes[0]))
+    return total
+
+def _phone_space(country="US", include_code=True):
+    if country in ["US", "CA"]:
+        return 800 * 800 * 9000
+    elif country == "IN":
+        return 3000000000
+    elif country == "GB":
+        return 80 * 9000 * 900
+    return 900000000
+
+def _datetime_space(include_date=True, include_time=True, include_timezone=False):
+    return (6 * 12 * 28 if include_date else 1) * (24 * 60 * 60 * 1000 if include_time else 1)
+
+def _zipcode_space(country=None, zip_from=10000, zip_to=99999):
+    zip_from = int(zip_from) if zip_from else 10000
+    zip_to = int(zip_to) if zip_to else 99999
+    return abs(zip_to - zip_from) + 1
+
+def _country_space(starts_with=None):
+    if starts_with:
+        matches = country_candidates(starts_with)
+        if matches:
+            return len(matches)
+    return len(set(COUNTRIES_LIST))
+
+def _city_space(country=None, distribution="uniform"):
+    cities = country_cities(country) if country else None
+    if cities:
+        return len(set(cities))
+    return len(set(reference_list("cities")))
+
+def _job_space(seniority="any"):
+    if seniority != "any":
+        jobs = set(job_candidates(seniority))
+        if jobs:
+            return len(jobs)
+    return len(set(reference_list("job_titles")))
+
+# Number of distinct values each type can produce for given kwargs. Types
+# missing here (address) are only guarded by the stall check in unique.py.
+VALUE_SPACES = {
+    # Random bits only; v7 and ULID timestamps are not counted
+    "uuid": lambda version="v4": 1 << {"v7": 62, "ulid": 68}.get(version, 122),
+    "password": lambda uppercase=True, lowercase=True, numbers=True, special=False, length=16, require_each=False:
+        len(set(password_charset(uppercase, lowercase, numbers, special))) ** length,
+    "username": _username_space,
+    "imei": lambda brand="Generic", valid_checksum=True: (52 if brand == "Generic" else 1) * 10 ** 12,
+    "mac_address": lambda uppercase=True, separator=":": 1 << 48,
+    "name": _name_space,
+    "email": lambda domain=None, extension=None: len(set(EMAIL_NAMES)) * 999 * (1 if domain or extension else len(EMAIL_PROVIDERS)),
+    "phone": _phone_space,
+    "country": _country_space,
+    "city": _city_space,
+    "zipcode": _zipcode_space,
+    "credit_card": _credit_card_space,
+    "ssn": lambda country="US": 90 * 900000 * 900000 if country == "UK" else 900 * 90 * 9000,
+    "barcode": lambda numeric_only=True, length=13: (10 if numeric_only else 36) ** length,
+    "isbn": lambda format="isbn13": 10 ** 9,
+    "ip": lambda version="ipv4": 1 << 128 if version == "ipv6" else 255 * 256 ** 3,
+    "url": lambda domain=None, extension="com", protocol="https": (1 if domain else len(set(URL_DOMAINS))) * len(URL_PATHS),
+    "datetime": _datetime_space,
+    "sentence": lambda grammatically_valid=True:
+        len(SENTENCE_SUBJECTS) * len(SENTENCE_VERBS) * len(SENTENCE_OBJECTS) if grammatically_valid
+        else sum(len(set(TEXT_WORDS)) ** k for k in range(5, 13)),
+    "paragraph": lambda min_sentences=3, max_sentences=6:
+        sum((len(SENTENCE_SUBJECTS) * len(SENTENCE_VERBS) * len(SENTENCE_OBJECTS)) ** k for k in range(min_sentences, max_sentences + 1)),
+    "hex_color": lambda uppercase=True: 1 << 24,
+    "rgb_color": lambda min_value=0, max_value=255: max(max_value - min_value + 1, 0) ** 3,
+    "company": lambda starts_with=None: len(set(USERNAME_ADJ)) * len(set(COMPANY_WORDS)),
+    "job": _job_space,
+    "street": lambda: 9900 * len(set(reference_list("us_streets"))),
+    "text": lambda length=5: len(set(TEXT_WORDS)) ** length,
+}
+
+def value_space(plan: GeneratorPlan):
+    """Distinct values a plan can produce, or None when not known"""
+    space = VALUE_SPACES.get(plan.type_id)
+    return space(**plan.kwargs) if space else None
+
+def shard_size(shard: int, count: int) -> int:
+    return min(SHARD_ROWS, count - shard * SHARD_ROWS)
+
+def reserve_ticks(plan: GeneratorPlan, n: int) -> GeneratorPlan:
+    """plan with the clock ticks for its next n time-ordered ids taken from this process
+
+    Every worker process has its own clock, so shards sent to the pool would
+    interleave. The parent reserves each shard's ticks as it submits it, which
+    keeps a job's v7/ULID ids strictly increasing across shards.
+    """
+    if plan.type_id != "uuid" or plan.kwargs["version"] not in TIME_ORDERED_VERSIONS:
+        return plan
+    return plan._replace(batch=partial(plan.batch, first_tick=clock_ticks(n)))
+
+def generate_shard(plan: GeneratorPlan, shard: int, count: int, seed: int = None, stream: int = 0) -> list:
+    """Generate one SHARD_ROWS slice of a count-row job from a plan
+
+    With a seed, shard i always draws from the same substream, so shards can be
+    generated in any order or process and concatenate to identical output.
+    Without one, every shard gets its own fresh generator.
+    """
+    rng = unseeded_rng() if seed is None else shard_rng(seed, shard, stream)
+    return plan.batch(shard_size(shard, count), rng=rng)
@@ -0,0 +1,314 @@
+"""
+Test Data Generator - background bulk jobs spooled to disk as gzip chunks (or Arrow/Parquet)
+"""
+
+import gzip
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import uuid
+from queue import SimpleQueue
+
+import sinks
+from columnar import COLUMNAR_MEDIA_TYPES, DICTIONARY_TYPES, ColumnarWriter
+from encoders import csv_line, encode_columns, encode_values
+
+# Where job output and status files are written
+SPOOL_DIR = os.environ.get("TDG_SPOOL_DIR", os.path.join(tempfile.gettempdir(), "tdg-spool"))
+
+# Jobs generating at the same time; further jobs wait in the queue
+MAX_RUNNING_JOBS = int(os.environ.get("TDG_MAX_RUNNING_JOBS", 2))
+
+# Finished job files older than this many seconds are removed
+JOB_TTL = int(os.environ.get("TDG_JOB_TTL", 24 * 3600))
+
+# A running job whose status has not changed for this many seconds is marked failed;
+# its process has died or restarted (running jobs update their status every batch)
+JOB_STALE_SECONDS = int(os.environ.get("TDG_JOB_STALE_SECONDS", 600))
+
+GZIP_LEVEL = 6
+
+JOB_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+# Dataset formats loaded through a database sink: format -> (media type, download name), or None
+# when the rows go to a database server and there is nothing to download
+SINK_FORMATS = {
+    "sqlite": ("application/vnd.sqlite3", "dataset.sqlite"),
+    "pgcopy": ("application/gzip", "dataset.sql.gz"),
+    "postgres": None,
+}
+
+RAW_FORMATS = ("sqlite", *COLUMNAR_MEDIA_TYPES)
+
+# (run, status, args) waiting for a job thread
+_pending = SimpleQueue()
+_threads = []
+_threads_lock = threading.Lock()
+# Statuses of this process's jobs that have not finished, by id
+_unfinished = {}
+
+def data_path(job_id: str, fmt: str, table: str = None) -> str:
+    # Binary formats are stored as they are; line formats are gzipped
+    extension = fmt if fmt in RAW_FORMATS else f"{fmt}.gz"
+    name = f"{job_id}.{table}.{extension}" if table else f"{job_id}.{extension}"
+    return os.path.join(SPOOL_DIR, name)
+
+def status_path(job_id: str) -> str:
+    return os.path.join(SPOOL_DIR, f"{job_id}.json")
+
+def read_status(job_id: str):
+    """Current status of a job, or None if it does not exist"""
+    if not JOB_ID_PATTERN.match(job_id):
+        return None
+    try:
+        with open(status_path(job_id), encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+def write_status(status: dict):
+    # Status lives on disk so any server process can report on any job
+    status["updated_at"] = time.time()
+    tmp = status_path(status["id"]) + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(status, f)
+    os.replace(tmp, status_path(status["id"]))
+
+def fail_job(status: dict, error: str):
+    status.update(status="failed", error=error, finished_at=time.time())
+    write_status(status)
+
+def purge_expired(now: float = None):
+    """Remove spool files of jobs that finished more than JOB_TTL seconds ago
+
+    Jobs left running or queued by a process that died are marked failed
+    first, so their files are removed a JOB_TTL later like any other job.
+    """
+    now = now or time.time()
+    for name in os.listdir(SPOOL_DIR):
+        if not name.endswith(".json"):
+            continue
+        status = read_status(name[:-len(".json")])
+        if not status:
+            continue
+        updated = status.get("updated_at") or status.get("started_at") or status["created_at"]
+        if status["status"] == "running" and now - updated > JOB_STALE_SECONDS:
+            fail_job(status, "Job stopped without finishing; its server process exited")
+        elif status["status"] == "queued" and now - status["created_at"] > JOB_TTL:
+            fail_job(status, "Job never started; its server process exited")
+        elif status.get("finished_at") and now - status["finished_at"] > JOB_TTL:
+            tables = [None] if status["format"] in SINK_FORMATS else status.get("tables", [None])
+            paths = [data_path(status["id"], status["format"], table) for table in tables]
+            for path in paths + [status_path(status["id"])]:
+                if os.path.exists(path):
+                    os.remove(path)
+
+def fail_unfinished(error: str = "Server shut down before the job finished"):
+    """Mark this process's queued and running jobs failed, e.g. on shutdown"""
+    for status in list(_unfinished.values()):
+        if status["status"] in ("queued", "running"):
+            fail_job(status, error)
+
+def new_status(type_id: str, fmt: str, count: int) -> dict:
+    os.makedirs(SPOOL_DIR, exist_ok=True)
+    purge_expired()
+    return {
+        "id": uuid.uuid4().hex,
+        "status": "queued",
+        "type": type_id,
+        "format": fmt,
+        "rows_total": count,
+        "rows_done": 0,
+        "progress": 0.0,
+        "bytes_written": 0,
+        "rows_per_sec": 0.0,
+        "created_at": time.time(),
+        "started_at": None,
+        "finished_at": None,
+        "updated_at": None,
+        "error": None,
+    }
+
+def run_jobs():
+    """Job thread: run queued jobs one after another"""
+    while True:
+        run, status, args = _pending.get()
+        try:
+            run(status, *args)
+        except BaseException as e:
+            # run_* record their own errors; this catches whatever escaped them
+            if status["status"] in ("queued", "running"):
+                fail_job(status, str(e) or type(e).__name__)
+        finally:
+            _unfinished.pop(status["id"], None)
+
+def start_threads():
+    # Daemon threads, so a job in progress never holds up interpreter shutdown
+    with _threads_lock:
+        while len(_threads) < MAX_RUNNING_JOBS:
+            thread = threading.Thread(target=run_jobs, name=f"job-{len(_threads)}", daemon=True)
+            thread.start()
+            _threads.append(thread)
+
+def queue(status: dict, run, *args) -> dict:
+    write_status(status)
+    snapshot = json.loads(json.dumps(status))
+    _unfinished[status["id"]] = status
+    start_threads()
+    _pending.put((run, status, args))
+    return snapshot
+
+def record_progress(status: dict, rows: int, nbytes: int):
+    elapsed = max(time.time() - status["started_at"], 1e-9)
+    status["rows_done"] += rows
+    status["bytes_written"] += nbytes
+    status["progress"] = round(status["rows_done"] / max(status["rows_total"], 1), 4)
+    status["rows_per_sec"] = round(status["rows_done"] / elapsed, 1)
+
+def submit_job(batches, count: int, type_id: str, fmt: str) -> dict:
+    """Queue a job that writes batches to the spool directory; returns its status"""
+    return queue(new_status(type_id, fmt, count), run_job, batches)
+
+def submit_dataset_job(chunks, table_rows: dict, fmt: str, dictionary: set = ()) -> dict:
+    """Queue a job that writes (table, names, columns) chunks to one file per table,
+    or through a database sink for SINK_FORMATS"""
+    status = new_status("dataset", fmt, sum(table_rows.values()))
+    if fmt in SINK_FORMATS:
+        # Sinks batch across chunks, so bytes are only counted for the whole job
+        status["tables"] = {name: {"rows_total": rows, "rows_done": 0} for name, rows in table_rows.items()}
+        return queue(status, run_sink_job, chunks)
+    status["tables"] = {
+        name: {"rows_total": rows, "rows_done": 0, "bytes_written": 0}
+        for name, rows in table_rows.items()
+    }
+    return queue(status, run_dataset_job, chunks, dictionary)
+
+class GzipWriter:
+    """Job file writer for line formats: one gzip member per chunk
+
+    Concatenated gzip members form a valid gzip file, so the download is a
+    single .gz that can be fetched with Range requests and resumed.
+    """
+
+    def __init__(self, fmt: str, names: list, values_only: bool = False):
+        self.fmt = fmt
+        self.names = names
+        self.values_only = values_only
+        self.header = csv_line(names) if fmt == "csv" else ""
+        self.written = False
+
+    def member(self, text: str) -> bytes:
+        text, self.header = self.header + text, ""
+        self.written = True
+        return gzip.compress(text.encode("utf-8"), GZIP_LEVEL)
+
+    def write(self, columns: list) -> bytes:
+        if self.values_only:
+            return self.member(encode_values(columns[0], self.fmt))
+        return self.member(encode_columns(columns, self.names, self.fmt))
+
+    def close(self) -> bytes:
+        # A file with no rows still gets its CSV header, or an empty member
+        return b"" if self.written else self.member("")
+
+def open_writer(fmt: str, names: list, dictionary: set = (), values_only: bool = False):
+    """Writer for a job file: write(columns) and close() return the bytes to append"""
+    if fmt in COLUMNAR_MEDIA_TYPES:
+        return ColumnarWriter(fmt, names, dictionary)
+    return GzipWriter(fmt, names, values_only)
+
+def run_job(status: dict, batches):
+    """Generate a job, appending each encoded batch to the job file"""
+    status.update(status="running", started_at=time.time())
+    write_status(status)
+    try:
+        writer = open_writer(status["format"], [status["type"]], {status["type"]} & DICTIONARY_TYPES, values_only=True)
+        with open(data_path(status["id"], status["format"]), "wb") as f:
+            for batch in batches:
+                data = writer.write([batch])
+                f.write(data)
+                record_progress(status, len(batch), len(data))
+                write_status(status)
+            data = writer.close()
+            f.write(data)
+            record_progress(status, 0, len(data))
+        status.update(status="done", progress=1.0)
+    except Exception as e:
+        status.update(status="failed", error=str(e))
+    status["finished_at"] = time.time()
+    write_status(status)
+
+def run_dataset_job(status: dict, chunks, dictionary: set = ()):
+    """Generate a dataset job; each table is its own file
+
+    dictionary holds the "table.field" names of dictionary-encoded columns.
+    """
+    status.update(status="running", started_at=time.time())
+    write_status(status)
+    files = {}
+    writers = {}
+
+    def emit(table: str, data: bytes, rows: int):
+        files[table].write(data)
+        record_progress(status, rows, len(data))
+        status["tables"][table]["rows_done"] += rows
+        status["tables"][table]["bytes_written"] += len(data)
+
+    try:
+        for table, names, columns in chunks:
+            if table not in files:
+                files[table] = open(data_path(status["id"], status["format"], table), "wb")
+                writers[table] = open_writer(status["format"], names, {name for name in names if f"{table}.{name}" in dictionary})
+            emit(table, writers[table].write(columns), len(columns[0]))
+            write_status(status)
+        for table, writer in writers.items():
+            emit(table, writer.close(), 0)
+        status.update(status="done", progress=1.0)
+    except Exception as e:
+        status.update(status="failed", error=str(e))
+    finally:
+        for f in files.values():
+            f.close()
+    status["finished_at"] = time.time()
+    write_status(status)
+
+def open_sink(status: dict):
+    """The sink for a sink-format job, and the file it writes (if it owns one)"""
+    fmt = status["format"]
+    path = data_path(status["id"], fmt)
+    if fmt == "sqlite":
+        return sinks.SqliteSink(path, pooled=False), None
+    if fmt == "pgcopy":
+        f = open(path, "wb")
+        return sinks.CopySink(f, gzip_level=GZIP_LEVEL), f
+    return sinks.PostgresSink(sinks.POSTGRES_DSN), None
+
+def run_sink_job(status: dict, chunks):
+    """Load a dataset job into a database (or a COPY script) in batched transactions"""
+    status.update(status="running", started_at=time.time())
+    write_status(status)
+    sink = f = None
+
+    def progress(table, rows, nbytes):
+        record_progress(status, rows, nbytes)
+        status["tables"][table]["rows_done"] += rows
+        write_status(status)
+
+    try:
+        sink, f = open_sink(status)
+        sinks.seed(chunks, sink, progress)
+        status.update(status="done", progress=1.0)
+    except Exception as e:
+        status.update(status="failed", error=str(e))
+    finally:
+        if sink is not None:
+            sink.release()
+        if f is not None:
+            f.close()
+    if status["format"] == "sqlite" and os.path.exists(data_path(status["id"], "sqlite")):
+        status["bytes_written"] = os.path.getsize(data_path(status["id"], "sqlite"))
+    status["finished_at"] = time.time()
+    write_status(status)
@@ -0,0 +1,202 @@
+"""
+Test Data Generator - per-type request metrics in Prometheus text format
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+
+# Requests slower than this many seconds are logged with their options
+SLOW_REQUEST_SECONDS = float(os.environ.get("TDG_SLOW_REQUEST_SECONDS", 2.0))
+
+# Most recent slow requests kept for GET /metrics/slow
+SLOW_REQUEST_HISTORY = 100
+
+SECONDS_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+ROWS_BUCKETS = (1, 10, 100, 1000, 10000, 100000, 1000000, 10000000)
+BYTES_BUCKETS = (1e3, 1e4, 1e5, 1e6, 1e7, 1e8, 1e9)
+
+slow_log = logging.getLogger("tdg.slow")
+
+_lock = threading.Lock()
+
+class Counter:
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self.values = {}
+
+    def inc(self, label: str, amount: float = 1):
+        self.values[label] = self.values.get(label, 0) + amount
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for label, value in sorted(self.values.items()):
+            lines.append(f'{self.name}{{type="{label}"}} {format_value(value)}')
+        return lines
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, buckets: tuple):
+        self.name = name
+        self.help = help_text
+        self.buckets = buckets
+        # label -> [count per bucket (+Inf last), sum]
+        self.values = {}
+
+    def observe(self, label: str, value: float):
+        entry = self.values.get(label)
+        if entry is None:
+            entry = self.values[label] = [[0] * (len(self.buckets) + 1), 0.0]
+        entry[0][bisect_left(self.buckets, value)] += 1
+        entry[1] += value
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for label, (counts, total) in sorted(self.values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{type="{label}",le="{format_value(bound)}"}} {cumulative}')
+            cumulative += counts[-1]
+            lines.append(f'{self.name}_bucket{{type="{label}",le="+Inf"}} {cumulative}')
+            lines.append(f'{self.name}_sum{{type="{label}"}} {format_value(total)}')
+            lines.append(f'{self.name}_count{{type="{label}"}} {cumulative}')
+        return lines
+
+def format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+REQUESTS = Counter("tdg_requests_total", "Generation requests by type")
+ROWS_GENERATED = Counter("tdg_rows_generated_total", "Rows generated by type")
+SLOW_REQUESTS = Counter("tdg_slow_requests_total", f"Requests slower than {SLOW_REQUEST_SECONDS}s by type")
+SUPERSEDED_REQUESTS = Counter("tdg_superseded_requests_total", "WebSocket generations cancelled by a newer request, by type")
+FIELD_ROWS = Counter("tdg_field_rows_generated_total", "Rows generated per field type in /api/records requests")
+FIELD_GENERATION_SECONDS = Counter("tdg_field_generation_seconds_total", "Seconds generating each field type in /api/records requests")
+REQUEST_SECONDS = Histogram("tdg_request_seconds", "Wall time of generation requests", SECONDS_BUCKETS)
+GENERATION_SECONDS = Histogram("tdg_generation_seconds", "Time spent generating values", SECONDS_BUCKETS)
+SERIALIZATION_SECONDS = Histogram("tdg_serialization_seconds", "Time spent encoding responses", SECONDS_BUCKETS)
+REQUEST_ROWS = Histogram("tdg_request_rows", "Rows per request", ROWS_BUCKETS)
+RESPONSE_BYTES = Histogram("tdg_response_bytes", "Response body size in bytes", BYTES_BUCKETS)
+
+METRICS = [
+    REQUESTS, ROWS_GENERATED, SLOW_REQUESTS, SUPERSEDED_REQUESTS, FIELD_ROWS, FIELD_GENERATION_SECONDS, REQUEST_SECONDS,
+    GENERATION_SECONDS, SERIALIZATION_SECONDS, REQUEST_ROWS, RESPONSE_BYTES,
+]
+
+slow_requests = deque(maxlen=SLOW_REQUEST_HISTORY)
+
+class RequestMetrics:
+    """Timing for one request; recorded into the shared metrics by finish()
+
+    Generation and encoding are timed per batch or chunk rather than per row,
+    so the overhead is a few clock reads per 10,000 rows.
+    """
+
+    def __init__(self, type_id: str, count: int, options: dict = None, output_format: str = "json"):
+        self.type_id = type_id
+        self.count = count
+        self.options = options or {}
+        self.output_format = output_format
+        self.started = time.perf_counter()
+        self.generation = 0.0
+        self.serialization = 0.0
+        self.rows = 0
+        self.bytes_out = 0
+        # Multi-field requests: field type -> [rows, generation seconds]
+        self.fields = {}
+        self.finished = False
+
+    def generated(self, batches, rows=len):
+        """Time each batch pulled from a batch iterator as generation"""
+        batches = iter(batches)
+        while True:
+            start = time.perf_counter()
+            batch = next(batches, None)
+            self.generation += time.perf_counter() - start
+            if batch is None:
+                return
+            self.rows += rows(batch)
+            yield batch
+
+    def field_generated(self, type_id: str, batches):
+        """Time one field's batches under its own type; the request total is still timed by generated()"""
+        entry = self.fields.setdefault(type_id, [0, 0.0])
+        batches = iter(batches)
+        while True:
+            start = time.perf_counter()
+            batch = next(batches, None)
+            entry[1] += time.perf_counter() - start
+            if batch is None:
+                return
+            entry[0] += len(batch)
+            yield batch
+
+    def serialized(self, func, *args):
+        """Call func, timing it as serialization"""
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self.serialization += time.perf_counter() - start
+
+    def streamed(self, chunks):
+        """Count bytes of encoded chunks; encoding time is what generation didn't use"""
+        chunks = iter(chunks)
+        try:
+            while True:
+                start = time.perf_counter()
+                generation_before = self.generation
+                chunk = next(chunks, None)
+                self.serialization += time.perf_counter() - start - (self.generation - generation_before)
+                if chunk is None:
+                    return
+                self.bytes_out += len(chunk)
+                yield chunk
+        finally:
+            self.finish()
+
+    def finish(self):
+        if self.finished:
+            return
+        self.finished = True
+        elapsed = time.perf_counter() - self.started
+        label = self.type_id
+        with _lock:
+            REQUESTS.inc(label)
+            ROWS_GENERATED.inc(label, self.rows)
+            REQUEST_SECONDS.observe(label, elapsed)
+            GENERATION_SECONDS.observe(label, self.generation)
+            SERIALIZATION_SECONDS.observe(label, self.serialization)
+            REQUEST_ROWS.observe(label, self.rows)
+            RESPONSE_BYTES.observe(label, self.bytes_out)
+            if elapsed >= SLOW_REQUEST_SECONDS:
+                SLOW_REQUESTS.inc(label)
+            for type_id, (rows, seconds) in self.fields.items():
+                FIELD_ROWS.inc(type_id, rows)
+                FIELD_GENERATION_SECONDS.inc(type_id, seconds)
+
+        if elapsed >= SLOW_REQUEST_SECONDS:
+            entry = {
+                "type": self.type_id,
+                "count": self.count,
+                "output_format": self.output_format,
+                "options": self.options,
+                "seconds": round(elapsed, 3),
+                "generation_seconds": round(self.generation, 3),
+                "serialization_seconds": round(self.serialization, 3),
+                "bytes": self.bytes_out,
+                **({"field_generation_seconds": {t: round(sec, 3) for t, (_, sec) in self.fields.items()}} if self.fields else {}),
+                "at": time.time(),
+            }
+            slow_requests.append(entry)
+            slow_log.warning("slow request: %s", json.dumps(entry, default=str))
+
+def render() -> str:
+    """All metrics in Prometheus text exposition format"""
+    with _lock:
+        lines = [line for metric in METRICS for line in metric.render()]
+    return "\n".join(lines) + "\n"
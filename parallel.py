@@ -0,0 +1,59 @@
+"""
+Test Data Generator - process-pool sharded generation for large counts
+"""
+
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from generators import SHARD_ROWS, GeneratorPlan, generate_shard, reserve_ticks, shard_size
+
+# Counts at or above this are split into shards across the worker pool
+PARALLEL_THRESHOLD = int(os.environ.get("TDG_PARALLEL_THRESHOLD", 200000))
+
+# Worker processes in the pool; 1 keeps every job inline
+POOL_WORKERS = int(os.environ.get("TDG_POOL_WORKERS", os.cpu_count() or 1))
+
+_pool = None
+
+def get_pool(workers: int = None) -> ProcessPoolExecutor:
+    """Persistent worker pool, started on first use"""
+    global _pool
+    if _pool is None:
+        # spawn rather than fork: the parent has threads holding the NumPy RNG lock
+        _pool = ProcessPoolExecutor(max_workers=workers or POOL_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    return _pool
+
+def shutdown_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(cancel_futures=True)
+        _pool = None
+
+def use_pool(count: int, workers: int = None) -> bool:
+    return (workers or POOL_WORKERS) > 1 and count >= PARALLEL_THRESHOLD
+
+def iter_shards(plan: GeneratorPlan, count: int, seed: int = None, stream: int = 0, workers: int = None):
+    """Yield a job's shards in order, inline for small counts or from the worker pool"""
+    shards = range(-(-count // SHARD_ROWS))
+    if not use_pool(count, workers):
+        for shard in shards:
+            yield generate_shard(plan, shard, count, seed, stream)
+        return
+    
+    pool = get_pool(workers)
+    window = (workers or POOL_WORKERS) * 2
+    pending = deque()
+    try:
+        for shard in shards:
+            shard_plan = reserve_ticks(plan, shard_size(shard, count))
+            pending.append(pool.submit(generate_shard, shard_plan, shard, count, seed, stream))
+            # Bound the shards held in memory when the consumer is slower than the pool
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,132 @@
+"""
+Test Data Generator - admin-only request profiling (cProfile and stack sampling)
+"""
+
+import cProfile
+import hmac
+import marshal
+import os
+import sys
+import threading
+from collections import Counter
+
+# Profiling is disabled unless an admin token is configured
+ADMIN_TOKEN = os.environ.get("TDG_ADMIN_TOKEN")
+
+# Seconds between stack samples
+SAMPLE_INTERVAL = float(os.environ.get("TDG_PROFILE_SAMPLE_INTERVAL", 0.005))
+
+# Sample the generation threads continuously in the background
+CONTINUOUS_SAMPLING = os.environ.get("TDG_PROFILE_SAMPLING", "0") == "1"
+
+# Threads sampled by the continuous sampler, by name prefix
+SAMPLED_THREAD_PREFIXES = ("generate", "job")
+
+# Innermost frames of threads waiting for work; such samples are skipped
+IDLE_FRAMES = {"thread.py:_worker", "threading.py:wait"}
+
+PROFILE_MODES = {
+    # mode: (media type, file extension)
+    "cprofile": ("application/octet-stream", "pstats"),
+    "sample": ("text/plain", "collapsed"),
+}
+
+def is_admin(token: str) -> bool:
+    return bool(ADMIN_TOKEN) and bool(token) and hmac.compare_digest(token, ADMIN_TOKEN)
+
+def profile_mode(flag) -> str:
+    """Normalise a profile flag (true, "cprofile", "sample") to a mode, or None"""
+    if flag in (None, False, "", "0", "false"):
+        return None
+    if flag in (True, "1", "true"):
+        return "cprofile"
+    if flag in PROFILE_MODES:
+        return flag
+    raise ValueError(f"Unknown profile mode: {flag}")
+
+def profile_call(func) -> bytes:
+    """Run func under cProfile; returns the stats in pstats file format"""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        func()
+    finally:
+        profiler.disable()
+    profiler.create_stats()
+    return marshal.dumps(profiler.stats)
+
+def frame_stack(frame) -> str:
+    """Collapsed-stack line for a frame, outermost call first"""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+class StackSampler:
+    """Count the stacks of selected threads every interval seconds
+
+    Output is in collapsed-stack format ("a;b;c count" per line), which
+    flamegraph.pl, speedscope and inferno read directly.
+    """
+
+    def __init__(self, select, interval: float = SAMPLE_INTERVAL):
+        self.select = select
+        self.interval = interval
+        self.counts = Counter()
+        self.samples = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            stacks = [
+                frame_stack(frame)
+                for ident, frame in sys._current_frames().items()
+                if self.select(ident, names.get(ident, ""))
+            ]
+            stacks = [stack for stack in stacks if stack.rsplit(";", 1)[-1] not in IDLE_FRAMES]
+            with self._lock:
+                self.counts.update(stacks)
+                self.samples += 1
+
+    def collapsed(self, reset: bool = False) -> str:
+        with self._lock:
+            lines = [f"{stack} {count}" for stack, count in self.counts.most_common()]
+            if reset:
+                self.counts.clear()
+                self.samples = 0
+        return "\n".join(lines) + "\n"
+
+def sample_call(func, interval: float = SAMPLE_INTERVAL) -> bytes:
+    """Run func while sampling the calling thread; returns collapsed stacks"""
+    ident = threading.get_ident()
+    sampler = StackSampler(lambda thread_ident, name: thread_ident == ident, interval).start()
+    try:
+        func()
+    finally:
+        sampler.stop()
+    return sampler.collapsed().encode("utf-8")
+
+def run_profiled(mode: str, func) -> bytes:
+    return profile_call(func) if mode == "cprofile" else sample_call(func)
+
+continuous_sampler = None
+
+def start_continuous_sampling():
+    """Start the background sampler over generation threads, if enabled"""
+    global continuous_sampler
+    if CONTINUOUS_SAMPLING and continuous_sampler is None:
+        continuous_sampler = StackSampler(lambda ident, name: name.startswith(SAMPLED_THREAD_PREFIXES)).start()
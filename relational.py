@@ -0,0 +1,226 @@
+"""
+Test Data Generator - multi-table datasets with primary and foreign keys
+
+Tables are generated parents first, SHARD_ROWS rows at a time. Foreign keys
+are drawn from a compact array of the parent's key column (or computed, for
+serial keys), so no parent rows are kept or regenerated.
+"""
+
+import os
+import re
+import secrets
+from collections import namedtuple
+
+import numpy as np
+
+from batches import iter_batches, rebatch
+from generators import DATA_TYPES_BY_ID, SHARD_ROWS, compile_generator, shard_rng
+from unique import check_value_space
+
+# Upper bound on the rows of all tables in one dataset
+MAX_DATASET_ROWS = int(os.environ.get("TDG_MAX_DATASET_ROWS", 100000000))
+
+# Table and field names end up in file names and CSV headers
+NAME_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]{0,62}$")
+
+# Field type for 1, 2, 3, ... keys; not a DATA_TYPES generator
+SERIAL = "serial"
+
+# Seed substreams per table: one per field, plus one for per-parent row counts
+STREAMS_PER_TABLE = 1000
+COUNTS_STREAM = STREAMS_PER_TABLE - 1
+
+# kind: "serial", "generated" or "foreign"
+Column = namedtuple("Column", ["name", "kind", "plan", "prefix", "suffix", "unique", "table", "column"])
+Table = namedtuple("Table", ["name", "index", "count", "columns", "parent", "offsets"])
+
+class KeyColumn:
+    """The values of a referenced column, packed as fixed-width UTF-8 bytes"""
+
+    def __init__(self):
+        self.chunks = []
+        self.keys = None
+
+    def append(self, values: list):
+        if isinstance(values[0], int):
+            self.chunks.append(np.array(values, dtype=np.int64))
+        else:
+            self.chunks.append(np.array([v.encode("utf-8") for v in values]))
+
+    def seal(self):
+        self.keys = np.concatenate(self.chunks)
+        self.chunks = []
+
+    def take(self, indices: np.ndarray) -> list:
+        if self.keys.dtype.kind != "S":
+            return self.keys[indices].tolist()
+        return [key.decode("utf-8") for key in self.keys[indices].tolist()]
+
+def check_name(kind: str, name: str):
+    if not NAME_PATTERN.match(name):
+        raise ValueError(f"Invalid {kind} name '{name}': use letters, digits and underscores")
+
+def compile_dataset(tables: dict, seed: int = None) -> tuple:
+    """Validate table specs; returns Tables in generation order and the seed
+
+    Each spec has fields ({name: {type, options...} or {references: "table.field"}})
+    and either a count or per_parent ({table, min, max}) for "each parent has
+    min-max children". Row counts of per_parent tables are drawn here, so all
+    totals are known before generation starts.
+    """
+    if not tables:
+        raise ValueError("At least one table is required")
+    if seed is None:
+        seed = secrets.randbits(63)
+
+    names = list(tables)
+    for name in names:
+        check_name("table", name)
+    order = _generation_order(tables)
+
+    compiled = {}
+    total = 0
+    for name in order:
+        spec = tables[name]
+        index = names.index(name)
+        parent = spec.get("per_parent")
+        offsets = None
+        if parent:
+            parent_table = compiled.get(parent.get("table"))
+            if parent_table is None:
+                raise ValueError(f"Table '{name}': per_parent table '{parent.get('table')}' does not exist")
+            low, high = int(parent.get("min", 0)), int(parent.get("max", 1))
+            if not 0 <= low <= high:
+                raise ValueError(f"Table '{name}': per_parent needs 0 <= min <= max")
+            counts = shard_rng(seed, 0, index * STREAMS_PER_TABLE + COUNTS_STREAM).integers(
+                low, high + 1, size=parent_table.count, dtype=np.int64)
+            offsets = np.cumsum(counts)
+            count = int(offsets[-1]) if offsets.size else 0
+            parent = parent_table.name
+        else:
+            count = spec.get("count")
+            if count is None or int(count) < 0:
+                raise ValueError(f"Table '{name}' needs a count or per_parent")
+            count = int(count)
+
+        total += count
+        if total > MAX_DATASET_ROWS:
+            raise ValueError(f"Dataset exceeds {MAX_DATASET_ROWS} rows")
+        columns = [_compile_column(name, field, field_spec, compiled, tables, count)
+                   for field, field_spec in spec.get("fields", {}).items()]
+        if not columns:
+            raise ValueError(f"Table '{name}' needs at least one field")
+        if parent and not any(c.kind == "foreign" and c.table == parent for c in columns):
+            raise ValueError(f"Table '{name}' has per_parent '{parent}' but no field referencing it")
+        compiled[name] = Table(name, index, count, columns, parent, offsets)
+    return [compiled[name] for name in order], seed
+
+def _generation_order(tables: dict) -> list:
+    """Table names with every referenced table before the tables that use it"""
+    depends = {}
+    for name, spec in tables.items():
+        refs = {field["references"].split(".")[0] for field in spec.get("fields", {}).values() if field.get("references")}
+        if spec.get("per_parent"):
+            refs.add(spec["per_parent"].get("table"))
+        missing = refs - set(tables)
+        if missing:
+            raise ValueError(f"Table '{name}' references unknown table '{sorted(missing)[0]}'")
+        depends[name] = refs - {name}
+        if name in refs:
+            raise ValueError(f"Table '{name}' references itself")
+
+    order = []
+    while depends:
+        ready = [name for name, refs in depends.items() if refs <= set(order)]
+        if not ready:
+            raise ValueError(f"Tables reference each other in a cycle: {', '.join(sorted(depends))}")
+        order.extend(ready)
+        for name in ready:
+            del depends[name]
+    return order
+
+def _compile_column(table: str, name: str, spec: dict, compiled: dict, tables: dict, count: int) -> Column:
+    check_name("field", name)
+    references = spec.get("references")
+    if references:
+        ref_table, _, ref_column = references.partition(".")
+        ref_spec = tables[ref_table].get("fields", {}).get(ref_column)
+        if ref_spec is None:
+            raise ValueError(f"Field '{table}.{name}' references unknown field '{references}'")
+        if compiled[ref_table].count == 0:
+            raise ValueError(f"Field '{table}.{name}' references empty table '{ref_table}'")
+        return Column(name, "foreign", None, None, None, False, ref_table, ref_column)
+
+    type_id = spec.get("type")
+    if type_id == SERIAL:
+        return Column(name, "serial", None, None, None, True, None, None)
+    if type_id not in DATA_TYPES_BY_ID:
+        raise ValueError(f"Unknown type for field '{table}.{name}': {type_id}")
+    options = {k: v for k, v in spec.items() if k not in ("type", "prefix", "suffix", "unique", "references") and v is not None}
+    # For username, prefix is the generator's own option
+    if type_id == "username" and spec.get("prefix"):
+        options["prefix"] = spec["prefix"]
+    try:
+        plan = compile_generator(type_id, options)
+        if spec.get("unique"):
+            check_value_space(plan, count)
+    except ValueError as e:
+        raise ValueError(f"Field '{table}.{name}': {e}")
+    return Column(name, "generated", plan, spec.get("prefix"), spec.get("suffix"), bool(spec.get("unique")), None, None)
+
+def generate_dataset(tables: list, seed: int):
+    """Yield (table, names, columns) chunks of up to SHARD_ROWS rows, table by table"""
+    referenced = {(c.table, c.column) for table in tables for c in table.columns if c.kind == "foreign"}
+    keys = {}
+    row_counts = {table.name: table.count for table in tables}
+
+    for table in tables:
+        names = [c.name for c in table.columns]
+        sources = []
+        for field, column in enumerate(table.columns):
+            stream = table.index * STREAMS_PER_TABLE + field
+            if column.kind == "generated":
+                batches = iter_batches(column.plan, table.count, column.prefix, column.suffix, seed, stream, column.unique)
+                # Unique columns yield uneven batches; regroup so columns line up
+                sources.append(rebatch(batches, SHARD_ROWS) if column.unique else batches)
+            else:
+                sources.append(None)
+        stored = {c.name: KeyColumn() for c in table.columns if (table.name, c.name) in referenced and c.kind != "serial"}
+        if table.count == 0:
+            # One empty chunk, so writers still create the table with its columns
+            yield table.name, names, [[] for _ in names]
+            continue
+
+        for shard, start in enumerate(range(0, table.count, SHARD_ROWS)):
+            end = min(start + SHARD_ROWS, table.count)
+            rows = np.arange(start, end)
+            chunk = []
+            for field, (column, source) in enumerate(zip(table.columns, sources)):
+                if column.kind == "generated":
+                    values = next(source)
+                elif column.kind == "serial":
+                    values = (rows + 1).tolist()
+                else:
+                    if column.table == table.parent:
+                        # Rows are laid out parent by parent, per the drawn counts
+                        parents = np.searchsorted(table.offsets, rows, side="right")
+                    else:
+                        rng = shard_rng(seed, shard, table.index * STREAMS_PER_TABLE + field)
+                        parents = rng.integers(0, row_counts[column.table], size=end - start)
+                    values = _lookup(keys, column, parents)
+                chunk.append(values)
+                if column.name in stored:
+                    stored[column.name].append(values)
+            yield table.name, names, chunk
+
+        for name, key_column in stored.items():
+            key_column.seal()
+            keys[(table.name, name)] = key_column
+
+def _lookup(keys: dict, column: Column, parents: np.ndarray) -> list:
+    """Key values of the given parent rows"""
+    stored = keys.get((column.table, column.column))
+    if stored is not None:
+        return stored.take(parents)
+    # Serial keys are not stored: row i has key i + 1
+    return (parents + 1).tolist()
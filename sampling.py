@@ -0,0 +1,58 @@
+"""
+Test Data Generator - weighted sampling with Walker/Vose alias tables
+"""
+
+import random
+
+import numpy as np
+
+class AliasTable:
+    """O(1)-per-draw sampler for a fixed discrete distribution (Vose's method)
+
+    Building the table is O(n) once; each draw is one uniform index and one
+    biased coin flip, for single draws and for vectorized batches alike.
+    """
+
+    def __init__(self, weights):
+        weights = np.asarray(weights, dtype=np.float64)
+        if weights.ndim != 1 or weights.size == 0:
+            raise ValueError("weights must be a non-empty list")
+        if (weights < 0).any() or not np.isfinite(weights).all() or weights.sum() <= 0:
+            raise ValueError("weights must be finite, non-negative and not all zero")
+
+        n = weights.size
+        scaled = (weights * (n / weights.sum())).tolist()
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            prob[less] = scaled[less]
+            alias[less] = more
+            scaled[more] += scaled[less] - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Whatever is left has probability 1 up to rounding error
+
+        self.size = n
+        self._prob = prob
+        self._alias = alias
+        self.prob = np.array(prob)
+        self.alias = np.array(alias, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def draw(self, rng=random) -> int:
+        """One index drawn with a Python random.Random"""
+        i = rng.randrange(self.size)
+        return i if rng.random() < self._prob[i] else self._alias[i]
+
+    def sample(self, rng, n: int) -> np.ndarray:
+        """n indices drawn with a NumPy Generator"""
+        i = rng.integers(0, self.size, size=n)
+        return np.where(rng.random(n) < self.prob[i], i, self.alias[i])
+
+def zipf_weights(n: int, exponent: float = 1.0) -> np.ndarray:
+    """Weight 1/rank**exponent for ranks 1..n, for lists ordered most common first"""
+    return 1.0 / np.arange(1, n + 1, dtype=np.float64) ** exponent
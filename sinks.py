@@ -0,0 +1,273 @@
+"""
+Test Data Generator - database sinks for seeding tables straight from generation
+
+Chunks of (table, names, columns) go into a database without a JSON round trip:
+
+- SqliteSink: executemany in transactions of SINK_BATCH_ROWS rows
+- CopySink: a psql script of PostgreSQL COPY FROM STDIN blocks (text format),
+  written to any binary stream, e.g. a file for `psql -f`
+- PostgresSink: the same COPY data sent to a live server (needs psycopg)
+
+Tables are created if missing, with INTEGER/BIGINT columns for integer values
+and TEXT for the rest. No keys or indexes are declared: bulk loads are fastest
+into bare tables, and constraints can be added afterwards.
+"""
+
+import gzip
+import io
+import os
+import queue
+import sqlite3
+from contextlib import contextmanager
+
+# Rows per executemany transaction (SQLite) or COPY statement (PostgreSQL)
+SINK_BATCH_ROWS = int(os.environ.get("TDG_SINK_BATCH_ROWS", 50000))
+
+# Connections kept open per database
+SINK_POOL_SIZE = int(os.environ.get("TDG_SINK_POOL_SIZE", 2))
+
+# PostgreSQL server for output_format=postgres; disabled when unset
+POSTGRES_DSN = os.environ.get("TDG_POSTGRES_DSN")
+
+# Escapes for COPY text format: backslash, and the row and column delimiters
+COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+COPY_NULL = "\\N"
+
+class ConnectionPool:
+    """At most size connections to one database, opened on first use and reused"""
+
+    def __init__(self, connect, size: int = SINK_POOL_SIZE):
+        self.connect = connect
+        self._idle = queue.LifoQueue()
+        self._slots = queue.Queue()
+        for _ in range(size):
+            self._slots.put(None)
+
+    @contextmanager
+    def connection(self):
+        self._slots.get()
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = None
+        try:
+            if conn is None:
+                conn = self.connect()
+            yield conn
+        except BaseException:
+            # A connection in an unknown state is not handed out again
+            if conn is not None:
+                conn.close()
+            conn = None
+            raise
+        finally:
+            if conn is not None:
+                self._idle.put(conn)
+            self._slots.put(None)
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+_pools = {}
+
+def get_pool(key: str, connect) -> ConnectionPool:
+    """Shared pool for a database, created on first use"""
+    pool = _pools.get(key)
+    if pool is None:
+        pool = _pools.setdefault(key, ConnectionPool(connect))
+    return pool
+
+def close_pools():
+    for pool in _pools.values():
+        pool.close()
+    _pools.clear()
+
+def quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+def column_types(columns: list, integer_type: str) -> list:
+    return [integer_type if column and isinstance(column[0], int) else "TEXT" for column in columns]
+
+def create_table_sql(table: str, names: list, types: list) -> str:
+    definitions = ", ".join(f"{quote_identifier(name)} {type_}" for name, type_ in zip(names, types))
+    return f"CREATE TABLE IF NOT EXISTS {quote_identifier(table)} ({definitions})"
+
+def copy_sql(table: str, names: list) -> str:
+    return f"COPY {quote_identifier(table)} ({', '.join(quote_identifier(name) for name in names)}) FROM STDIN"
+
+def copy_rows(columns: list) -> str:
+    """Rows in COPY text format: tab-separated, backslash-escaped, \\N for NULL"""
+    escaped = [
+        [COPY_NULL if value is None else str(value).translate(COPY_ESCAPES) for value in column]
+        for column in columns
+    ]
+    return "".join(["\t".join(row) + "\n" for row in zip(*escaped)])
+
+class Sink:
+    """Buffers chunks per table and flushes every batch_rows rows
+
+    write() returns the bytes written for progress reporting (0 when the
+    destination is a database rather than a file).
+    """
+
+    integer_type = "INTEGER"
+
+    def __init__(self, batch_rows: int = SINK_BATCH_ROWS):
+        self.batch_rows = batch_rows
+        self.table = None
+        self.names = None
+        self.pending = []
+        self.pending_rows = 0
+        self.created = set()
+
+    def write(self, table: str, names: list, columns: list) -> int:
+        written = 0
+        if table != self.table:
+            written += self.flush()
+            self.table, self.names = table, names
+        if table not in self.created:
+            written += self.create(table, names, column_types(columns, self.integer_type))
+            self.created.add(table)
+        self.pending.append(columns)
+        self.pending_rows += len(columns[0]) if columns else 0
+        if self.pending_rows >= self.batch_rows:
+            written += self.flush()
+        return written
+
+    def flush(self) -> int:
+        if not self.pending_rows:
+            self.pending = []
+            return 0
+        chunks, self.pending, self.pending_rows = self.pending, [], 0
+        return self.load(self.table, self.names, chunks)
+
+    def close(self) -> int:
+        return self.flush()
+
+    def release(self):
+        """Free resources held by the sink, whether or not it was closed"""
+
+    def create(self, table: str, names: list, types: list) -> int:
+        raise NotImplementedError
+
+    def load(self, table: str, names: list, chunks: list) -> int:
+        raise NotImplementedError
+
+class SqliteSink(Sink):
+    """executemany into a SQLite database, one transaction per batch"""
+
+    def __init__(self, path: str, batch_rows: int = SINK_BATCH_ROWS, pooled: bool = True):
+        super().__init__(batch_rows)
+        connect = lambda: connect_sqlite(path)
+        # A database written once (e.g. a job's own file) gets a private pool closed with the sink
+        self.pool = get_pool(f"sqlite:{os.path.abspath(path)}", connect) if pooled else ConnectionPool(connect, 1)
+        self.pooled = pooled
+
+    def release(self):
+        if not self.pooled:
+            self.pool.close()
+
+    def create(self, table: str, names: list, types: list) -> int:
+        with self.pool.connection() as conn:
+            conn.execute(create_table_sql(table, names, types))
+            conn.commit()
+        return 0
+
+    def load(self, table: str, names: list, chunks: list) -> int:
+        sql = f"INSERT INTO {quote_identifier(table)} VALUES ({', '.join('?' * len(names))})"
+        with self.pool.connection() as conn:
+            with conn:
+                for columns in chunks:
+                    conn.executemany(sql, zip(*columns))
+        return 0
+
+def connect_sqlite(path: str):
+    conn = sqlite3.connect(path, check_same_thread=False)
+    # WAL with synchronous=NORMAL only fsyncs at checkpoints, and cannot corrupt the file
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+class CopySink(Sink):
+    """A psql script of COPY FROM STDIN blocks written to a binary stream
+
+    With a gzip level, each block is its own gzip member, so the output is one
+    valid .gz file whose size is known as it grows.
+    """
+
+    integer_type = "BIGINT"
+
+    def __init__(self, stream, batch_rows: int = SINK_BATCH_ROWS, gzip_level: int = None):
+        super().__init__(batch_rows)
+        self.stream = stream
+        self.gzip_level = gzip_level
+
+    def emit(self, text: str) -> int:
+        data = text.encode("utf-8")
+        if self.gzip_level is not None:
+            data = gzip.compress(data, self.gzip_level)
+        self.stream.write(data)
+        return len(data)
+
+    def create(self, table: str, names: list, types: list) -> int:
+        return self.emit(create_table_sql(table, names, types) + ";\n")
+
+    def load(self, table: str, names: list, chunks: list) -> int:
+        rows = "".join(copy_rows(columns) for columns in chunks)
+        return self.emit(f"{copy_sql(table, names)};\n{rows}\\.\n")
+
+class PostgresSink(Sink):
+    """COPY FROM STDIN into a live PostgreSQL server, one transaction per batch"""
+
+    integer_type = "BIGINT"
+
+    def __init__(self, dsn: str, batch_rows: int = SINK_BATCH_ROWS):
+        super().__init__(batch_rows)
+        self.pool = get_pool(f"postgres:{dsn}", lambda: connect_postgres(dsn))
+
+    def create(self, table: str, names: list, types: list) -> int:
+        with self.pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(create_table_sql(table, names, types))
+            conn.commit()
+        return 0
+
+    def load(self, table: str, names: list, chunks: list) -> int:
+        data = "".join(copy_rows(columns) for columns in chunks).encode("utf-8")
+        with self.pool.connection() as conn:
+            with conn.cursor() as cur:
+                if hasattr(cur, "copy"):
+                    with cur.copy(copy_sql(table, names)) as copy:
+                        copy.write(data)
+                else:
+                    cur.copy_expert(copy_sql(table, names), io.BytesIO(data))
+            conn.commit()
+        return 0
+
+def connect_postgres(dsn: str):
+    try:
+        import psycopg
+    except ImportError:
+        try:
+            import psycopg2 as psycopg
+        except ImportError:
+            raise RuntimeError("output_format=postgres needs psycopg or psycopg2 installed")
+    return psycopg.connect(dsn)
+
+def seed(chunks, sink: Sink, progress=None):
+    """Write (table, names, columns) chunks to a sink
+
+    progress(table, rows, nbytes) is called after each chunk; rows are counted
+    when buffered, so a failed batch may have reported rows it did not load.
+    """
+    for table, names, columns in chunks:
+        nbytes = sink.write(table, names, columns)
+        if progress:
+            progress(table, len(columns[0]) if columns else 0, nbytes)
+    nbytes = sink.close()
+    if progress and nbytes:
+        progress(sink.table, 0, nbytes)
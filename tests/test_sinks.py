@@ -0,0 +1,89 @@
+"""
+sinks.seed into SQLite: row counts, foreign keys and per_parent offsets of a relational dataset
+"""
+
+import io
+import sqlite3
+
+import numpy as np
+
+import relational
+import sinks
+
+SCHEMA = {
+    "users": {"count": 25000, "fields": {
+        "id": {"type": "serial"},
+        "name": {"type": "name"},
+    }},
+    "accounts": {"count": 3000, "fields": {
+        "id": {"type": "uuid", "unique": True},
+        "user_id": {"references": "users.id"},
+    }},
+    "orders": {"per_parent": {"table": "users", "min": 0, "max": 3}, "fields": {
+        "id": {"type": "serial"},
+        "user_id": {"references": "users.id"},
+        "account_id": {"references": "accounts.id"},
+    }},
+}
+
+def seed_sqlite(path, batch_rows: int = 7000) -> tuple:
+    tables, seed = relational.compile_dataset(SCHEMA, seed=42)
+    sink = sinks.SqliteSink(str(path), batch_rows=batch_rows, pooled=False)
+    reported = {}
+    try:
+        sinks.seed(relational.generate_dataset(tables, seed), sink,
+                   progress=lambda table, rows, nbytes: reported.update({table: reported.get(table, 0) + rows}))
+    finally:
+        sink.release()
+    return {table.name: table for table in tables}, reported
+
+def test_seed_sqlite_row_counts(tmp_path):
+    tables, reported = seed_sqlite(tmp_path / "test.db")
+    conn = sqlite3.connect(tmp_path / "test.db")
+    try:
+        for name, table in tables.items():
+            assert conn.execute(f"SELECT COUNT(*) FROM {name}").fetchone()[0] == table.count
+            assert reported[name] == table.count
+        assert conn.execute("SELECT COUNT(DISTINCT id) FROM accounts").fetchone()[0] == tables["accounts"].count
+        assert conn.execute("SELECT MIN(id), MAX(id) FROM orders").fetchone() == (1, tables["orders"].count)
+    finally:
+        conn.close()
+
+def test_seed_sqlite_foreign_keys(tmp_path):
+    tables, _ = seed_sqlite(tmp_path / "test.db")
+    conn = sqlite3.connect(tmp_path / "test.db")
+    try:
+        for child, column, parent in [("accounts", "user_id", "users"), ("orders", "user_id", "users"),
+                                      ("orders", "account_id", "accounts")]:
+            orphans = conn.execute(
+                f"SELECT COUNT(*) FROM {child} LEFT JOIN {parent} ON {child}.{column} = {parent}.id "
+                f"WHERE {parent}.id IS NULL"
+            ).fetchone()[0]
+            assert orphans == 0, f"{child}.{column}"
+
+        # per_parent: user i has offsets[i] - offsets[i - 1] orders, laid out user by user
+        counts = np.diff(tables["orders"].offsets, prepend=0)
+        per_user = dict(conn.execute("SELECT user_id, COUNT(*) FROM orders GROUP BY user_id"))
+        assert [per_user.get(user, 0) for user in range(1, tables["users"].count + 1)] == counts.tolist()
+        user_ids = [row[0] for row in conn.execute("SELECT user_id FROM orders ORDER BY rowid")]
+        assert user_ids == sorted(user_ids)
+    finally:
+        conn.close()
+
+def test_seed_is_reproducible_across_batch_sizes(tmp_path):
+    seed_sqlite(tmp_path / "a.db", batch_rows=7000)
+    seed_sqlite(tmp_path / "b.db", batch_rows=50000)
+    a, b = sqlite3.connect(tmp_path / "a.db"), sqlite3.connect(tmp_path / "b.db")
+    try:
+        for name in SCHEMA:
+            assert a.execute(f"SELECT * FROM {name}").fetchall() == b.execute(f"SELECT * FROM {name}").fetchall()
+    finally:
+        a.close()
+        b.close()
+
+def test_copy_sink_escapes_text():
+    stream = io.BytesIO()
+    sinks.seed([("notes", ["id", "body"], [[1, 2], ["tab\there", None]])], sinks.CopySink(stream))
+    script = stream.getvalue().decode("utf-8")
+    assert 'CREATE TABLE IF NOT EXISTS "notes" ("id" BIGINT, "body" TEXT);' in script
+    assert 'COPY "notes" ("id", "body") FROM STDIN;\n1\ttab\\there\n2\t\\N\n\\.\n' in script
@@ -0,0 +1,31 @@
+"""
+Startup: cli.py stays off the web stack; the wall-clock budgets of
+benchmarks/check_startup.py run only with TDG_CHECK_STARTUP=1
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+WEB_PACKAGES = ("fastapi", "starlette", "pydantic", "uvicorn")
+
+def test_cli_does_not_import_web_stack():
+    result = subprocess.run(
+        [sys.executable, "-c", "import json, sys, cli; print(json.dumps(sorted(sys.modules)))"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    modules = json.loads(result.stdout)
+    assert [name for name in modules if name.split(".")[0] in WEB_PACKAGES] == []
+
+@pytest.mark.skipif(os.environ.get("TDG_CHECK_STARTUP") != "1", reason="wall-clock budgets; set TDG_CHECK_STARTUP=1")
+def test_startup_within_budget():
+    result = subprocess.run(
+        [sys.executable, os.path.join(ROOT, "benchmarks", "check_startup.py"), "--runs", "3"],
+        cwd=ROOT, capture_output=True, text=True, timeout=300,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
@@ -0,0 +1,80 @@
+"""
+Test Data Generator - distinct-value generation with a compact hash set
+"""
+
+from hashlib import blake2b
+
+import numpy as np
+
+from generators import SHARD_ROWS, GeneratorPlan, generate_shard, value_space
+
+# Consecutive candidate shards that may add no new value before giving up
+MAX_STALLED_SHARDS = 20
+
+def stable_hashes(values: list) -> np.ndarray:
+    """64-bit blake2b of each value's UTF-8 text, independent of PYTHONHASHSEED"""
+    digests = b"".join([blake2b(str(value).encode("utf-8"), digest_size=8).digest() for value in values])
+    return np.frombuffer(digests, dtype="<i8")
+
+class CompactHashSet:
+    """Set of 64-bit string hashes stored as sorted NumPy runs, 8 bytes per member
+
+    Runs are merged like a log-structured merge tree, so there are O(log n) of
+    them and each lookup is a binary search per run. Two different strings
+    with the same hash only cause the second to be rejected, so the values
+    accepted are always distinct. Hashes are blake2b rather than the salted
+    built-in hash(), so seeded unique output is the same in every process.
+    """
+    
+    def __init__(self):
+        self.runs = []
+    
+    def __len__(self):
+        return sum(run.size for run in self.runs)
+    
+    def add_new(self, values: list):
+        """Add values not seen before; returns a mask of the ones that were new"""
+        hashes = stable_hashes(values)
+        mask = np.zeros(hashes.size, dtype=bool)
+        # First occurrence of each hash within the batch
+        mask[np.unique(hashes, return_index=True)[1]] = True
+        for run in self.runs:
+            pos = np.minimum(np.searchsorted(run, hashes), run.size - 1)
+            mask &= run[pos] != hashes
+        
+        run = np.sort(hashes[mask])
+        while self.runs and self.runs[-1].size <= run.size:
+            run = np.sort(np.concatenate([self.runs.pop(), run]), kind="mergesort")
+        if run.size:
+            self.runs.append(run)
+        return mask
+
+def check_value_space(plan: GeneratorPlan, count: int):
+    """Fail fast when a plan cannot produce count distinct values"""
+    space = value_space(plan)
+    if space is not None and space < count:
+        raise ValueError(f"Only {space} distinct {plan.type_id} values exist for these options, cannot generate {count} unique values")
+
+def iter_candidates(plan: GeneratorPlan, seed: int = None, stream: int = 0):
+    """Endless full shards of candidate values"""
+    shard = 0
+    while True:
+        yield generate_shard(plan, shard, (shard + 1) * SHARD_ROWS, seed, stream)
+        shard += 1
+
+def take_unique(batches, count: int):
+    """Yield batches holding only values not seen before, until count have been yielded"""
+    seen = CompactHashSet()
+    remaining = count
+    stalled = 0
+    for batch in batches:
+        if remaining <= 0:
+            return
+        mask = seen.add_new(batch)
+        fresh = [value for value, new in zip(batch, mask.tolist()) if new][:remaining]
+        stalled = 0 if fresh else stalled + 1
+        if stalled >= MAX_STALLED_SHARDS:
+            raise ValueError(f"Could only generate {count - remaining} unique values")
+        remaining -= len(fresh)
+        if fresh:
+            yield fresh